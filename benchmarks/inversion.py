@@ -0,0 +1,50 @@
+"""
+Compares the native inversion algorithms with the galois backend.
+
+Usage: python -m benchmarks.inversion
+"""
+
+import random
+import timeit
+
+from src.config import Config
+from src.core.fields import NIST_MODULI, field_registry
+from src.core.fields.inversion import INVERSION_METHODS, invert
+
+REPEAT = 5
+NUMBER = 20
+
+
+def bench_inversion(m: int) -> dict[str, float]:
+    """
+    Times a single-element inversion in GF(2^m) with every method.
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        dict[str, float]: The best time per inversion in microseconds, per method.
+    """
+    rng = random.Random(Config.Testing.RANDOM.SEED)
+    a = rng.getrandbits(m) | 1
+    gf = field_registry.get(m, NIST_MODULI.get(m))
+    native = field_registry.native(m, NIST_MODULI.get(m))
+
+    methods = {"galois": lambda: int(gf(1) / gf(a))}
+    for method in INVERSION_METHODS:
+        methods[method] = lambda method=method: invert(native, a, method)
+
+    expected = methods["galois"]()
+    assert all(fn() == expected for fn in methods.values())
+    return {
+        name: min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+        for name, fn in methods.items()
+    }
+
+
+if __name__ == "__main__":
+    names = ["galois", *INVERSION_METHODS]
+    print(f"{'m':>5}" + "".join(f"{name + ' (us)':>18}" for name in names))
+    for m in [8, *NIST_MODULI]:
+        times = bench_inversion(m)
+        print(f"{m:>5}" + "".join(f"{times[name]:>18.2f}" for name in names))
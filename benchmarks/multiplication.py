@@ -0,0 +1,52 @@
+"""
+Compares the native-integer multiplication backend with the galois backend.
+
+Usage: python -m benchmarks.multiplication
+"""
+
+import random
+import timeit
+
+from src.config import Config
+from src.core.fields import NIST_MODULI, field_registry
+
+REPEAT = 5
+NUMBER = 200
+
+
+def bench_multiplication(m: int) -> dict[str, float]:
+    """
+    Times a single-element multiplication in GF(2^m) on both backends.
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        dict[str, float]: The best time per multiplication in microseconds, per backend.
+    """
+    rng = random.Random(Config.Testing.RANDOM.SEED)
+    a, b = rng.getrandbits(m), rng.getrandbits(m)
+    gf = field_registry.get(m, NIST_MODULI.get(m))
+    native = field_registry.native(m, NIST_MODULI.get(m))
+
+    def run_galois() -> int:
+        return int(gf(a) * gf(b))
+
+    def run_native() -> int:
+        return native.mul(a, b)
+
+    assert run_galois() == run_native()
+    return {
+        name: min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+        for name, fn in (("galois", run_galois), ("native", run_native))
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'m':>5} {'galois (us)':>12} {'native (us)':>12} {'speedup':>8}")
+    for m in [8, *NIST_MODULI]:
+        times = bench_multiplication(m)
+        speedup = times["galois"] / times["native"]
+        print(
+            f"{m:>5} {times['galois']:>12.2f} {times['native']:>12.2f} {speedup:>7.1f}x"
+        )
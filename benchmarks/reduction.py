@@ -0,0 +1,69 @@
+"""
+Compares the table/sparse reducer with the bit-by-bit reduction loop.
+
+Usage: python -m benchmarks.reduction
+"""
+
+import random
+import timeit
+
+from src.config import Config
+from src.core.fields import NIST_MODULI
+from src.core.fields.reduction import Reducer
+
+REPEAT = 5
+NUMBER = 200
+
+
+def reduce_bitwise(value: int, modulus: int) -> int:
+    """
+    Reduces `value` one leading bit at a time, as `modReduction` used to.
+
+    Args:
+        value (int): The dividend.
+        modulus (int): The divisor.
+
+    Returns:
+        int: The remainder.
+    """
+    degree = modulus.bit_length() - 1
+    while value.bit_length() - 1 >= degree:
+        value ^= modulus << (value.bit_length() - 1 - degree)
+    return value
+
+
+def bench_reduction(modulus: int) -> dict[str, float]:
+    """
+    Times the reduction of a double-width product by `modulus`.
+
+    Args:
+        modulus (int): The divisor.
+
+    Returns:
+        dict[str, float]: The best time per reduction in microseconds, per method.
+    """
+    rng = random.Random(Config.Testing.RANDOM.SEED)
+    value = rng.getrandbits(2 * (modulus.bit_length() - 1))
+    reducer = Reducer(modulus)
+    assert reducer.reduce(value) == reduce_bitwise(value, modulus)
+    methods = {
+        "bitwise": lambda: reduce_bitwise(value, modulus),
+        "reducer": lambda: reducer.reduce(value),
+    }
+    return {
+        name: min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+        for name, fn in methods.items()
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'modulus':>14} {'bitwise (us)':>13} {'reducer (us)':>13} {'speedup':>8}")
+    moduli = {f"NIST-{m}": poly for m, poly in NIST_MODULI.items()}
+    moduli["dense-571"] = (1 << 572) - 1
+    for name, modulus in moduli.items():
+        times = bench_reduction(modulus)
+        speedup = times["bitwise"] / times["reducer"]
+        print(
+            f"{name:>14} {times['bitwise']:>13.2f} {times['reducer']:>13.2f}"
+            f" {speedup:>7.1f}x"
+        )
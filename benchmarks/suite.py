@@ -0,0 +1,383 @@
+"""
+Benchmarks every service and endpoint across field sizes, input formats and
+batch sizes, and writes the results as JSON so releases can be compared.
+
+Each case is timed twice: as a direct call to the service function and as an
+in-process HTTP request through `TestClient`, which adds request validation,
+the executor and response formatting on top of the arithmetic.
+
+Usage: python cli.py bench [--output results.json] [--baseline old.json]
+"""
+
+import json
+import platform
+import random
+import time
+import timeit
+from importlib import metadata
+from typing import Any, Callable, Optional
+
+from src.config import Config
+from src.core.codec import encode
+from src.core.fields import preload_fields
+from src.core.services.addition import add
+from src.core.services.batch import BATCH_OPERATIONS, batch_operation
+from src.core.services.division import divide
+from src.core.services.evaluate import evaluate
+from src.core.services.inverse import inverse, inverse_batch
+from src.core.services.mod_reduction import modReduction
+from src.core.services.multiplication import multiplication
+from src.core.services.power import power
+from src.core.services.square import square
+from src.core.services.stream import STREAM_OPERATIONS, stream_chunk
+from src.core.services.subtraction import subtraction
+
+FIELD_SIZES = (8, 163, 233, 283, 409, 571)
+INPUT_TYPES = ("binary", "hexadecimal")
+BATCH_SIZES = (1, 16, 256)
+REPEAT = 3
+NUMBER = 10
+
+SERVICES: dict[str, Callable[..., Any]] = {
+    "addition": add,
+    "subtraction": subtraction,
+    "multiplication": multiplication,
+    "division": divide,
+    "mod-reduction": modReduction,
+}
+
+EXPRESSION = "(a*b + c) / d"
+
+PACKAGES = ("fastapi", "galois", "numpy", "numba", "pydantic")
+
+
+def _operands(operation: str, m: int, size: int, rng: random.Random) -> list[int]:
+    # Non-zero divisors and, for mod-reduction, a divisor of about half the degree
+    if operation == "mod-reduction":
+        degree = max(m // 2, 1)
+        return [1 << degree | rng.getrandbits(degree) for _ in range(size)]
+    return [rng.getrandbits(m) or 1 for _ in range(size)]
+
+
+def _time(fn: Callable[[], Any], repeat: int, number: int) -> dict[str, float]:
+    times = [t / number * 1e6 for t in timeit.repeat(fn, repeat=repeat, number=number)]
+    return {"best_us": min(times), "mean_us": sum(times) / len(times)}
+
+
+def _cases(
+    m: int, input_type: str, batch_sizes: tuple[int, ...], rng: random.Random
+) -> list[dict[str, Any]]:
+    # Every case holds the service call and the equivalent HTTP request
+    cases: list[dict[str, Any]] = []
+    for operation, service in SERVICES.items():
+        a = encode(rng.getrandbits(m), input_type, m)
+        b = encode(_operands(operation, m, 1, rng)[0], input_type, m)
+        cases.append(
+            {
+                "operation": operation,
+                "batch_size": None,
+                "service": lambda s=service, a=a, b=b: s(a, b, input_type, m),
+                "path": f"/operations/{operation}",
+                "body": {
+                    "poly1": a,
+                    "poly2": b,
+                    "input_type": input_type,
+                    "output_type": input_type,
+                    "m": m,
+                },
+            }
+        )
+
+    for operation, unary in (("inverse", inverse), ("square", square)):
+        a = encode(rng.getrandbits(m) or 1, input_type, m)
+        cases.append(
+            {
+                "operation": operation,
+                "batch_size": None,
+                "service": lambda s=unary, a=a: s(a, input_type, m),
+                "path": f"/operations/{operation}",
+                "body": {
+                    "poly": a,
+                    "input_type": input_type,
+                    "output_type": input_type,
+                    "m": m,
+                },
+            }
+        )
+
+    a = encode(rng.getrandbits(m) or 1, input_type, m)
+    exponent = rng.getrandbits(m)
+    cases.append(
+        {
+            "operation": "power",
+            "batch_size": None,
+            "service": lambda a=a: power(a, exponent, input_type, m),
+            "path": "/operations/power",
+            "body": {
+                "poly": a,
+                "exponent": exponent,
+                "input_type": input_type,
+                "output_type": input_type,
+                "m": m,
+            },
+        }
+    )
+
+    for size in batch_sizes:
+        for operation in BATCH_OPERATIONS:
+            poly1 = [encode(rng.getrandbits(m), input_type, m) for _ in range(size)]
+            poly2 = [
+                encode(value, input_type, m)
+                for value in _operands(operation, m, size, rng)
+            ]
+            cases.append(
+                {
+                    "operation": f"batch-{operation}",
+                    "batch_size": size,
+                    "service": lambda op=operation, p1=poly1, p2=poly2: batch_operation(
+                        op, p1, p2, input_type, m
+                    ),
+                    "path": f"/operations/batch/{operation}",
+                    "body": {
+                        "poly1": poly1,
+                        "poly2": poly2,
+                        "input_type": input_type,
+                        "output_type": input_type,
+                        "m": m,
+                    },
+                }
+            )
+
+        polys = [encode(rng.getrandbits(m) or 1, input_type, m) for _ in range(size)]
+        cases.append(
+            {
+                "operation": "batch-inverse",
+                "batch_size": size,
+                "service": lambda p=polys: inverse_batch(p, input_type, m),
+                "path": "/operations/batch/inverse",
+                "body": {
+                    "poly": polys,
+                    "input_type": input_type,
+                    "output_type": input_type,
+                    "m": m,
+                },
+            }
+        )
+
+        bindings = [
+            {name: encode(rng.getrandbits(m) or 1, input_type, m) for name in "abcd"}
+            for _ in range(size)
+        ]
+        cases.append(
+            {
+                "operation": "evaluate",
+                "batch_size": size,
+                "service": lambda b=bindings: evaluate(EXPRESSION, b, input_type, m),
+                "path": "/operations/evaluate",
+                "body": {
+                    "expression": EXPRESSION,
+                    "bindings": bindings,
+                    "input_type": input_type,
+                    "output_type": input_type,
+                    "m": m,
+                },
+            }
+        )
+
+        # One line per operation, cycling through every streamable operation
+        lines = []
+        for i in range(size):
+            operation = STREAM_OPERATIONS[i % len(STREAM_OPERATIONS)]
+            if operation == "inverse":
+                item = {"poly": encode(rng.getrandbits(m) or 1, input_type, m)}
+            else:
+                item = {
+                    "poly1": encode(rng.getrandbits(m), input_type, m),
+                    "poly2": encode(_operands(operation, m, 1, rng)[0], input_type, m),
+                }
+            lines.append(json.dumps({"operation": operation, **item}).encode())
+        cases.append(
+            {
+                "operation": "stream",
+                "batch_size": size,
+                "service": lambda ls=lines: stream_chunk(ls, input_type, m),
+                "path": "/operations/stream",
+                "params": {"m": m, "input_type": input_type, "output_type": input_type},
+                "content": b"\n".join(lines),
+            }
+        )
+    return cases
+
+
+def metadata_info() -> dict[str, Any]:
+    """
+    Describes the environment the benchmarks ran in.
+
+    Returns:
+        dict[str, Any]: The application, Python and package versions and the
+        configured field backends.
+    """
+    packages: dict[str, Optional[str]] = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            packages[package] = None
+    return {
+        "version": Config.APP.VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": packages,
+        "backend": Config.FIELDS.BACKEND,
+        "inversion": Config.FIELDS.INVERSION,
+        "executor": Config.EXECUTOR.MODE,
+    }
+
+
+def run_suite(
+    field_sizes: tuple[int, ...] = FIELD_SIZES,
+    input_types: tuple[str, ...] = INPUT_TYPES,
+    batch_sizes: tuple[int, ...] = BATCH_SIZES,
+    repeat: int = REPEAT,
+    number: int = NUMBER,
+    http: bool = True,
+) -> dict[str, Any]:
+    """
+    Times every service and endpoint for every combination of the parameters.
+
+    Args:
+        field_sizes (tuple[int, ...], optional): The degrees `m` to sweep.
+        input_types (tuple[str, ...], optional): The input formats to sweep.
+        batch_sizes (tuple[int, ...], optional): The batch sizes of the batch operations.
+        repeat (int, optional): The number of timing rounds per case.
+        number (int, optional): The number of calls per round.
+        http (bool, optional): Whether to also time the HTTP endpoints.
+
+    Returns:
+        dict[str, Any]: The environment metadata and one result per case with the
+        best and mean time per call in microseconds.
+    """
+    from fastapi.testclient import TestClient
+
+    from src.main import app
+
+    # Build the preloaded fields here rather than in the client's event loop thread
+    preload_fields()
+    results: list[dict[str, Any]] = []
+    with TestClient(app) as client:
+        for m in field_sizes:
+            for input_type in input_types:
+                rng = random.Random(f"{Config.Testing.RANDOM.SEED}-{m}-{input_type}")
+                for case in _cases(m, input_type, batch_sizes, rng):
+                    key = {
+                        "operation": case["operation"],
+                        "m": m,
+                        "input_type": input_type,
+                        "batch_size": case["batch_size"],
+                    }
+                    # One untimed call builds the field and compiles its kernels
+                    case["service"]()
+                    results.append(
+                        {
+                            **key,
+                            "target": "service",
+                            **_time(case["service"], repeat, number),
+                        }
+                    )
+                    if not http:
+                        continue
+
+                    def request(case: dict[str, Any] = case) -> None:
+                        # The stream endpoint reads NDJSON and its parameters from the query
+                        response = client.post(
+                            case["path"],
+                            json=case.get("body"),
+                            params=case.get("params"),
+                            content=case.get("content"),
+                        )
+                        if response.status_code != 200:
+                            raise RuntimeError(
+                                f"{case['path']} failed: {response.json()['message']}"
+                            )
+
+                    request()
+                    results.append(
+                        {**key, "target": "http", **_time(request, repeat, number)}
+                    )
+    return {"metadata": metadata_info(), "results": results}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Matches the cases of two benchmark runs and computes their slowdown.
+
+    Args:
+        baseline (dict[str, Any]): The results of an earlier `run_suite`.
+        current (dict[str, Any]): The results of a later `run_suite`.
+
+    Returns:
+        list[dict[str, Any]]: One entry per case present in both runs with both
+        best times and the ratio `current / baseline`, slowest first.
+    """
+    fields = ("target", "operation", "m", "input_type", "batch_size")
+    old = {tuple(r[f] for f in fields): r["best_us"] for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = tuple(result[f] for f in fields)
+        if key in old:
+            rows.append(
+                {
+                    **dict(zip(fields, key)),
+                    "baseline_us": old[key],
+                    "current_us": result["best_us"],
+                    "ratio": result["best_us"] / old[key],
+                }
+            )
+    return sorted(rows, key=lambda row: row["ratio"], reverse=True)
+
+
+def main(
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    repeat: int = REPEAT,
+    number: int = NUMBER,
+) -> None:
+    """
+    Runs the suite, prints a summary and optionally writes and compares results.
+
+    Args:
+        output (str, optional): The JSON file to write the results to.
+        baseline (str, optional): A JSON file of earlier results to compare against.
+        repeat (int, optional): The number of timing rounds per case.
+        number (int, optional): The number of calls per round.
+    """
+    report = run_suite(repeat=repeat, number=number)
+    print(
+        f"{'target':>8} {'operation':>22} {'m':>4} {'input':>12} {'batch':>6} {'best (us)':>12}"
+    )
+    for r in report["results"]:
+        print(
+            f"{r['target']:>8} {r['operation']:>22} {r['m']:>4} {r['input_type']:>12} "
+            f"{r['batch_size'] or '-':>6} {r['best_us']:>12.2f}"
+        )
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written to {output}")
+
+    if baseline:
+        with open(baseline) as file:
+            rows = compare(json.load(file), report)
+        print(f"\nSlowest changes against {baseline}:")
+        for row in rows[:20]:
+            print(
+                f"{row['target']:>8} {row['operation']:>22} {row['m']:>4} "
+                f"{row['input_type']:>12} {row['batch_size'] or '-':>6} "
+                f"{row['ratio']:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
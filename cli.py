@@ -1,4 +1,7 @@
+import importlib.util
+import multiprocessing
 import os
+import socket
 import subprocess
 
 from tap import Tap
@@ -10,6 +13,13 @@ class ArgumentParser(Tap):
     command: str
     tests: bool = True
     fixtures: bool = False
+    workers: int = 0
+    host: str = "127.0.0.1"
+    port: int = 8000
+    output: str = ""
+    baseline: str = ""
+    repeat: int = 3
+    number: int = 10
 
     def configure(self) -> None:
         self.add_argument("command", type=str, help="Command to run")
@@ -27,6 +37,64 @@ def run() -> None:
     subprocess.run(["./.venv/Scripts/uvicorn", "src.main:app", "--reload"])
 
 
+def _server_options() -> dict[str, str]:
+    """
+    Picks the fastest event loop and HTTP parser that are installed.
+    """
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
+
+
+def _serve_worker(host: str, port: int) -> None:
+    """
+    Runs one server process on its own SO_REUSEPORT socket; the kernel
+    balances incoming connections between the workers.
+    """
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    config = uvicorn.Config("src.main:app", **_server_options())  # type: ignore[arg-type]
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(workers: int = 0, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """
+    command: serve
+    Run the backend server for production with one process per worker
+    (--workers, defaults to the CPU count) on --host and --port.
+    Every worker preloads its fields before accepting traffic.
+    """
+    workers = workers or os.cpu_count() or 1
+    options = _server_options()
+    print(f"Starting {workers} workers on {host}:{port} ({options})")
+
+    if not hasattr(socket, "SO_REUSEPORT"):
+        import uvicorn
+
+        uvicorn.run("src.main:app", host=host, port=port, workers=workers, **options)  # type: ignore[arg-type]
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_serve_worker, args=(host, port)) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
 def clean(files: list[str] = ["src", "tests", "cli.py"]) -> None:
     """
     command: clean
@@ -171,6 +239,25 @@ def run_tests() -> None:
 #                     print(f"Deleted {file}")
 
 
+def bench(
+    output: str = "", baseline: str = "", repeat: int = 3, number: int = 10
+) -> None:
+    """
+    command: bench
+    Benchmark every service and endpoint across field sizes, input formats
+    and batch sizes. Writes JSON results to --output and compares them
+    with an earlier --baseline file.
+    """
+    from benchmarks.suite import main
+
+    main(
+        output=output or None,
+        baseline=baseline or None,
+        repeat=repeat,
+        number=number,
+    )
+
+
 def pre_stage() -> None:
     """
     command: pre-stage
@@ -221,6 +308,8 @@ def help() -> None:
         clean()
     elif args.command == "run":
         run()
+    elif args.command == "serve":
+        serve(workers=args.workers, host=args.host, port=args.port)
     elif args.command == "generate-test-files":
         generate_test_files(
             tests=args.tests,
@@ -230,6 +319,13 @@ def help() -> None:
         import_fixtures()
     elif args.command == "run-tests":
         run_tests()
+    elif args.command == "bench":
+        bench(
+            output=args.output,
+            baseline=args.baseline,
+            repeat=args.repeat,
+            number=args.number,
+        )
     elif args.command == "pre-stage":
         pre_stage()
     # elif args.command == "clean-unused-files":
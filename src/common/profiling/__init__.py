@@ -0,0 +1,11 @@
+from .metrics import Histogram, MetricsRegistry, Span, metrics, span
+from .middleware import ProfilingMiddleware
+
+__all__ = [
+    "Histogram",
+    "MetricsRegistry",
+    "ProfilingMiddleware",
+    "Span",
+    "metrics",
+    "span",
+]
@@ -0,0 +1,235 @@
+import threading
+import time
+from bisect import bisect_left
+from types import TracebackType
+from typing import Optional, Union
+
+from src.config import Config
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """
+    A Prometheus histogram family with fixed buckets.
+
+    Attributes:
+        name (str): The metric name.
+        help (str): The description of the metric.
+        labelnames (tuple[str, ...]): The names of the labels of every series.
+        buckets (tuple[float, ...]): The upper bounds of the buckets, in seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = Config.METRICS.BUCKETS,
+    ) -> None:
+        """
+        Initialize an empty histogram family.
+
+        Args:
+            name (str): The metric name.
+            help (str): The description of the metric.
+            labelnames (tuple[str, ...]): The names of the labels of every series.
+            buckets (tuple[float, ...], optional): The sorted bucket upper bounds.
+                Defaults to `Config.METRICS.BUCKETS`.
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # Per label values: the count of every bucket, then the +Inf bucket, and the sum
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Records one observation.
+
+        Args:
+            value (float): The observed duration, in seconds.
+            *labels (str): The label values, in the order of `labelnames`.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def samples(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        """
+        Returns a snapshot of every series.
+
+        Returns:
+            dict[tuple[str, ...], tuple[list[int], float]]: The cumulative bucket
+            counts, ending with the total count, and the sum of every series.
+        """
+        with self._lock:
+            series = {
+                labels: (list(counts), total[0])
+                for labels, (counts, total) in self._series.items()
+            }
+        snapshot = {}
+        for labels, (counts, total) in series.items():
+            for i in range(1, len(counts)):
+                counts[i] += counts[i - 1]
+            snapshot[labels] = (counts, total)
+        return snapshot
+
+    def render(self) -> str:
+        """
+        Formats the histogram in the Prometheus text exposition format.
+
+        Returns:
+            str: The `HELP` and `TYPE` lines followed by the bucket, sum and count
+            samples of every series.
+        """
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bounds = [repr(bucket) for bucket in self.buckets] + ["+Inf"]
+        for labels, (counts, total) in sorted(self.samples().items()):
+            pairs = [
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.labelnames, labels)
+            ]
+            for bound, count in zip(bounds, counts):
+                le = ",".join([*pairs, f'le="{bound}"'])
+                lines.append(f"{self.name}_bucket{{{le}}} {count}")
+            suffix = "{" + ",".join(pairs) + "}" if pairs else ""
+            lines.append(f"{self.name}_sum{suffix} {total!r}")
+            lines.append(f"{self.name}_count{suffix} {counts[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """
+        Drops every series.
+        """
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """
+    The histograms exposed by the metrics endpoint.
+
+    Attributes:
+        enabled (bool): Whether requests and spans are recorded at all.
+        requests (Histogram): The duration of every request by method, route and status.
+        stages (Histogram): The duration of every span by stage.
+    """
+
+    def __init__(self, enabled: bool = Config.METRICS.ENABLED) -> None:
+        """
+        Initialize the registry with empty histograms.
+
+        Args:
+            enabled (bool, optional): Whether durations are recorded. Defaults to
+                `Config.METRICS.ENABLED`.
+        """
+        self.enabled = enabled
+        self.requests = Histogram(
+            "gf_request_duration_seconds",
+            "Time spent handling a request, including streamed bodies.",
+            ("method", "route", "status"),
+        )
+        self.stages = Histogram(
+            "gf_stage_duration_seconds",
+            "Time spent in each stage of request handling.",
+            ("stage",),
+        )
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Records a stage duration measured by the caller.
+
+        Args:
+            stage (str): The stage name.
+            seconds (float): The duration.
+        """
+        if self.enabled:
+            self.stages.observe(seconds, stage)
+
+    def render(self) -> str:
+        """
+        Formats every histogram in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics page.
+        """
+        return self.requests.render() + self.stages.render()
+
+    def clear(self) -> None:
+        """
+        Drops every recorded observation.
+        """
+        self.requests.clear()
+        self.stages.clear()
+
+
+metrics = MetricsRegistry()
+
+
+class Span:
+    """
+    Context manager that records the time spent in a block as a stage duration.
+    """
+
+    __slots__ = ("stage", "_start")
+
+    def __init__(self, stage: str) -> None:
+        """
+        Initialize the span.
+
+        Args:
+            stage (str): The stage name.
+        """
+        self.stage = stage
+        self._start = 0.0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        metrics.stages.observe(time.perf_counter() - self._start, self.stage)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(stage: str) -> Union[Span, _NullSpan]:
+    """
+    Times a block of code as one stage of the current request.
+
+    Durations are recorded in the `gf_stage_duration_seconds` histogram, also
+    when the block raises. When metrics are disabled a shared no-op span is
+    returned, so instrumented code costs a single attribute lookup.
+
+    Args:
+        stage (str): The stage name, such as `parse`, `compute` or `encode`.
+
+    Returns:
+        Union[Span, _NullSpan]: The context manager.
+    """
+    return Span(stage) if metrics.enabled else _NULL_SPAN
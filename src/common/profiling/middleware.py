@@ -0,0 +1,122 @@
+import cProfile
+import logging
+import os
+import random
+import re
+import threading
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.common.profiling.metrics import MetricsRegistry, metrics
+from src.config import Config
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that times every HTTP request and profiles a sample of them.
+
+    The duration of every request, from the first byte of the request to the
+    last byte of the response, is recorded by method, route template and status.
+    A sampled request runs under cProfile and is dumped to a `.prof` file when
+    it takes at least `slow_seconds`. The middleware is plain ASGI rather than
+    `BaseHTTPMiddleware`, so streamed request and response bodies pass through
+    untouched and the spans of the route run in the same context.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        registry (MetricsRegistry): Where request durations are recorded.
+        slow_seconds (float, optional): The duration from which a profiled request
+            is dumped, or `None` to never profile.
+        sample_rate (float): The fraction of requests that are profiled.
+        profile_dir (str): The directory of the dumps.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = metrics,
+        slow_seconds: Optional[float] = Config.METRICS.PROFILE_SLOW_SECONDS,
+        sample_rate: float = Config.METRICS.PROFILE_SAMPLE_RATE,
+        profile_dir: str = Config.METRICS.PROFILE_DIR,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The application to wrap.
+            registry (MetricsRegistry, optional): Where request durations are
+                recorded. Defaults to the shared registry.
+            slow_seconds (float, optional): The duration from which a profiled
+                request is dumped. Defaults to `Config.METRICS.PROFILE_SLOW_SECONDS`.
+            sample_rate (float, optional): The fraction of requests that are
+                profiled. Defaults to `Config.METRICS.PROFILE_SAMPLE_RATE`.
+            profile_dir (str, optional): The directory of the dumps. Defaults to
+                `Config.METRICS.PROFILE_DIR`.
+        """
+        self.app = app
+        self.registry = registry
+        self.slow_seconds = slow_seconds
+        self.sample_rate = sample_rate
+        self.profile_dir = profile_dir
+        # cProfile hooks the whole interpreter thread, so one request at a time
+        self._profiling = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        profiler = self._start_profiler()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                self._stop_profiler(profiler, scope, elapsed)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.registry.requests.observe(
+                elapsed, scope["method"], route, str(status_code)
+            )
+
+    def _start_profiler(self) -> Optional[cProfile.Profile]:
+        if self.slow_seconds is None or random.random() >= self.sample_rate:
+            return None
+        if not self._profiling.acquire(blocking=False):
+            return None
+        # Requests that run on the event loop meanwhile show up in the profile too
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_profiler(
+        self, profiler: cProfile.Profile, scope: Scope, elapsed: float
+    ) -> None:
+        profiler.disable()
+        self._profiling.release()
+        if self.slow_seconds is None or elapsed < self.slow_seconds:
+            return
+        name = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-") or "root"
+        path = os.path.join(
+            self.profile_dir,
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method']}-{name}-{elapsed * 1000:.0f}ms.prof",
+        )
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", path, e)
+            return
+        logger.info("Slow request profiled in %s", path)
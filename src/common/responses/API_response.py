@@ -3,6 +3,8 @@
 from fastapi import status
 from fastapi.responses import JSONResponse as FastAPIJSONResponse
 
+from src.common.profiling import span
+
 
 class APIResponse(FastAPIJSONResponse):
     """
@@ -43,3 +45,16 @@ def __init__(
             content=content,
             status_code=status_code,
         )
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serializes the content to JSON, timed as the `render` stage.
+
+        Args:
+            content (Any): The response content.
+
+        Returns:
+            bytes: The JSON body.
+        """
+        with span("render"):
+            return super().render(content)
@@ -0,0 +1,32 @@
+from typing import AsyncIterable
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Streaming response of newline-delimited JSON.
+
+    Unlike `StreamingResponse`, it does not listen for a client disconnect while
+    streaming, so its body iterator may keep reading the request body; a
+    disconnect then surfaces as `ClientDisconnect` from `Request.stream()`.
+
+    Attributes:
+        media_type (str): The media type of the response, set to "application/x-ndjson".
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, content: AsyncIterable[bytes], status_code: int = 200) -> None:
+        """
+        Initialize the NDJSONResponse instance.
+
+        Args:
+            content (AsyncIterable[bytes]): The body, one or more complete lines per chunk.
+            status_code (int, optional): The HTTP status code for the response. Defaults to 200 (OK).
+        """
+        super().__init__(content, status_code=status_code)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
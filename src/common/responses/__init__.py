@@ -1,4 +1,5 @@
 from .API_response import APIResponse
 from .API_response_model import APIResponseModel
+from .NDJSON_response import NDJSONResponse
 
-__all__ = ["APIResponse", "APIResponseModel"]
+__all__ = ["APIResponse", "APIResponseModel", "NDJSONResponse"]
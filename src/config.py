@@ -1,3 +1,7 @@
+import os
+from typing import Optional
+
+
 class Config:
     """
     Configuration class for the Polynomial Arithmetic Calculator API.
@@ -6,6 +10,14 @@ class Config:
 
     Attributes:
         APP (Config.APP): Configuration settings for the application.
+        FIELDS (Config.FIELDS): Configuration settings for the Galois field registry.
+        TABLES (Config.TABLES): Configuration settings for the shared table store.
+        EXECUTOR (Config.EXECUTOR): Configuration settings for offloading field operations.
+        CACHE (Config.CACHE): Configuration settings for the operation result cache.
+        STREAM (Config.STREAM): Configuration settings for streamed operation batches.
+        SESSION (Config.SESSION): Configuration settings for WebSocket field sessions.
+        EXPRESSIONS (Config.EXPRESSIONS): Configuration settings for compiled expressions.
+        METRICS (Config.METRICS): Configuration settings for request metrics and profiling.
         Testing (Config.Testing): Configuration settings for testing.
     """
 
@@ -23,6 +35,182 @@ class APP:
         DESCRIPTION = "A simple polynomial arithmetic calculator API"
         VERSION = "0.1.0"
 
+    class FIELDS:
+        """
+        Configuration settings for the Galois field registry.
+
+        Attributes:
+            PRELOAD (list[int]): The field degrees built at startup and never evicted.
+            WARMUP (bool): Whether startup runs every operation once on the preloaded
+                fields, so that no request pays for JIT compilation.
+            MAX_CACHED (int): The maximum number of ad-hoc fields kept in the registry.
+            BACKEND (str): The default arithmetic backend, `"native"` or `"galois"`.
+            BACKEND_OVERRIDES (dict[int, str]): Per-degree overrides of `BACKEND`.
+            INVERSION (str): The inversion algorithm, `"eea"`, `"itoh-tsujii"` or `"galois"`.
+            KERNEL_MIN_BATCH (int): The smallest batch the native backend computes with
+                the compiled limb-array kernels instead of Python integers.
+            SQUARE_TABLE_MIN_K (int): The smallest number of repeated squarings computed
+                with a precomputed linear-map table.
+            SQUARE_TABLES (int): The maximum number of repeated-squaring tables kept per field.
+            FIXED_BASE_WINDOW (int): The digit width of the fixed-base exponentiation tables.
+            FIXED_BASES (int): The maximum number of registered fixed bases kept.
+            TABLE_MAX_M (int): The largest degree whose native fields compute through
+                precomputed logarithm tables; at most 16, and 0 disables the tables.
+            MAX_MODULI (int): The number of irreducibility checks of requested moduli
+                remembered.
+        """
+
+        PRELOAD = [163, 233, 283, 409, 571]
+        WARMUP = True
+        MAX_CACHED = 32
+        BACKEND = "native"
+        BACKEND_OVERRIDES: dict[int, str] = {}
+        INVERSION = "eea"
+        KERNEL_MIN_BATCH = 64
+        SQUARE_TABLE_MIN_K = 8
+        SQUARE_TABLES = 16
+        FIXED_BASE_WINDOW = 4
+        FIXED_BASES = 64
+        TABLE_MAX_M = 16
+        MAX_MODULI = 256
+
+    class TABLES:
+        """
+        Configuration settings for the store of precomputed field tables shared
+        between worker processes.
+
+        Attributes:
+            ENABLED (bool): Whether the logarithm and squaring tables are
+                memory-mapped from files instead of built in every process.
+            DIRECTORY (str): The directory of the table files.
+            VERSION (int): The table layout version; tables of other versions are ignored.
+            MAX_MAPPED (int): The maximum number of tables kept mapped by a process.
+        """
+
+        ENABLED = False
+        DIRECTORY = ".tables"
+        VERSION = 2
+        MAX_MAPPED = 256
+
+    class EXECUTOR:
+        """
+        Configuration settings for offloading field operations from the event loop.
+
+        Attributes:
+            MODE (str): Where heavy operations run, `"inline"`, `"thread"` or `"process"`.
+            MAX_WORKERS (int): The number of pool workers.
+            MAX_QUEUE (int): The maximum number of pending offloaded operations.
+            HEAVY_OPERATIONS (dict[str, int]): The minimum degree `m` from which each
+                operation is offloaded. Operations not listed always run inline.
+        """
+
+        MODE = "thread"
+        MAX_WORKERS = os.cpu_count() or 1
+        MAX_QUEUE = 64
+        HEAVY_OPERATIONS = {
+            "division": 163,
+            "inverse": 163,
+            "power": 163,
+            "batch": 0,
+            "batch-inverse": 0,
+            "stream": 0,
+            "evaluate": 0,
+            "session": 0,
+        }
+
+    class CACHE:
+        """
+        Configuration settings for the operation result cache.
+
+        Attributes:
+            ENABLED (bool): Whether operation results are memoized.
+            MAX_BYTES (int): The memory budget of the cache, in bytes.
+            TTL (float): The lifetime of a cached result, in seconds.
+        """
+
+        ENABLED = False
+        MAX_BYTES = 64 * 1024 * 1024
+        TTL = 300.0
+
+    class STREAM:
+        """
+        Configuration settings for streamed operation batches.
+
+        Attributes:
+            CHUNK_SIZE (int): The number of operations computed together.
+            MAX_LINE_BYTES (int): The longest operation line accepted, in bytes.
+            RETRY_DELAY (float): The wait before resubmitting a chunk the executor
+                rejected, in seconds.
+        """
+
+        CHUNK_SIZE = 1024
+        MAX_LINE_BYTES = 64 * 1024
+        RETRY_DELAY = 0.01
+
+    class SESSION:
+        """
+        Configuration settings for WebSocket field sessions.
+
+        Attributes:
+            MAX_REGISTERS (int): The maximum number of registers of a session.
+            MAX_FRAME_OPERATIONS (int): The maximum number of operations in one frame.
+        """
+
+        MAX_REGISTERS = 256
+        MAX_FRAME_OPERATIONS = 1024
+
+    class EXPRESSIONS:
+        """
+        Configuration settings for compiled expressions.
+
+        Attributes:
+            MAX_LENGTH (int): The longest expression accepted, in characters.
+            MAX_OPERATIONS (int): The maximum number of operations of a compiled expression.
+            MAX_CACHED (int): The maximum number of compiled expressions kept.
+            MAX_BINDINGS (int): The maximum number of variable bindings per evaluation.
+        """
+
+        MAX_LENGTH = 4096
+        MAX_OPERATIONS = 1024
+        MAX_CACHED = 256
+        MAX_BINDINGS = 10000
+
+    class METRICS:
+        """
+        Configuration settings for request metrics and profiling.
+
+        Attributes:
+            ENABLED (bool): Whether request and stage durations are recorded.
+            BUCKETS (tuple[float, ...]): The upper bounds of the duration histogram
+                buckets, in seconds.
+            PROFILE_SLOW_SECONDS (float, optional): The duration from which a profiled
+                request is dumped. `None` disables profiling.
+            PROFILE_SAMPLE_RATE (float): The fraction of requests run under cProfile.
+            PROFILE_DIR (str): The directory the `.prof` dumps are written to.
+        """
+
+        ENABLED = True
+        BUCKETS = (
+            0.0001,
+            0.00025,
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1.0,
+            2.5,
+            5.0,
+        )
+        PROFILE_SLOW_SECONDS: Optional[float] = None
+        PROFILE_SAMPLE_RATE = 0.01
+        PROFILE_DIR = "profiles"
+
     class Testing:
         """
         Configuration settings for testing.
@@ -1,19 +1,47 @@
-from typing import Union
+import asyncio
+import json
+from typing import Annotated, AsyncIterator, Optional, Union
 
-from fastapi import status
+from fastapi import Header, Request, Response, WebSocket, WebSocketDisconnect, status
 from fastapi.routing import APIRouter
 
-from src.common.responses import APIResponse, APIResponseModel
+from src.common.profiling import span
+from src.common.responses import APIResponse, APIResponseModel, NDJSONResponse
 from src.common.utils.types import BinStr, HexStr
-from src.controller.schemas import OperationRequest, InverseRequest
+from src.config import Config
+from src.controller.routes.wire import WireRoute, wire_service
+from src.controller.schemas import (
+    BatchInverseRequest,
+    BatchOperationRequest,
+    EvaluateRequest,
+    FixedBaseRequest,
+    InverseRequest,
+    OperationRequest,
+    PowerRequest,
+    SquareRequest,
+)
+from src.core.cache import cached_run
+from src.core.codec import OUTPUT_TYPES, encode, parse
+from src.core.executor import ExecutorBusyError, executor
+from src.core.fields.moduli import resolve_modulus
 from src.core.services.addition import add
+from src.core.services.batch import BATCH_OPERATIONS, batch_operation
 from src.core.services.division import divide
+from src.core.services.evaluate import evaluate as evaluate_service
 from src.core.services.inverse import inverse as inverse_service
+from src.core.services.inverse import inverse_batch
 from src.core.services.mod_reduction import modReduction
 from src.core.services.multiplication import multiplication as multiply
+from src.core.services.power import power as power_service
+from src.core.services.power import power_fixed_base, register_base
+from src.core.services.square import square as square_service
+from src.core.services.stream import stream_chunk
 from src.core.services.subtraction import subtraction
+from src.core.session import FieldSession
 
-services_router = APIRouter(prefix="/operations", tags=["Arithmetic Operations"])
+services_router = APIRouter(
+    prefix="/operations", tags=["Arithmetic Operations"], route_class=WireRoute
+)
 
 
 @services_router.post(
@@ -21,6 +49,7 @@
 )
 async def addition(
     request: OperationRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Endpoint to perform addition of two polynomials.
@@ -36,8 +65,6 @@ async def addition(
         APIResponse: An API response object containing the result of the addition and status code.
     """
     try:
-        poly1 = request.poly1
-        poly2 = request.poly2
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -48,21 +75,17 @@ async def addition(
                 message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
                 data={"result": None},
             )
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
-        
-        poly_sum = add(poly1, poly2, input_type, m)
-        result = None
-        
-        if output_type == "binary":
-            result = format(poly_sum, f"0{m}b")
-        elif output_type == "hexadecimal":
-            result = format(poly_sum, f"0{m//4}x")
-        
+
+        poly_sum = await _addition(request, x_cache_bypass)
+        with span("encode"):
+            result = encode(poly_sum, output_type, m)
+
         return APIResponse(
             message="Polynomials added successfully!",
             status_code=status.HTTP_200_OK,
@@ -74,6 +97,12 @@ async def addition(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
         return APIResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -82,11 +111,34 @@ async def addition(
         )
 
 
+@wire_service(addition, "Polynomials added successfully!")
+async def _addition(request: OperationRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        # The result does not depend on the modulus, but it is still validated
+        resolve_modulus(m, request.modulus)
+        a = parse(request.poly1, request.input_type, m)
+        b = parse(request.poly2, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "addition",
+        m,
+        None,
+        (a.value, b.value),
+        add,
+        a,
+        b,
+        request.input_type,
+        m,
+    )
+
+
 @services_router.post(
     "/division", response_class=APIResponse, response_model=APIResponseModel
 )
 async def division(
     request: OperationRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Endpoint to perform division of two polynomials.
@@ -97,13 +149,12 @@ async def division(
         input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
         output_type (str): The desired format of the output polynomial ('binary' or 'hexadecimal').
         m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (str, optional): The reduction polynomial in hexadecimal or a standard curve name such as B-163. Defaults to the registry default for m.
 
     Returns:
         APIResponse: An API response object containing the result of the division and status code.
     """
     try:
-        poly1 = request.poly1
-        poly2 = request.poly2
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -114,20 +165,16 @@ async def division(
                 message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
                 data={"result": None},
             )
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
 
-        poly_quotient = divide(poly1, poly2, input_type, m)
-        result = None
-
-        if output_type == "binary":
-            result = format(poly_quotient, f"0{m}b")
-        elif output_type == "hexadecimal":
-            result = format(poly_quotient, f"0{m//4}x")
+        poly_quotient = await _division(request, x_cache_bypass)
+        with span("encode"):
+            result = encode(poly_quotient, output_type, m)
 
         return APIResponse(
             message="Polynomials divided successfully!",
@@ -140,6 +187,12 @@ async def division(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
         return APIResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -148,11 +201,34 @@ async def division(
         )
 
 
+@wire_service(division, "Polynomials divided successfully!")
+async def _division(request: OperationRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        modulus = resolve_modulus(m, request.modulus)
+        a = parse(request.poly1, request.input_type, m)
+        b = parse(request.poly2, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "division",
+        m,
+        modulus,
+        (a.value, b.value),
+        divide,
+        a,
+        b,
+        request.input_type,
+        m,
+        modulus,
+    )
+
+
 @services_router.post(
     "/subtraction", response_class=APIResponse, response_model=APIResponseModel
 )
 async def sub(
     request: OperationRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Endpoint to perform subtraction of two polynomials.
@@ -168,8 +244,6 @@ async def sub(
         APIResponse: An API response object containing the result of the subtraction and status code.
     """
     try:
-        poly1 = request.poly1
-        poly2 = request.poly2
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -180,20 +254,16 @@ async def sub(
                 message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
                 data={"result": None},
             )
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
 
-        poly_diff = subtraction(poly1, poly2, input_type, m)
-        result = None
-
-        if output_type == "binary":
-            result = format(poly_diff, f"0{m}b")
-        elif output_type == "hexadecimal":
-            result = format(poly_diff, f"0{m//4}x")
+        poly_diff = await _subtraction(request, x_cache_bypass)
+        with span("encode"):
+            result = encode(poly_diff, output_type, m)
 
         return APIResponse(
             message="Polynomials subtracted successfully!",
@@ -206,6 +276,12 @@ async def sub(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
         return APIResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -214,11 +290,34 @@ async def sub(
         )
 
 
+@wire_service(sub, "Polynomials subtracted successfully!")
+async def _subtraction(request: OperationRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        # The result does not depend on the modulus, but it is still validated
+        resolve_modulus(m, request.modulus)
+        a = parse(request.poly1, request.input_type, m)
+        b = parse(request.poly2, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "subtraction",
+        m,
+        None,
+        (a.value, b.value),
+        subtraction,
+        a,
+        b,
+        request.input_type,
+        m,
+    )
+
+
 @services_router.post(
     "/mod-reduction", response_class=APIResponse, response_model=APIResponseModel
 )
 async def mod_reduction(
     request: OperationRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Endpoint to perform modulo reduction of two polynomials.
@@ -234,9 +333,6 @@ async def mod_reduction(
         APIResponse: An API response object containing the result of the modulo reduction and status code.
     """
     try:
-
-        poly1 = request.poly1
-        poly2 = request.poly2
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -247,21 +343,16 @@ async def mod_reduction(
                 message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
                 data={"result": None},
             )
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
 
-
-        poly_mod = modReduction(poly1, poly2, input_type, m)
-        result = None
-
-        if output_type == "binary":
-            result = format(poly_mod, f"0{m}b")
-        elif output_type == "hexadecimal":
-            result = format(poly_mod, f"0{m//4}x")
+        poly_mod = await _mod_reduction(request, x_cache_bypass)
+        with span("encode"):
+            result = encode(poly_mod, output_type, m)
 
         return APIResponse(
             message="Modulo reduction performed successfully!",
@@ -274,6 +365,12 @@ async def mod_reduction(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
         return APIResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -282,11 +379,34 @@ async def mod_reduction(
         )
 
 
+@wire_service(mod_reduction, "Modulo reduction performed successfully!")
+async def _mod_reduction(request: OperationRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        # The result does not depend on the modulus, but it is still validated
+        resolve_modulus(m, request.modulus)
+        a = parse(request.poly1, request.input_type, m)
+        b = parse(request.poly2, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "mod-reduction",
+        m,
+        None,
+        (a.value, b.value),
+        modReduction,
+        a,
+        b,
+        request.input_type,
+        m,
+    )
+
+
 @services_router.post(
     "/multiplication", response_class=APIResponse, response_model=APIResponseModel
 )
 async def multiplication(
     request: OperationRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Endpoint to perform multiplication of two polynomials over GF(2^m).
@@ -297,13 +417,12 @@ async def multiplication(
         input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
         output_type (str): The desired format of the output polynomial ('binary' or 'hexadecimal').
         m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (str, optional): The reduction polynomial in hexadecimal or a standard curve name such as B-163. Defaults to the registry default for m.
 
     Returns:
         APIResponse: An API response object containing the result of the multiplication and status code.
     """
     try:
-        poly1 = request.poly1
-        poly2 = request.poly2
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -315,20 +434,16 @@ async def multiplication(
                 data={"result": None},
             )
 
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
 
-        poly_product = multiply(poly1, poly2, input_type, m)
-        result = None
-
-        if output_type == "binary":
-            result = format(poly_product, f"0{m}b")
-        elif output_type == "hexadecimal":
-            result = format(poly_product, f"0{m//4}x")
+        poly_product = await _multiplication(request, x_cache_bypass)
+        with span("encode"):
+            result = encode(poly_product, output_type, m)
 
         return APIResponse(
             message="Polynomials multiplied successfully!",
@@ -342,6 +457,189 @@ async def multiplication(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"result": None},
+        )
+
+
+@wire_service(multiplication, "Polynomials multiplied successfully!")
+async def _multiplication(request: OperationRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        modulus = resolve_modulus(m, request.modulus)
+        a = parse(request.poly1, request.input_type, m)
+        b = parse(request.poly2, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "multiplication",
+        m,
+        modulus,
+        (a.value, b.value),
+        multiply,
+        a,
+        b,
+        request.input_type,
+        m,
+        modulus,
+    )
+
+
+@services_router.post(
+    "/square", response_class=APIResponse, response_model=APIResponseModel
+)
+async def square(
+    request: SquareRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
+) -> APIResponse:
+    """
+    Endpoint to square a polynomial over GF(2^m), optionally `k` times in a row.
+
+    Args:
+        request (SquareRequest): The request object containing the polynomial, input type, output type, the degree and optional modulus of the Galois Field and the number of squarings.
+
+    Returns:
+        APIResponse: An API response object containing `poly^(2^k)` and status code.
+    """
+    try:
+        input_type = request.input_type
+        output_type = request.output_type
+        m = request.m
+
+        if input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"result": None},
+            )
+        if output_type not in OUTPUT_TYPES:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                data={"result": None},
+            )
+
+        poly_square = await _square(request, x_cache_bypass)
+
+        with span("encode"):
+            result = encode(poly_square, output_type, m)
+
+        return APIResponse(
+            message="Polynomial squared successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"result": result},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"result": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"result": None},
+        )
+
+
+@wire_service(square, "Polynomial squared successfully!")
+async def _square(request: SquareRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        modulus = resolve_modulus(m, request.modulus)
+        element = parse(request.poly, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "square",
+        m,
+        modulus,
+        (element.value,),
+        square_service,
+        element,
+        request.input_type,
+        m,
+        request.k,
+        modulus,
+        params=(request.k,),
+    )
+
+
+@services_router.post(
+    "/power", response_class=APIResponse, response_model=APIResponseModel
+)
+async def power(
+    request: PowerRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
+) -> APIResponse:
+    """
+    Endpoint to raise a polynomial over GF(2^m) to an integer power.
+
+    The base is either given as `poly` or as the `base_id` of a base registered
+    through `/operations/power/base`, whose precomputed table is reused. Each
+    worker keeps its own bases, so clients send `poly` along with `base_id` to
+    let a worker that has not seen the base rebuild its table.
+
+    Args:
+        request (PowerRequest): The request object containing the base or base identifier, exponent, input type, output type, and the degree and optional modulus of the Galois Field.
+
+    Returns:
+        APIResponse: An API response object containing the power and status code.
+    """
+    try:
+        input_type = request.input_type
+        output_type = request.output_type
+        m = request.m
+
+        if input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"result": None},
+            )
+        if output_type not in OUTPUT_TYPES:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                data={"result": None},
+            )
+
+        poly_power = await _power(request, x_cache_bypass)
+
+        with span("encode"):
+            result = encode(poly_power, output_type, m)
+
+        return APIResponse(
+            message="Polynomial power computed successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"result": result},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"result": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
         return APIResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -350,17 +648,112 @@ async def multiplication(
         )
 
 
+@wire_service(power, "Polynomial power computed successfully!")
+async def _power(request: PowerRequest, bypass: bool) -> int:
+    m = request.m
+    modulus = resolve_modulus(m, request.modulus)
+    if request.base_id is not None:
+        return await executor.run(
+            "power",
+            m,
+            power_fixed_base,
+            request.base_id,
+            request.exponent,
+            m,
+            modulus,
+            request.poly,
+            request.input_type,
+        )
+    if request.poly is None:
+        raise ValueError("Provide poly, base_id or both")
+    with span("parse"):
+        element = parse(request.poly, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "power",
+        m,
+        modulus,
+        (element.value,),
+        power_service,
+        element,
+        request.exponent,
+        request.input_type,
+        m,
+        modulus,
+        params=(request.exponent,),
+    )
+
+
+@services_router.post(
+    "/power/base", response_class=APIResponse, response_model=APIResponseModel
+)
+async def power_base(
+    request: FixedBaseRequest,
+) -> APIResponse:
+    """
+    Endpoint to register a fixed base for repeated exponentiation.
+
+    Args:
+        request (FixedBaseRequest): The request object containing the base, input type, and the degree and optional modulus of the Galois Field.
+
+    Returns:
+        APIResponse: An API response object containing the identifier of the base and status code.
+    """
+    try:
+        if request.input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"base_id": None},
+            )
+
+        base_id = await executor.run(
+            "power",
+            request.m,
+            register_base,
+            request.poly,
+            request.input_type,
+            request.m,
+            resolve_modulus(request.m, request.modulus),
+        )
+
+        return APIResponse(
+            message="Fixed base registered successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"base_id": base_id},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"base_id": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"base_id": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"base_id": None},
+        )
+
+
 @services_router.post(
     "/inverse", response_class=APIResponse, response_model=APIResponseModel
 )
 async def inverse_operation(
     request: InverseRequest,
+    x_cache_bypass: Annotated[bool, Header(alias="X-Cache-Bypass")] = False,
 ) -> APIResponse:
     """
     Handle the inverse operation request.
 
     Args:
-        request (InverseRequest): The request object containing the polynomial, input type, output type, and degree of the Galois Field.
+        request (InverseRequest): The request object containing the polynomial, input type, output type, and the degree and optional modulus of the Galois Field.
 
     Returns:
         APIResponse: The response object containing the status code, message, and the result of the inverse operation.
@@ -369,7 +762,6 @@ async def inverse_operation(
         HTTPException: If the input type or output type is invalid.
     """
     try:
-        poly = request.poly
         input_type = request.input_type
         output_type = request.output_type
         m = request.m
@@ -380,25 +772,17 @@ async def inverse_operation(
                 message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
                 data={"result": None},
             )
-        if output_type not in ["binary", "hexadecimal"]:
+        if output_type not in OUTPUT_TYPES:
             return APIResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message="Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
                 data={"result": None},
             )
 
-        inverse_result = inverse_service(poly=poly, input_type=input_type, m=m)
-
-        if output_type == "binary":
-            result = inverse_result
-        elif output_type == "hexadecimal":
-            if input_type == "binary":
-                inverse_int = int(inverse_result, 2)
-                hex_len = (m + 3) // 4
-                result = hex(inverse_int)[2:].upper().rjust(hex_len, "0")
-            else:
+        inverse_result = await _inverse(request, x_cache_bypass)
 
-                result = inverse_result
+        with span("encode"):
+            result = encode(inverse_result, output_type, m)
 
         return APIResponse(
             message="Polynomial inverse computed successfully!",
@@ -412,6 +796,12 @@ async def inverse_operation(
             message=str(e),
             data={"result": None},
         )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"result": None},
+        )
     except Exception as e:
 
         return APIResponse(
@@ -419,3 +809,491 @@ async def inverse_operation(
             message=str(e),
             data={"result": None},
         )
+
+
+@wire_service(inverse_operation, "Polynomial inverse computed successfully!")
+async def _inverse(request: InverseRequest, bypass: bool) -> int:
+    m = request.m
+    with span("parse"):
+        modulus = resolve_modulus(m, request.modulus)
+        element = parse(request.poly, request.input_type, m)
+    return await cached_run(
+        bypass,
+        "inverse",
+        m,
+        modulus,
+        (element.value,),
+        inverse_service,
+        element,
+        request.input_type,
+        m,
+        modulus,
+    )
+
+
+@services_router.post(
+    "/batch/inverse", response_class=APIResponse, response_model=APIResponseModel
+)
+async def batch_inverse(
+    request: BatchInverseRequest,
+) -> APIResponse:
+    """
+    Endpoint to compute the inverses of many polynomials with a single field inversion.
+
+    Args:
+        request (BatchInverseRequest): The request object containing the polynomials, input type, output type, and the degree and optional modulus of the Galois Field.
+
+    Returns:
+        APIResponse: An API response object containing one result or error per polynomial, in order, and status code.
+    """
+    try:
+        input_type = request.input_type
+        output_type = request.output_type
+        m = request.m
+
+        if input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"results": None},
+            )
+        if output_type not in OUTPUT_TYPES:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                data={"results": None},
+            )
+
+        results = [
+            (
+                {"result": None, "error": str(item)}
+                if isinstance(item, ValueError)
+                else {"result": encode(item, output_type, m), "error": None}
+            )
+            for item in await _batch_inverse(request, False)
+        ]
+
+        return APIResponse(
+            message="Polynomial inverses computed successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"results": results},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"results": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"results": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"results": None},
+        )
+
+
+@wire_service(batch_inverse, "Polynomial inverses computed successfully!", "results")
+async def _batch_inverse(
+    request: BatchInverseRequest, bypass: bool
+) -> list[Union[int, ValueError]]:
+    return await executor.run(
+        "batch-inverse",
+        request.m,
+        inverse_batch,
+        request.poly,
+        request.input_type,
+        request.m,
+        resolve_modulus(request.m, request.modulus),
+    )
+
+
+@services_router.post(
+    "/batch/{operation}", response_class=APIResponse, response_model=APIResponseModel
+)
+async def batch(
+    operation: str,
+    request: BatchOperationRequest,
+) -> APIResponse:
+    """
+    Endpoint to apply an operation to many pairs of polynomials at once.
+
+    Args:
+        operation (str): The operation to apply ('addition', 'subtraction', 'multiplication', 'division' or 'mod-reduction').
+        request (BatchOperationRequest): The request object containing the operand lists, input type, output type, and the degree and optional modulus of the Galois Field.
+
+    Returns:
+        APIResponse: An API response object containing one result or error per operand pair, in order, and status code.
+    """
+    try:
+        input_type = request.input_type
+        output_type = request.output_type
+        m = request.m
+
+        if operation not in BATCH_OPERATIONS:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Invalid operation.\nPlease provide one of {', '.join(BATCH_OPERATIONS)}.",
+                data={"results": None},
+            )
+        if input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"results": None},
+            )
+        if output_type not in OUTPUT_TYPES:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                data={"results": None},
+            )
+
+        results = [
+            (
+                {"result": None, "error": str(item)}
+                if isinstance(item, ValueError)
+                else {"result": encode(item, output_type, m), "error": None}
+            )
+            for item in await _batch(request, False, operation)
+        ]
+
+        return APIResponse(
+            message="Batch operation performed successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"results": results},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"results": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"results": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"results": None},
+        )
+
+
+@wire_service(batch, "Batch operation performed successfully!", "results")
+async def _batch(
+    request: BatchOperationRequest, bypass: bool, operation: str
+) -> list[Union[int, ValueError]]:
+    return await executor.run(
+        "batch",
+        request.m,
+        batch_operation,
+        operation,
+        request.poly1,
+        request.poly2,
+        request.input_type,
+        request.m,
+        resolve_modulus(request.m, request.modulus),
+    )
+
+
+@services_router.post(
+    "/evaluate", response_class=APIResponse, response_model=APIResponseModel
+)
+async def evaluate(request: EvaluateRequest) -> APIResponse:
+    """
+    Endpoint to evaluate an expression for many bindings of its variables.
+
+    The expression, such as `(a*b + c) / d`, may use the operators +, -, *, /,
+    % and ** and be preceded by assignments of shared intermediate results
+    (`t = a*b; t*t + c`). It is compiled once and cached, and all of its
+    divisions share one batched inversion across the bindings.
+
+    Args:
+        request (EvaluateRequest): The request object containing the expression, the variable bindings, input type, output type, and the degree and optional modulus of the Galois Field.
+
+    Returns:
+        APIResponse: An API response object containing one result or error per binding, in order, and status code.
+    """
+    try:
+        input_type = request.input_type
+        output_type = request.output_type
+        m = request.m
+
+        if input_type not in ["binary", "hexadecimal"]:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                data={"results": None},
+            )
+        if output_type not in OUTPUT_TYPES:
+            return APIResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                data={"results": None},
+            )
+
+        results = [
+            (
+                {"result": None, "error": str(item)}
+                if isinstance(item, ValueError)
+                else {"result": encode(item, output_type, m), "error": None}
+            )
+            for item in await _evaluate(request, False)
+        ]
+
+        return APIResponse(
+            message="Expression evaluated successfully!",
+            status_code=status.HTTP_200_OK,
+            data={"results": results},
+        )
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"results": None},
+        )
+    except ExecutorBusyError as e:
+        return APIResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=str(e),
+            data={"results": None},
+        )
+    except Exception as e:
+        return APIResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            message=str(e),
+            data={"results": None},
+        )
+
+
+@wire_service(evaluate, "Expression evaluated successfully!", "results")
+async def _evaluate(
+    request: EvaluateRequest, bypass: bool
+) -> list[Union[int, ValueError]]:
+    return await executor.run(
+        "evaluate",
+        request.m,
+        evaluate_service,
+        request.expression,
+        request.bindings,
+        request.input_type,
+        request.m,
+        resolve_modulus(request.m, request.modulus),
+    )
+
+
+async def _stream_chunk(
+    lines: list[Optional[bytes]],
+    input_type: str,
+    output_type: str,
+    m: int,
+    modulus: Optional[int],
+) -> bytes:
+    # A full executor delays the stream instead of failing its operations
+    while True:
+        try:
+            results = await executor.run(
+                "stream", m, stream_chunk, lines, input_type, m, modulus
+            )
+            break
+        except ExecutorBusyError:
+            await asyncio.sleep(Config.STREAM.RETRY_DELAY)
+    return b"".join(
+        json.dumps(
+            {"result": None, "error": str(item)}
+            if isinstance(item, ValueError)
+            else {"result": encode(item, output_type, m), "error": None}
+        ).encode()
+        + b"\n"
+        for item in results
+    )
+
+
+async def _stream_results(
+    request: Request,
+    input_type: str,
+    output_type: str,
+    m: int,
+    modulus: Optional[int],
+) -> AsyncIterator[bytes]:
+    # Reads the body incrementally and computes it CHUNK_SIZE lines at a time
+    buffer = b""
+    skipping = False
+    lines: list[Optional[bytes]] = []
+    async for data in request.stream():
+        *complete, buffer = (buffer + data).split(b"\n")
+        for line in complete:
+            if skipping or len(line) > Config.STREAM.MAX_LINE_BYTES:
+                lines.append(None)
+                skipping = False
+            elif line.strip():
+                lines.append(line)
+        if len(buffer) > Config.STREAM.MAX_LINE_BYTES:
+            buffer, skipping = b"", True
+        while len(lines) >= Config.STREAM.CHUNK_SIZE:
+            chunk, lines = (
+                lines[: Config.STREAM.CHUNK_SIZE],
+                lines[Config.STREAM.CHUNK_SIZE :],
+            )
+            yield await _stream_chunk(chunk, input_type, output_type, m, modulus)
+    if skipping:
+        lines.append(None)
+    elif buffer.strip():
+        lines.append(buffer)
+    if lines:
+        yield await _stream_chunk(lines, input_type, output_type, m, modulus)
+
+
+@services_router.post("/stream", response_class=NDJSONResponse)
+async def stream(
+    request: Request,
+    m: int,
+    modulus: Optional[str] = None,
+    input_type: str = "hexadecimal",
+    output_type: str = "hexadecimal",
+) -> Response:
+    """
+    Endpoint to compute a newline-delimited JSON stream of operations.
+
+    Every line of the body is an object with an `operation` (one of the batch
+    operations or 'inverse') and its operands (`poly1` and `poly2`, or `poly`).
+    The body is read incrementally and computed in chunks of
+    `Config.STREAM.CHUNK_SIZE` lines, and one `{"result", "error"}` line is
+    streamed back per operation, in order, so memory use does not grow with the
+    size of the job.
+
+    Args:
+        request (Request): The request whose body holds the operations.
+        m (int): The degree of the polynomial field.
+        modulus (str, optional): The reduction polynomial in hexadecimal or a
+            standard curve name. Defaults to the registry default for `m`.
+        input_type (str, optional): The format of the input polynomials ('binary' or 'hexadecimal').
+        output_type (str, optional): The format of the results ('binary', 'hexadecimal' or 'base64').
+
+    Returns:
+        Response: The `NDJSONResponse` stream of results, or an API response object
+        with the error if the parameters are invalid.
+    """
+    if input_type not in ["binary", "hexadecimal"]:
+        return APIResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            data={"results": None},
+        )
+    if output_type not in OUTPUT_TYPES:
+        return APIResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+            data={"results": None},
+        )
+
+    try:
+        field_modulus = resolve_modulus(m, modulus)
+    except ValueError as e:
+        return APIResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message=str(e),
+            data={"results": None},
+        )
+
+    return NDJSONResponse(
+        _stream_results(request, input_type, output_type, m, field_modulus)
+    )
+
+
+@services_router.websocket("/session")
+async def session(
+    websocket: WebSocket,
+    m: int,
+    modulus: Optional[str] = None,
+    input_type: str = "hexadecimal",
+    output_type: str = "hexadecimal",
+) -> None:
+    """
+    WebSocket endpoint to run chained operations over one field.
+
+    The session is bound to GF(2^m) with an optional `modulus`, and
+    greets the client with `{"m", "modulus"}`. Every text frame is one operation
+    object, or a list of them that is answered with a list of replies in order:
+    `{"id": 1, "op": "mul", "args": ["$x", "a1"], "to": "y"}` multiplies the
+    register `x` by `a1` and stores the product in the register `y`. Registers
+    live as long as the connection, so intermediate results stay on the server
+    and only the results asked for are sent back. See `FieldSession.handle` for
+    the frame fields. Frames run in the executor, off the event loop, and
+    binary frames are answered with an error.
+
+    Args:
+        websocket (WebSocket): The connection.
+        m (int): The degree of the polynomial field.
+        modulus (str, optional): The reduction polynomial in hexadecimal or a
+            standard curve name. Defaults to the registry default for `m`.
+        input_type (str, optional): The format of the operands ('binary' or 'hexadecimal').
+        output_type (str, optional): The format of the results ('binary', 'hexadecimal' or 'base64').
+    """
+    try:
+        field_session = FieldSession(
+            m,
+            resolve_modulus(m, modulus),
+            input_type,
+            output_type,
+        )
+    except ValueError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+        return
+
+    await websocket.accept()
+    await websocket.send_json(
+        {"m": m, "modulus": format(field_session.field.modulus, "x")}
+    )
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            text = message.get("text")
+            if text is None:
+                await websocket.send_json({"id": None, "error": "Frames must be text."})
+                continue
+            try:
+                frame = json.loads(text)
+            except ValueError:
+                await websocket.send_json({"id": None, "error": "Invalid JSON frame."})
+                continue
+            if (
+                isinstance(frame, list)
+                and len(frame) > Config.SESSION.MAX_FRAME_OPERATIONS
+            ):
+                await websocket.send_json(
+                    {
+                        "id": None,
+                        "error": f"A frame holds at most {Config.SESSION.MAX_FRAME_OPERATIONS} operations.",
+                    }
+                )
+                continue
+            try:
+                # The registers are updated in place, so frames never leave this process
+                reply = await executor.run(
+                    "session",
+                    m,
+                    (
+                        field_session.handle_many
+                        if isinstance(frame, list)
+                        else field_session.handle
+                    ),
+                    frame,
+                    stateful=True,
+                )
+            except ExecutorBusyError as e:
+                reply = {"id": None, "error": str(e)}
+            await websocket.send_json(reply)
+    except WebSocketDisconnect:
+        return
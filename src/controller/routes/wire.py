@@ -0,0 +1,489 @@
+import asyncio
+import functools
+import importlib
+import importlib.util
+import time
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    get_origin,
+)
+
+from fastapi import Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field, InstanceOf, ValidationError, create_model
+
+from src.common.profiling import metrics, span
+from src.common.responses import APIResponse
+from src.core.codec import INPUT_BASES, OUTPUT_TYPES, Element, bounds, encode, parse
+from src.core.executor import ExecutorBusyError
+
+# Media types of the binary wire formats and the module that implements each
+WIRE_FORMATS = {
+    "application/octet-stream": "octet-stream",
+    "application/msgpack": "msgpack",
+    "application/x-msgpack": "msgpack",
+    "application/cbor": "cbor",
+}
+MEDIA_TYPES = {
+    "octet-stream": "application/octet-stream",
+    "msgpack": "application/msgpack",
+    "cbor": "application/cbor",
+}
+_MODULES = {"msgpack": "msgpack", "cbor": "cbor2"}
+_TRUE = ("1", "true", "t", "yes", "y", "on")
+
+# When the route handler started, to time reading and validating the request
+_handler_started: ContextVar[float] = ContextVar("_handler_started", default=0.0)
+
+
+class WireError(ValueError):
+    """
+    Raised when a binary request body does not match the request model.
+    """
+
+
+def available(wire_format: str) -> bool:
+    """
+    Returns whether a wire format can be used in this process.
+
+    Args:
+        wire_format (str): One of the values of `WIRE_FORMATS`.
+
+    Returns:
+        bool: `True` for raw bytes, and for msgpack and CBOR when the optional
+        `msgpack` or `cbor2` package is installed.
+    """
+    module = _MODULES.get(wire_format)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def content_format(content_type: Optional[str]) -> Optional[str]:
+    """
+    Returns the wire format of a request body.
+
+    Args:
+        content_type (str, optional): The `Content-Type` header.
+
+    Returns:
+        Optional[str]: The wire format, or `None` for JSON and unknown media types.
+    """
+    media = (content_type or "").split(";")[0].strip().lower()
+    return WIRE_FORMATS.get(media)
+
+
+def accept_format(accept: Optional[str]) -> Optional[str]:
+    """
+    Picks the wire format of a response from the `Accept` header.
+
+    The media types are taken in the order the client lists them; JSON or a
+    wildcard listed before any binary format keeps the JSON response.
+
+    Args:
+        accept (str, optional): The `Accept` header.
+
+    Returns:
+        Optional[str]: The first available wire format, or `None` for JSON.
+    """
+    for part in (accept or "").split(","):
+        media = part.split(";")[0].strip().lower()
+        if media in ("application/json", "application/*", "*/*"):
+            return None
+        wire_format = WIRE_FORMATS.get(media)
+        if wire_format is not None and available(wire_format):
+            return wire_format
+    return None
+
+
+def _codec(wire_format: str) -> Any:
+    return importlib.import_module(_MODULES[wire_format])
+
+
+def _loads(wire_format: str, body: bytes) -> Any:
+    if wire_format == "msgpack":
+        return _codec(wire_format).unpackb(body, raw=False)
+    return _codec(wire_format).loads(body)
+
+
+def _dumps(wire_format: str, content: Any) -> bytes:
+    if wire_format == "msgpack":
+        return bytes(_codec(wire_format).packb(content, use_bin_type=True))
+    return bytes(_codec(wire_format).dumps(content))
+
+
+def _poly_fields(model: type[BaseModel]) -> dict[str, bool]:
+    # The polynomial fields of a request model and whether each holds a list
+    return {
+        name: get_origin(field.annotation) is list
+        for name, field in model.model_fields.items()
+        if name.startswith("poly")
+    }
+
+
+class WireService(NamedTuple):
+    """
+    The computation behind a route, called directly for binary requests.
+
+    Attributes:
+        call (Callable[..., Awaitable[Any]]): Coroutine taking the validated request
+            model, whether the result cache is bypassed and the path parameters of
+            the route, and returning the result as an integer, or a list of
+            integers and `ValueError`s for routes with many results.
+        message (str): The message of a successful response.
+        key (str): The data field of the results, `"result"` or `"results"`.
+    """
+
+    call: Callable[..., Awaitable[Any]]
+    message: str
+    key: str
+
+
+_services: dict[Callable[..., Any], WireService] = {}
+
+S = TypeVar("S", bound=Callable[..., Awaitable[Any]])
+
+
+def wire_service(
+    endpoint: Callable[..., Any], message: str, key: str = "result"
+) -> Callable[[S], S]:
+    """
+    Registers the computation of a route for its binary requests.
+
+    The route handler calls the same coroutine, so both paths share it; only
+    routes with a registered service accept binary bodies.
+
+    Args:
+        endpoint (Callable[..., Any]): The route handler.
+        message (str): The message of a successful response.
+        key (str, optional): The data field of the results. Defaults to `"result"`.
+
+    Returns:
+        Callable[[S], S]: A decorator registering the coroutine unchanged.
+    """
+
+    def register(call: S) -> S:
+        _services[endpoint] = WireService(call, message, key)
+        return call
+
+    return register
+
+
+def wire_model(model: type[BaseModel]) -> type[BaseModel]:
+    """
+    Returns the variant of a request model whose polynomials are elements.
+
+    The polynomial fields of the variant take `codec.Element`s, or lists of them,
+    in place of strings, so decoded bodies are validated without being written
+    back as text. The other fields and the model validators are inherited.
+
+    Args:
+        model (type[BaseModel]): The request model of a route.
+
+    Returns:
+        type[BaseModel]: A subclass of the model.
+    """
+    fields: dict[str, Any] = {}
+    for name, is_list in _poly_fields(model).items():
+        field = model.model_fields[name]
+        annotation: Any = list[InstanceOf[Element]] if is_list else InstanceOf[Element]
+        if field.is_required():
+            fields[name] = (annotation, Field(description=field.description))
+        else:
+            fields[name] = (
+                Optional[annotation],
+                Field(field.default, description=field.description),
+            )
+    return create_model(f"Wire{model.__name__}", __base__=model, **fields)
+
+
+def _degree(value: Any, where: str) -> int:
+    try:
+        m = int(value)
+    except (TypeError, ValueError) as e:
+        raise WireError(f"Binary requests need the field degree `m` {where}.") from e
+    if m < 1:
+        raise WireError(f"The field degree `m` must be positive, not {m}.")
+    return m
+
+
+def _element(value: Any, input_type: Any, m: int) -> Element:
+    if not isinstance(value, (bytes, str)):
+        raise WireError("Polynomials must be bytes or strings.")
+    if isinstance(value, str) and input_type not in INPUT_BASES:
+        raise WireError("Invalid input type. Must be 'binary' or 'hexadecimal'.")
+    return parse(value, input_type, m)
+
+
+def decode_body(
+    wire_format: str,
+    body: bytes,
+    query: Mapping[str, str],
+    model: type[BaseModel],
+) -> dict[str, Any]:
+    """
+    Decodes a binary request body into the fields of a request model.
+
+    A msgpack or CBOR body is a map of the request fields, `m` included, in which
+    polynomials are big-endian bytes or strings in the `input_type` of the map.
+    A raw `application/octet-stream` body is the concatenation of the
+    polynomials as fixed-width big-endian bytes, in the order of the model
+    fields, with the other fields, `m` included, passed as query parameters.
+    List fields share the elements of the body equally. The polynomials are
+    parsed straight into elements of the field.
+
+    Args:
+        wire_format (str): The wire format of the body.
+        body (bytes): The request body.
+        query (Mapping[str, str]): The query parameters of the request.
+        model (type[BaseModel]): The request model of the route.
+
+    Returns:
+        dict[str, Any]: The request fields, with every polynomial as a
+        `codec.Element`, to be validated by the `wire_model` of the request model.
+
+    Raises:
+        WireError: If the body does not match the request model.
+        ValueError: If a polynomial is not an element of the field.
+    """
+    fields = _poly_fields(model)
+    if wire_format != "octet-stream":
+        try:
+            content = _loads(wire_format, body)
+        except Exception as e:
+            raise WireError(f"The body is not valid {wire_format}: {e}") from e
+        if not isinstance(content, dict):
+            raise WireError("The body must be a map of the request fields.")
+        m = _degree(content.get("m"), "in the body")
+        input_type = content.get("input_type", "hexadecimal")
+        for name in fields:
+            value = content.get(name)
+            if isinstance(value, list):
+                content[name] = [_element(item, input_type, m) for item in value]
+            elif value is not None:
+                content[name] = _element(value, input_type, m)
+        return content
+
+    content = dict(query)
+    m = _degree(content.get("m"), "as a query parameter")
+    width = bounds(m).byte_width
+    if len(body) % width:
+        raise WireError(f"The body must hold elements of {width} bytes.")
+    items = [parse(body[i : i + width], None, m) for i in range(0, len(body), width)]
+
+    lists = [name for name, is_list in fields.items() if is_list]
+    scalars = [name for name, is_list in fields.items() if not is_list]
+    if lists:
+        if len(items) % len(lists):
+            raise WireError(f"The body must hold {len(lists)} lists of equal length.")
+        size = len(items) // len(lists)
+        for index, name in enumerate(lists):
+            content[name] = items[index * size : (index + 1) * size]
+    elif len(items) > len(scalars):
+        raise WireError(f"The body must hold at most {len(scalars)} elements.")
+    else:
+        content.update(zip(scalars, items))
+    return content
+
+
+def _data(key: str, value: Any, to_wire: Callable[[int], Any]) -> dict[str, Any]:
+    # The response data of a service result, with every integer encoded
+    if key == "result":
+        return {"result": to_wire(value)}
+    return {
+        "results": [
+            (
+                {"result": None, "error": str(item)}
+                if isinstance(item, ValueError)
+                else {"result": to_wire(item), "error": None}
+            )
+            for item in value
+        ]
+    }
+
+
+def encode_response(
+    wire_format: str,
+    status_code: int,
+    message: str,
+    data: dict[str, Any],
+    m: int,
+) -> Response:
+    """
+    Encodes the outcome of a route in a binary wire format.
+
+    A msgpack or CBOR body keeps the `{"message", "data"}` layout. A raw
+    `application/octet-stream` body is the result, or the concatenation of the
+    batch results in which a failed item is left as zero bytes and listed in the
+    `X-Failed-Items` header; errors stay JSON.
+
+    Args:
+        wire_format (str): The wire format of the response.
+        status_code (int): The HTTP status code.
+        message (str): The message of the response.
+        data (dict[str, Any]): The response data, with results as fixed-width
+            big-endian bytes.
+        m (int): The degree of the field of the request.
+
+    Returns:
+        Response: The encoded response.
+    """
+    media_type = MEDIA_TYPES[wire_format]
+    if wire_format != "octet-stream":
+        content = {"message": message, "data": data}
+        return Response(
+            _dumps(wire_format, content), status_code=status_code, media_type=media_type
+        )
+
+    if status_code < 400 and data.get("result") is not None:
+        return Response(data["result"], status_code=status_code, media_type=media_type)
+    if status_code < 400 and data.get("results") is not None:
+        empty = bytes(bounds(m).byte_width)
+        failed = [str(i) for i, item in enumerate(data["results"]) if item["error"]]
+        return Response(
+            b"".join(item["result"] or empty for item in data["results"]),
+            status_code=status_code,
+            media_type=media_type,
+            headers={"X-Failed-Items": ",".join(failed)} if failed else None,
+        )
+    return APIResponse(status_code=status_code, message=message, data=data)
+
+
+class WireRoute(APIRoute):
+    """
+    Route that also speaks the binary wire formats.
+
+    Requests with an `application/octet-stream`, msgpack or CBOR body, and
+    requests whose `Accept` header lists a binary format first, skip the route
+    handler: the polynomials are decoded straight into elements, validated by
+    the `wire_model` of the request model, and handed to the service the route
+    registered through `wire_service`, whose integer results are encoded
+    straight to bytes. Plain JSON requests, and routes without a service, go
+    through the handler untouched. The time from the start of the handler to the
+    call of the endpoint or service, in which the body is read and validated, is
+    recorded as the `validate` stage.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        endpoint = self.dependant.call
+        if asyncio.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+                started = _handler_started.get()
+                if started:
+                    metrics.record("validate", time.perf_counter() - started)
+                return await endpoint(*args, **kwargs)
+
+            self.dependant.call = timed_endpoint
+        handler = super().get_route_handler()
+        model = self.body_field.type_ if self.body_field is not None else None
+        binary_model = wire_model(model) if model is not None else BaseModel
+
+        async def wire_handler(request: Request) -> Response:
+            _handler_started.set(time.perf_counter())
+            request_format = content_format(request.headers.get("content-type"))
+            response_format = accept_format(request.headers.get("accept"))
+            # Services register once the route handlers are defined
+            service = _services.get(self.endpoint)
+            if model is None or (request_format is None and response_format is None):
+                return await handler(request)
+            if request_format is not None and not available(request_format):
+                return APIResponse(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    message=f"Unsupported media type. Install {_MODULES[request_format]} to send {request_format} bodies.",
+                    data={"result": None},
+                )
+            if service is None:
+                if request_format is None:
+                    return await handler(request)
+                return APIResponse(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    message="Unsupported media type. This route only accepts JSON bodies.",
+                    data={"result": None},
+                )
+
+            empty = {service.key: None}
+            body = await request.body()
+            try:
+                if request_format is None:
+                    parsed = model.model_validate_json(body)
+                else:
+                    content = decode_body(
+                        request_format, body, request.query_params, model
+                    )
+                    parsed = binary_model.model_validate(content)
+            except WireError as e:
+                return APIResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message=str(e),
+                    data=empty,
+                )
+            except ValidationError as e:
+                if request_format is None:
+                    # Malformed JSON is reported by the route itself
+                    return await handler(request)
+                raise RequestValidationError(
+                    [
+                        {**error, "loc": ("body", *error["loc"])}
+                        for error in e.errors(include_url=False)
+                    ]
+                ) from e
+            except ValueError as e:
+                return APIResponse(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    message=str(e),
+                    data=empty,
+                )
+
+            m: int = getattr(parsed, "m")
+            input_type = getattr(parsed, "input_type", "hexadecimal")
+            output_type = getattr(parsed, "output_type", "hexadecimal")
+            if input_type not in INPUT_BASES:
+                return APIResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+                    data=empty,
+                )
+            to_wire: Callable[[int], Any]
+            if response_format is not None:
+                to_wire = bounds(m).to_bytes
+            elif output_type in OUTPUT_TYPES:
+                to_wire = functools.partial(encode, output_type=output_type, m=m)
+            else:
+                return APIResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
+                    data=empty,
+                )
+
+            metrics.record("validate", time.perf_counter() - _handler_started.get())
+            bypass = request.headers.get("x-cache-bypass", "").lower() in _TRUE
+            status_code = status.HTTP_200_OK
+            message = service.message
+            try:
+                value = await service.call(parsed, bypass, **request.path_params)
+                with span("encode"):
+                    data = _data(service.key, value, to_wire)
+            except ValueError as e:
+                status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+                message, data = str(e), empty
+            except ExecutorBusyError as e:
+                status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+                message, data = str(e), empty
+            except Exception as e:
+                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                message, data = str(e), empty
+
+            if response_format is None:
+                return APIResponse(status_code=status_code, message=message, data=data)
+            return encode_response(response_format, status_code, message, data, m)
+
+        return wire_handler
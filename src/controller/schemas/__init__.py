@@ -1,4 +1,19 @@
+from .batchInverseRequest import BatchInverseRequest
+from .batchOperationRequest import BatchOperationRequest
+from .evaluateRequest import EvaluateRequest
+from .fixedBaseRequest import FixedBaseRequest
 from .inverseRequest import InverseRequest
 from .operationRequest import OperationRequest
+from .powerRequest import PowerRequest
+from .squareRequest import SquareRequest
 
-__all__ = ["InverseRequest", "OperationRequest"]
\ No newline at end of file
+__all__ = [
+    "BatchInverseRequest",
+    "BatchOperationRequest",
+    "EvaluateRequest",
+    "FixedBaseRequest",
+    "InverseRequest",
+    "OperationRequest",
+    "PowerRequest",
+    "SquareRequest",
+]
@@ -0,0 +1,14 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchInverseRequest(BaseModel):
+    poly: list[str] = Field(description="Polynomials to invert")
+    input_type: str = Field("hexadecimal", description="Type of input data")
+    output_type: str = Field("hexadecimal", description="Type of output data")
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class BatchOperationRequest(BaseModel):
+    poly1: list[str] = Field(description="First polynomial of every operand pair")
+    poly2: list[str] = Field(description="Second polynomial of every operand pair")
+    input_type: str = Field("hexadecimal", description="Type of input data")
+    output_type: str = Field("hexadecimal", description="Type of output data")
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "BatchOperationRequest":
+        if len(self.poly1) != len(self.poly2):
+            raise ValueError("poly1 and poly2 must have the same length")
+        return self
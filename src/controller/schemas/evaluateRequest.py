@@ -0,0 +1,19 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class EvaluateRequest(BaseModel):
+    expression: str = Field(
+        description="Expression over named variables, e.g. (a*b + c) / d"
+    )
+    bindings: list[dict[str, str]] = Field(
+        description="Polynomial value of every variable, one mapping per evaluation"
+    )
+    input_type: str = Field("hexadecimal", description="Type of input data")
+    output_type: str = Field("hexadecimal", description="Type of output data")
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class FixedBaseRequest(BaseModel):
+    poly: str = Field(description="Base polynomial")
+    input_type: str = Field("hexadecimal", description="Type of input data")
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
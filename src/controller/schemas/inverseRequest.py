@@ -1,10 +1,16 @@
-from typing import Union
+from typing import Optional, Union
+
 from pydantic import BaseModel, Field
 
 from src.common.utils.types import BinStr, HexStr
 
+
 class InverseRequest(BaseModel):
     poly: str = Field(description="Polynomial")
     input_type: str = Field("hexadecimal", description="Type of input data")
     output_type: str = Field("hexadecimal", description="Type of output data")
-    m: int = Field(description="Modulus value for the operation")
\ No newline at end of file
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
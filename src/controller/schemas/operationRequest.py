@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -7,3 +9,7 @@ class OperationRequest(BaseModel):
     input_type: str = Field("hexadecimal", description="Type of input data")
     output_type: str = Field("hexadecimal", description="Type of output data")
     m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class PowerRequest(BaseModel):
+    poly: Optional[str] = Field(
+        None,
+        description="Base polynomial; with base_id, rebuilds the base on workers that have not registered it",
+    )
+    base_id: Optional[str] = Field(None, description="Identifier of a registered base")
+    exponent: int = Field(description="Exponent, negative values invert the base")
+    input_type: str = Field("hexadecimal", description="Type of input data")
+    output_type: str = Field("hexadecimal", description="Type of output data")
+    m: int = Field(description="Modulus value for the operation")
+    modulus: Optional[str] = Field(
+        default=None,
+        description="Reduction polynomial in hexadecimal or a standard curve name such as B-163",
+    )
+
+    @model_validator(mode="after")
+    def check_base(self) -> "PowerRequest":
+        if self.poly is None and self.base_id is None:
+            raise ValueError("Provide poly, base_id or both")
+        return self
@@ -1,12 +1,26 @@
+import os
+import time
+
 from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
 
+from src.common.profiling import metrics
 from src.common.responses import APIResponse, APIResponseModel
+from src.core.cache import result_cache
+from src.core.executor import executor
+from src.core.expression import compile_expression
+from src.core.fields import field_registry, table_store
+from src.core.fields.exponentiation import fixed_bases
+from src.core.fields.reduction import reducer_for
+from src.core.warmup import compiled_kernels, warmup
 
 status_router = APIRouter(
     prefix="/status",
     tags=["Status"],
 )
 
+_started_at = time.time()
+
 
 @status_router.get(
     "",
@@ -29,3 +43,169 @@ async def status_check() -> APIResponse:
         message="Status check successful",
         status_code=status.HTTP_200_OK,
     )
+
+
+@status_router.get(
+    "/live",
+    response_class=APIResponse,
+    response_model=APIResponseModel,
+    response_description="Liveness check",
+)
+async def live_check() -> APIResponse:
+    """
+    Endpoint to check that the worker process is up and its event loop responsive.
+
+    Returns:
+        APIResponse: An API response object containing the process id and uptime.
+    """
+    return APIResponse(
+        message="Worker is alive",
+        status_code=status.HTTP_200_OK,
+        data={"pid": os.getpid(), "uptime": time.time() - _started_at},
+    )
+
+
+@status_router.get(
+    "/ready",
+    response_class=APIResponse,
+    response_model=APIResponseModel,
+    response_description="Readiness check",
+    responses={
+        status.HTTP_200_OK: {"description": "Worker is warm and accepting work"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Worker is warming up or its executor queue is full"
+        },
+    },
+)
+async def ready_check() -> APIResponse:
+    """
+    Endpoint to check whether the worker should receive traffic.
+
+    The worker is ready once the warm-up, which runs in the background after
+    startup, has built the preloaded fields and compiled the kernels, and as
+    long as its executor queue has room.
+
+    Returns:
+        APIResponse: An API response object with status 200 when ready and 503
+        otherwise, containing the warm-up timings, the built fields, the compiled
+        kernels, the executor queue depth and the cache sizes.
+    """
+    registry = field_registry.stats()
+    cache = result_cache.stats()
+    queue_full = executor.pending >= executor.max_queue
+    ready = warmup.ready and not queue_full
+    if ready:
+        message = "Worker is ready"
+    elif not warmup.ready:
+        message = "Worker is warming up"
+    else:
+        message = "Worker is saturated"
+    return APIResponse(
+        message=message,
+        status_code=(
+            status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        data={
+            "ready": ready,
+            "warmup": {"done": warmup.ready, "timings": warmup.timings},
+            "fields": [
+                {"m": field["m"], "irreducible_poly": field["irreducible_poly"]}
+                for field in registry["fields"]
+            ],
+            "kernels": compiled_kernels(),
+            "executor": {
+                "queue_depth": executor.pending,
+                "max_queue": executor.max_queue,
+            },
+            "caches": {
+                "results": cache["entries"],
+                "result_bytes": cache["bytes"],
+                "native_fields": registry["native_size"],
+                "reducers": reducer_for.cache_info().currsize,
+                "expressions": compile_expression.cache_info().currsize,
+                "fixed_bases": len(fixed_bases),
+                "shared_tables": len(table_store),
+            },
+        },
+    )
+
+
+@status_router.get(
+    "/fields",
+    response_class=APIResponse,
+    response_model=APIResponseModel,
+    response_description="Field registry statistics",
+)
+async def fields_status() -> APIResponse:
+    """
+    Endpoint to report the Galois field registry counters.
+
+    Returns:
+        APIResponse: An API response object containing the registry hit/miss/build-time
+        counters and the fields currently built.
+    """
+    return APIResponse(
+        message="Field registry statistics retrieved successfully!",
+        status_code=status.HTTP_200_OK,
+        data=field_registry.stats(),
+    )
+
+
+@status_router.get(
+    "/executor",
+    response_class=APIResponse,
+    response_model=APIResponseModel,
+    response_description="Operation executor statistics",
+)
+async def executor_status() -> APIResponse:
+    """
+    Endpoint to report the operation executor counters.
+
+    Returns:
+        APIResponse: An API response object containing the executor mode, queue depth
+        and the time offloaded operations spent waiting for a worker.
+    """
+    return APIResponse(
+        message="Executor statistics retrieved successfully!",
+        status_code=status.HTTP_200_OK,
+        data=executor.stats(),
+    )
+
+
+@status_router.get(
+    "/cache",
+    response_class=APIResponse,
+    response_model=APIResponseModel,
+    response_description="Result cache statistics",
+)
+async def cache_status() -> APIResponse:
+    """
+    Endpoint to report the operation result cache counters.
+
+    Returns:
+        APIResponse: An API response object containing the cache size, memory usage
+        and hit rate.
+    """
+    return APIResponse(
+        message="Result cache statistics retrieved successfully!",
+        status_code=status.HTTP_200_OK,
+        data=result_cache.stats(),
+    )
+
+
+@status_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    response_description="Request and stage duration histograms",
+)
+async def metrics_status() -> PlainTextResponse:
+    """
+    Endpoint to expose the request and stage duration histograms to Prometheus.
+
+    Returns:
+        PlainTextResponse: The histograms in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4",
+    )
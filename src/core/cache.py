@@ -0,0 +1,229 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+from src.config import Config
+from src.core.executor import executor
+
+T = TypeVar("T")
+
+CacheKey = tuple[Hashable, ...]
+
+# Rough per-entry cost of the dictionary slot, linked-list node and tuples
+ENTRY_OVERHEAD = 200
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Memoizes operation results by their canonical operands.
+
+    Entries are kept in least-recently-used order and expire `ttl` seconds after
+    they were stored. The cache is bounded by the estimated memory used by its
+    keys and values rather than by the number of entries.
+
+    Attributes:
+        enabled (bool): Whether results are cached at all.
+        max_bytes (int): The memory budget of the cache, in bytes.
+        ttl (float): The lifetime of an entry, in seconds.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = Config.CACHE.ENABLED,
+        max_bytes: int = Config.CACHE.MAX_BYTES,
+        ttl: float = Config.CACHE.TTL,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            enabled (bool, optional): Whether results are cached. Defaults to
+                `Config.CACHE.ENABLED`.
+            max_bytes (int, optional): The memory budget in bytes. Defaults to
+                `Config.CACHE.MAX_BYTES`.
+            ttl (float, optional): The lifetime of an entry in seconds. Defaults
+                to `Config.CACHE.TTL`.
+        """
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, tuple[float, int, Any]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(
+        operation: str,
+        m: int,
+        modulus: Optional[int],
+        operands: tuple[int, ...],
+        *params: Hashable,
+    ) -> CacheKey:
+        """
+        Builds the cache key of an operation from its parsed operands.
+
+        Args:
+            operation (str): The operation name.
+            m (int): The degree of the field.
+            modulus (int, optional): The reduction polynomial, for the operations
+                whose result depends on it.
+            operands (tuple[int, ...]): The operands, as parsed by `src.core.codec`,
+                so every spelling of the same element shares an entry.
+            *params (Hashable): Further non-polynomial arguments of the operation.
+
+        Returns:
+            CacheKey: The key.
+        """
+        return (operation, m, modulus, operands, *params)
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """
+        Looks up a result.
+
+        Args:
+            key (CacheKey): The key built by `key`.
+
+        Returns:
+            tuple[bool, Any]: Whether the key was found and its result.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            stored_at, size, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """
+        Stores a result, evicting the least recently used entries over budget.
+
+        Args:
+            key (CacheKey): The key built by `key`.
+            value (Any): The result.
+        """
+        size = _size(key) + _size(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (time.monotonic(), size, value)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict[str, Any]: Whether the cache is enabled, its size in entries and
+            bytes, and the hit, miss, bypass, eviction and expiration counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.bypassed = 0
+            self.evictions = 0
+            self.expirations = 0
+
+
+result_cache = ResultCache()
+
+
+async def cached_run(
+    bypass: bool,
+    operation: str,
+    m: int,
+    modulus: Optional[int],
+    operands: tuple[int, ...],
+    fn: Callable[..., T],
+    *args: Any,
+    params: tuple[Hashable, ...] = (),
+) -> T:
+    """
+    Runs an operation through the executor, memoizing its result when the cache is enabled.
+
+    The cache key is built from `operation`, `m`, `modulus`, `operands` and
+    `params` (see `ResultCache.key`), and only when the cache is enabled.
+
+    Args:
+        bypass (bool): Whether to skip the lookup for this request. The fresh
+            result is still stored.
+        operation (str): The operation name.
+        m (int): The degree of the field the operation runs in.
+        modulus (int, optional): The reduction polynomial, for the operations
+            whose result depends on it.
+        operands (tuple[int, ...]): The parsed operands.
+        fn (Callable[..., T]): The service function.
+        *args (Any): The arguments of `fn`.
+        params (tuple[Hashable, ...], optional): Further non-polynomial arguments
+            of the operation that are part of the key.
+
+    Returns:
+        T: The result of `fn(*args)`.
+
+    Raises:
+        ExecutorBusyError: If the operation is offloaded and the executor is full.
+    """
+    if not result_cache.enabled:
+        return await executor.run(operation, m, fn, *args)
+
+    cache_key = result_cache.key(operation, m, modulus, operands, *params)
+    if bypass:
+        result_cache.bypassed += 1
+    else:
+        hit, value = result_cache.get(cache_key)
+        if hit:
+            return value  # type: ignore[no-any-return]
+
+    value = await executor.run(operation, m, fn, *args)
+    result_cache.put(cache_key, value)
+    return value
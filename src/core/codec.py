@@ -0,0 +1,196 @@
+import base64
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
+
+INPUT_BASES = {"binary": 2, "hexadecimal": 16}
+OUTPUT_TYPES = ("binary", "hexadecimal", "base64")
+
+
+class FieldBounds:
+    """
+    Constants of GF(2^m) needed to validate and encode its elements.
+
+    Attributes:
+        m (int): The degree of the field extension.
+        order (int): The number of elements of the field, `2^m`.
+        byte_width (int): The number of bytes of an encoded element, `ceil(m / 8)`.
+        hex_width (int): The number of hexadecimal digits of an encoded element,
+            `ceil(m / 4)`.
+    """
+
+    __slots__ = ("m", "order", "byte_width", "hex_width", "_hex_skip")
+
+    def __init__(self, m: int) -> None:
+        """
+        Initialize the bounds of a field.
+
+        Args:
+            m (int): The degree of the field extension.
+        """
+        self.m = m
+        self.order = 1 << m
+        self.byte_width = (m + 7) // 8
+        self.hex_width = (m + 3) // 4
+        # bytes.hex() yields two digits per byte; at most one leading digit is padding
+        self._hex_skip = 2 * self.byte_width - self.hex_width
+
+    def check(self, value: int) -> int:
+        """
+        Validates that an integer is an element of the field.
+
+        Args:
+            value (int): The integer to validate.
+
+        Returns:
+            int: The validated element.
+
+        Raises:
+            ValueError: If the value is outside `0 <= x < 2^m`.
+        """
+        if not 0 <= value < self.order:
+            raise ValueError(
+                f"GF(2^{self.m}) scalars must be in `0 <= x < {self.order}`, not {value}."
+            )
+        return value
+
+    def to_bytes(self, value: int) -> bytes:
+        """
+        Encodes an element as big-endian bytes.
+
+        Args:
+            value (int): The element.
+
+        Returns:
+            bytes: `byte_width` bytes, most significant first.
+        """
+        return value.to_bytes(self.byte_width, "big")
+
+    def to_hex(self, value: int) -> str:
+        """
+        Encodes an element as lowercase hexadecimal digits.
+
+        Args:
+            value (int): The element.
+
+        Returns:
+            str: `hex_width` digits, zero-padded.
+        """
+        return value.to_bytes(self.byte_width, "big").hex()[self._hex_skip :]
+
+    def to_binary(self, value: int) -> str:
+        """
+        Encodes an element as binary digits.
+
+        Args:
+            value (int): The element.
+
+        Returns:
+            str: `m` digits, zero-padded.
+        """
+        return bin(value)[2:].zfill(self.m)
+
+    def to_base64(self, value: int) -> str:
+        """
+        Encodes an element as base64 of its big-endian bytes.
+
+        Args:
+            value (int): The element.
+
+        Returns:
+            str: The base64 text of `to_bytes(value)`.
+        """
+        return base64.b64encode(value.to_bytes(self.byte_width, "big")).decode("ascii")
+
+
+@lru_cache(maxsize=None)
+def bounds(m: int) -> FieldBounds:
+    """
+    Returns the cached bounds of GF(2^m).
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        FieldBounds: The bounds, computed once per `m`.
+    """
+    return FieldBounds(m)
+
+
+class Element(NamedTuple):
+    """
+    A validated element of GF(2^m).
+
+    Attributes:
+        value (int): The element, whose bits are the polynomial coefficients.
+        m (int): The degree of the field it was validated against.
+    """
+
+    value: int
+    m: int
+
+
+Operand = Union[str, int, bytes, Element]
+
+
+def parse(poly: Operand, input_type: Optional[str], m: int) -> Element:
+    """
+    Parses an operand into a validated element of GF(2^m).
+
+    Strings are read in the base given by `input_type`. Integers and big-endian
+    bytes are taken as they are, so internal callers skip string parsing, and
+    elements already validated for `m` are returned unchanged.
+
+    Args:
+        poly (Operand): The operand, as a binary or hexadecimal string, an
+            integer, big-endian bytes or an `Element`.
+        input_type (str, optional): The format of string operands ('binary' or
+            'hexadecimal'); ignored for the other operand types.
+        m (int): The degree of the field.
+
+    Returns:
+        Element: The validated element.
+
+    Raises:
+        ValueError: If the input type is invalid, conversion fails or the value
+            is outside the field.
+    """
+    if isinstance(poly, Element):
+        if poly.m == m:
+            return poly
+        value = poly.value
+    elif isinstance(poly, str):
+        base = INPUT_BASES.get(input_type or "")
+        if base is None:
+            raise ValueError("Invalid input type. Must be 'binary' or 'hexadecimal'.")
+        value = int(poly, base)
+    elif isinstance(poly, bytes):
+        value = int.from_bytes(poly, "big")
+    else:
+        value = poly
+    return Element(bounds(m).check(value), m)
+
+
+def encode(value: int, output_type: str, m: int) -> str:
+    """
+    Encodes an element of GF(2^m) for a response.
+
+    Args:
+        value (int): The element.
+        output_type (str): One of `OUTPUT_TYPES`.
+        m (int): The degree of the field, which fixes the width of the encoding.
+
+    Returns:
+        str: The zero-padded binary or hexadecimal digits, or the base64 text
+        of the big-endian bytes.
+
+    Raises:
+        ValueError: If the output type is invalid.
+    """
+    field = bounds(m)
+    if output_type == "hexadecimal":
+        return field.to_hex(value)
+    if output_type == "binary":
+        return field.to_binary(value)
+    if output_type == "base64":
+        return field.to_base64(value)
+    raise ValueError(f"Invalid output type. Must be one of {OUTPUT_TYPES}.")
@@ -0,0 +1,234 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from src.common.profiling import metrics, span
+from src.config import Config
+from src.core.warmup import warmup
+
+T = TypeVar("T")
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+
+class ExecutorBusyError(RuntimeError):
+    """
+    Raised when an operation is submitted while the executor queue is full.
+    """
+
+
+def warm_worker() -> None:
+    """
+    Warms a spawned pool worker up before it takes any operation.
+
+    A spawned worker starts from a fresh interpreter, so without it the first
+    operations sent to every worker would import the backends, build the
+    preloaded fields and compile the kernels. Being a module-level function, it
+    runs the `warmup` of the worker itself.
+    """
+    warmup.run()
+
+
+def _timed_call(fn: Callable[..., T], args: tuple[Any, ...]) -> tuple[float, T]:
+    # Runs in the worker; the start time measures how long the call queued
+    return time.time(), fn(*args)
+
+
+class OperationExecutor:
+    """
+    Runs field operations either inline on the event loop or in a worker pool.
+
+    Cheap operations run inline. Operations listed in `heavy_operations` whose
+    field degree is at least the configured threshold are sent to a thread or
+    process pool, so a slow inversion does not stall the event loop. Stateful
+    operations, which update objects of the caller, always run in a thread of
+    this process. At most
+    `max_queue` offloaded operations may be pending at once; further
+    submissions are rejected with `ExecutorBusyError`.
+
+    Attributes:
+        mode (str): `"inline"`, `"thread"` or `"process"`.
+        max_workers (int): The number of pool workers.
+        max_queue (int): The maximum number of pending offloaded operations.
+        heavy_operations (dict[str, int]): The minimum degree `m` from which each
+            operation is offloaded.
+        initializer (Callable[[], None], optional): Called once in every worker
+            process, to warm it up before it takes operations.
+    """
+
+    def __init__(
+        self,
+        mode: str = Config.EXECUTOR.MODE,
+        max_workers: int = Config.EXECUTOR.MAX_WORKERS,
+        max_queue: int = Config.EXECUTOR.MAX_QUEUE,
+        heavy_operations: Optional[dict[str, int]] = None,
+        initializer: Optional[Callable[[], None]] = warm_worker,
+    ) -> None:
+        """
+        Initialize the executor. The worker pool is created on first use.
+
+        Args:
+            mode (str, optional): The execution mode. Defaults to `Config.EXECUTOR.MODE`.
+            max_workers (int, optional): The number of pool workers.
+                Defaults to `Config.EXECUTOR.MAX_WORKERS`.
+            max_queue (int, optional): The maximum number of pending offloaded
+                operations. Defaults to `Config.EXECUTOR.MAX_QUEUE`.
+            heavy_operations (dict[str, int], optional): The offload threshold of
+                every heavy operation. Defaults to `Config.EXECUTOR.HEAVY_OPERATIONS`.
+            initializer (Callable[[], None], optional): Called once in every worker
+                process before it takes operations. Defaults to `warm_worker`.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Invalid executor mode. Must be one of {EXECUTOR_MODES}.")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.initializer = initializer
+        self.heavy_operations = (
+            Config.EXECUTOR.HEAVY_OPERATIONS
+            if heavy_operations is None
+            else heavy_operations
+        )
+        self._pool: Optional[Executor] = None
+        self._threads: Optional[Executor] = None
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.inline = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def should_offload(self, operation: str, m: int) -> bool:
+        """
+        Decides whether an operation runs in the worker pool.
+
+        Args:
+            operation (str): The operation name.
+            m (int): The degree of the field the operation runs in.
+
+        Returns:
+            bool: `True` if the operation is sent to the pool.
+        """
+        if self.mode == "inline":
+            return False
+        threshold = self.heavy_operations.get(operation)
+        return threshold is not None and m >= threshold
+
+    async def run(
+        self,
+        operation: str,
+        m: int,
+        fn: Callable[..., T],
+        *args: Any,
+        stateful: bool = False,
+    ) -> T:
+        """
+        Runs `fn(*args)` inline or in the worker pool.
+
+        Args:
+            operation (str): The operation name, used to pick where it runs.
+            m (int): The degree of the field the operation runs in.
+            fn (Callable[..., T]): The function to call. It must be picklable in
+                `"process"` mode, unless `stateful` is set.
+            *args (Any): The arguments of `fn`.
+            stateful (bool, optional): Whether `fn` updates objects of the caller,
+                so it must run in this process. It then runs in a thread pool in
+                `"process"` mode too. Defaults to `False`.
+
+        Returns:
+            T: The return value of `fn`.
+
+        Raises:
+            ExecutorBusyError: If `max_queue` operations are already pending.
+        """
+        if not self.should_offload(operation, m):
+            self.inline += 1
+            with span("compute"):
+                return fn(*args)
+
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorBusyError("Too many pending operations. Try again later.")
+
+        self.pending += 1
+        self.submitted += 1
+        submitted_at = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            pool = (
+                self._get_threads()
+                if stateful and self.mode == "process"
+                else self._get_pool()
+            )
+            started_at, result = await loop.run_in_executor(pool, _timed_call, fn, args)
+        finally:
+            self.pending -= 1
+
+        wait = max(started_at - submitted_at, 0.0)
+        metrics.record("queue", wait)
+        metrics.record("compute", max(time.time() - started_at, 0.0))
+        self.completed += 1
+        self.wait_time += wait
+        self.max_wait_time = max(self.max_wait_time, wait)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the executor counters.
+
+        Returns:
+            dict[str, Any]: The mode, queue depth, submission counters and the
+            time offloaded operations spent waiting for a worker, in seconds.
+        """
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self.pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "inline": self.inline,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker pool, waiting for running operations to finish.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                # Forking a process that has loaded the JIT runtime is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                )
+            else:
+                self._pool = self._get_threads()
+        return self._pool
+
+    def _get_threads(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="field-worker"
+            )
+        return self._threads
+
+
+executor = OperationExecutor()
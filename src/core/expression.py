@@ -0,0 +1,354 @@
+import ast
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Union
+
+from src.config import Config
+from src.core.codec import bounds
+from src.core.fields.exponentiation import sliding_window_pow
+from src.core.fields.inversion import INVERSION_METHODS, batch_invert
+from src.core.fields.native import NativeField
+from src.core.fields.reduction import reducer_for
+
+# Operations whose operands can be reordered without changing the result
+COMMUTATIVE = ("add", "mul")
+
+
+class Instruction(NamedTuple):
+    """
+    One operation of a compiled expression.
+
+    Attributes:
+        op (str): `add`, `mul`, `sqr`, `pow`, `mod` or `inv`.
+        args (tuple[int, ...]): The slots of the operands.
+        exponent (int): The exponent of `pow`, and 0 for the other operations.
+    """
+
+    op: str
+    args: tuple[int, ...]
+    exponent: int = 0
+
+
+class Program:
+    """
+    An expression over GF(2^m) compiled to a list of operations.
+
+    The value table of an evaluation holds the variables, then the constants,
+    then the result of every instruction. Identical subexpressions are compiled
+    once, subtraction becomes addition and every division `a / b` becomes
+    `a * inv(b)`. The instructions are split into stages so that all the
+    inversions of a stage, for every binding, share one batched inversion.
+
+    Attributes:
+        variables (tuple[str, ...]): The names of the free variables, in slot order.
+        constants (tuple[int, ...]): The literal elements of the expression.
+        instructions (tuple[Instruction, ...]): The operations, in dependency order.
+        output (int): The slot of the result.
+        stages (tuple[tuple[tuple[int, ...], tuple[int, ...]], ...]): For every
+            stage, the inversions computed together and then the other
+            instructions, as instruction indices.
+    """
+
+    def __init__(
+        self,
+        variables: tuple[str, ...],
+        constants: tuple[int, ...],
+        instructions: tuple[Instruction, ...],
+        output: int,
+    ) -> None:
+        """
+        Initialize the program and schedule its inversions.
+
+        Args:
+            variables (tuple[str, ...]): The names of the free variables.
+            constants (tuple[int, ...]): The literal elements.
+            instructions (tuple[Instruction, ...]): The operations, in dependency order.
+            output (int): The slot of the result.
+        """
+        self.variables = variables
+        self.constants = constants
+        self.instructions = instructions
+        self.output = output
+
+        # The stage of a slot is the number of inversions on its longest path
+        base = len(variables) + len(constants)
+        levels = [0] * base
+        for instruction in instructions:
+            level = max((levels[arg] for arg in instruction.args), default=0)
+            levels.append(level + (instruction.op == "inv"))
+        depth = max(levels, default=0)
+        self.stages = tuple(
+            (
+                tuple(
+                    i
+                    for i, instruction in enumerate(instructions)
+                    if levels[base + i] == stage and instruction.op == "inv"
+                ),
+                tuple(
+                    i
+                    for i, instruction in enumerate(instructions)
+                    if levels[base + i] == stage and instruction.op != "inv"
+                ),
+            )
+            for stage in range(depth + 1)
+        )
+
+    @property
+    def inversions(self) -> int:
+        """
+        The number of batched inversions one evaluation performs.
+        """
+        return sum(1 for inversions, _ in self.stages if inversions)
+
+    def run(
+        self, field: NativeField, bindings: Sequence[Sequence[int]]
+    ) -> list[Union[int, ValueError]]:
+        """
+        Evaluates the program for many bindings of its variables at once.
+
+        Every instruction is applied to all the bindings before the next one,
+        and the inversions of a stage are computed with a single call to
+        `batch_invert` across instructions and bindings.
+
+        Args:
+            field (NativeField): The field to compute in.
+            bindings (Sequence[Sequence[int]]): The values of `variables`, in
+                order, for every evaluation.
+
+        Returns:
+            list[Union[int, ValueError]]: The result of every binding, in order,
+            or the error raised while computing it.
+
+        Raises:
+            ValueError: If a constant is outside the field.
+        """
+        check = bounds(field.m).check
+        count = len(bindings)
+        errors: list[Optional[ValueError]] = [None] * count
+        columns: list[list[Optional[int]]] = [
+            [binding[k] for binding in bindings] for k in range(len(self.variables))
+        ]
+        columns += [[check(constant)] * count for constant in self.constants]
+        base = len(columns)
+        columns += [[] for _ in self.instructions]
+        method = (
+            Config.FIELDS.INVERSION
+            if Config.FIELDS.INVERSION in INVERSION_METHODS
+            else "eea"
+        )
+
+        for inversions, others in self.stages:
+            if inversions:
+                values = [
+                    value or 0
+                    for i in inversions
+                    for value in columns[self.instructions[i].args[0]]
+                ]
+                inverses = batch_invert(field, values, method)
+                for n, i in enumerate(inversions):
+                    column = inverses[n * count : (n + 1) * count]
+                    for j, value in enumerate(column):
+                        if value is None and errors[j] is None:
+                            errors[j] = ValueError(
+                                "Division by zero is not allowed in Galois fields"
+                            )
+                    columns[base + i] = column
+            for i in others:
+                columns[base + i] = self._apply(
+                    field, self.instructions[i], columns, errors
+                )
+
+        return [
+            error if error is not None else value or 0
+            for error, value in zip(errors, columns[self.output])
+        ]
+
+    @staticmethod
+    def _apply(
+        field: NativeField,
+        instruction: Instruction,
+        columns: list[list[Optional[int]]],
+        errors: list[Optional[ValueError]],
+    ) -> list[Optional[int]]:
+        # One instruction for every binding; None marks a failed binding
+        a = columns[instruction.args[0]]
+        if instruction.op == "sqr":
+            return [None if x is None else field.square(x) for x in a]
+        if instruction.op == "pow":
+            column: list[Optional[int]] = []
+            for x in a:
+                column.append(
+                    None
+                    if x is None
+                    else sliding_window_pow(field, x, instruction.exponent)
+                )
+            return column
+        b = columns[instruction.args[1]]
+        if instruction.op == "add":
+            return [None if x is None or y is None else x ^ y for x, y in zip(a, b)]
+        if instruction.op == "mul":
+            return [
+                None if x is None or y is None else field.mul(x, y)
+                for x, y in zip(a, b)
+            ]
+        column = []
+        for j, (x, y) in enumerate(zip(a, b)):
+            if x is None or y is None:
+                column.append(None)
+            elif y == 0:
+                if errors[j] is None:
+                    errors[j] = ValueError("Modulo by zero is not allowed!")
+                column.append(None)
+            else:
+                column.append(reducer_for(y).reduce(x))
+        return column
+
+
+Ref = tuple[str, int]
+
+
+class _Compiler:
+    # Lowers a parsed expression to instructions, sharing identical subexpressions.
+    # Operands are referenced as ("const" | "op" | "var", index) until the slots
+    # are known.
+
+    def __init__(self) -> None:
+        self.variables: dict[str, int] = {}
+        self.constants: dict[int, int] = {}
+        self.instructions: list[tuple[str, tuple[Ref, ...], int]] = []
+        self.memo: dict[tuple[str, tuple[Ref, ...], int], Ref] = {}
+        self.names: dict[str, Ref] = {}
+
+    def emit(self, op: str, args: tuple[Ref, ...], exponent: int = 0) -> Ref:
+        if op in COMMUTATIVE:
+            args = tuple(sorted(args))
+        if op == "inv" and args[0][0] == "op":
+            inner = self.instructions[args[0][1]]
+            if inner[0] == "inv":
+                return inner[1][0]
+        key = (op, args, exponent)
+        ref = self.memo.get(key)
+        if ref is None:
+            if len(self.instructions) >= Config.EXPRESSIONS.MAX_OPERATIONS:
+                raise ValueError(
+                    f"Expressions may have at most {Config.EXPRESSIONS.MAX_OPERATIONS} operations."
+                )
+            self.instructions.append(key)
+            ref = self.memo[key] = ("op", len(self.instructions) - 1)
+        return ref
+
+    def visit(self, node: ast.AST) -> Ref:
+        if isinstance(node, ast.Name):
+            ref = self.names.get(node.id)
+            if ref is None:
+                ref = ("var", self.variables.setdefault(node.id, len(self.variables)))
+            return ref
+        if isinstance(node, ast.Constant):
+            if not isinstance(node.value, int) or isinstance(node.value, bool):
+                raise ValueError("Constants must be integer literals such as 0x1b.")
+            return ("const", self.constants.setdefault(node.value, len(self.constants)))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            # Every element is its own additive inverse in characteristic 2
+            return self.visit(node.operand)
+        if isinstance(node, ast.BinOp):
+            if isinstance(node.op, ast.Pow):
+                return self.power(node)
+            a, b = self.visit(node.left), self.visit(node.right)
+            if isinstance(node.op, (ast.Add, ast.Sub, ast.BitXor)):
+                return self.emit("add", (a, b))
+            if isinstance(node.op, ast.Mult):
+                return self.emit("sqr", (a,)) if a == b else self.emit("mul", (a, b))
+            if isinstance(node.op, ast.Div):
+                return self.emit("mul", (a, self.emit("inv", (b,))))
+            if isinstance(node.op, ast.Mod):
+                return self.emit("mod", (a, b))
+        raise ValueError(
+            f"Unsupported syntax '{ast.unparse(node)}'. Use variables, integer "
+            "literals and the operators +, -, *, /, % and ** with an integer exponent."
+        )
+
+    def power(self, node: ast.BinOp) -> Ref:
+        exponent = node.right
+        sign = 1
+        if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, ast.USub):
+            exponent, sign = exponent.operand, -1
+        if not isinstance(exponent, ast.Constant) or not isinstance(
+            exponent.value, int
+        ):
+            raise ValueError("Exponents must be integer literals.")
+        e = sign * exponent.value
+        base = self.visit(node.left)
+        if e < 0:
+            # Negative powers share the batched inversions of the divisions
+            base, e = self.emit("inv", (base,)), -e
+        if e == 1:
+            return base
+        if e == 2:
+            return self.emit("sqr", (base,))
+        return self.emit("pow", (base,), e)
+
+    def program(self, output: Ref) -> Program:
+        offsets = {
+            "var": 0,
+            "const": len(self.variables),
+            "op": len(self.variables) + len(self.constants),
+        }
+        return Program(
+            tuple(self.variables),
+            tuple(self.constants),
+            tuple(
+                Instruction(op, tuple(offsets[kind] + i for kind, i in args), exponent)
+                for op, args, exponent in self.instructions
+            ),
+            offsets[output[0]] + output[1],
+        )
+
+
+@lru_cache(maxsize=Config.EXPRESSIONS.MAX_CACHED)
+def compile_expression(expression: str) -> Program:
+    """
+    Compiles an expression over GF(2^m) into a `Program`.
+
+    An expression uses variables, integer literals such as `0x1b` and the
+    operators `+` and `-` (both addition), `*`, `/`, `%` (polynomial
+    reduction) and `**` with an integer exponent. It may be preceded by
+    assignments to name shared intermediate results, one per line or separated
+    by `;`, as in `t = a * b; t * t + c`. Programs are cached by expression,
+    so evaluating the same expression again skips compilation.
+
+    Args:
+        expression (str): The expression.
+
+    Returns:
+        Program: The compiled program.
+
+    Raises:
+        ValueError: If the expression is too long, is not valid or uses
+            unsupported syntax.
+    """
+    if len(expression) > Config.EXPRESSIONS.MAX_LENGTH:
+        raise ValueError(
+            f"Expressions must be at most {Config.EXPRESSIONS.MAX_LENGTH} characters."
+        )
+    try:
+        tree = ast.parse(expression, mode="exec")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise ValueError(f"Invalid expression: {e}") from None
+    if not tree.body or not isinstance(tree.body[-1], ast.Expr):
+        raise ValueError("Expressions must end with the value to compute.")
+
+    compiler = _Compiler()
+    try:
+        for statement in tree.body[:-1]:
+            if not (
+                isinstance(statement, ast.Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+            ):
+                raise ValueError(
+                    "Only assignments to a single name may precede the expression."
+                )
+            compiler.names[statement.targets[0].id] = compiler.visit(statement.value)
+        output = compiler.visit(tree.body[-1].value)
+    except RecursionError:
+        raise ValueError("Invalid expression: too deeply nested.") from None
+    return compiler.program(output)
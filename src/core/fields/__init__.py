@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING, Any
+
+from .moduli import AES_MODULUS, DEFAULT_MODULI, NIST_MODULI
+from .native import NativeField, clmul
+from .registry import (
+    FieldRegistry,
+    backend_for,
+    field_registry,
+    preload_fields,
+    uses_galois,
+)
+from .store import IntTable, TableStore, table_store
+from .tables import TableField, table_field
+
+if TYPE_CHECKING:
+    from .kernels import KernelField, kernel_field
+
+# The kernels import numpy and numba, so they are only loaded on first use
+_LAZY = ("KernelField", "kernel_field")
+
+__all__ = [
+    "AES_MODULUS",
+    "DEFAULT_MODULI",
+    "NIST_MODULI",
+    "FieldRegistry",
+    "IntTable",
+    "KernelField",
+    "NativeField",
+    "TableField",
+    "TableStore",
+    "backend_for",
+    "clmul",
+    "field_registry",
+    "kernel_field",
+    "preload_fields",
+    "table_field",
+    "table_store",
+    "uses_galois",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        from . import kernels
+
+        return getattr(kernels, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
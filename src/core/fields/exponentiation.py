@@ -0,0 +1,272 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from src.config import Config
+from src.core.fields.inversion import invert
+from src.core.fields.native import NativeField
+from src.core.fields.tables import TableField
+
+
+def window_size(bits: int) -> int:
+    """
+    Picks the sliding-window width for an exponent of the given length.
+
+    Args:
+        bits (int): The bit length of the exponent.
+
+    Returns:
+        int: The window width, balancing the `2^(w-1)` precomputed odd powers
+        against the multiplications saved while scanning the exponent.
+    """
+    for width, limit in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 672)):
+        if bits <= limit:
+            return width
+    return 6
+
+
+def _normalize(field: NativeField, a: int, e: int) -> tuple[int, int]:
+    # Negative exponents invert the base; the exponent of a non-zero element
+    # only matters modulo the order of the multiplicative group.
+    if e < 0:
+        a, e = invert(field, a), -e
+    if a:
+        e %= field.order - 1
+    return a, e
+
+
+def sliding_window_pow(field: NativeField, a: int, e: int) -> int:
+    """
+    Raises a field element to an integer power with sliding-window square-and-multiply.
+
+    The odd powers `a, a^3, ..., a^(2^w - 1)` are precomputed once; the exponent
+    is then scanned from its top bit, squaring for every bit and multiplying by
+    a precomputed power for every window of up to `w` bits that ends in a one.
+    A `TableField` multiplies the logarithm of `a` by `e` instead.
+
+    Args:
+        field (NativeField): The field `a` belongs to.
+        a (int): The base.
+        e (int): The exponent, which may be negative for a non-zero base.
+
+    Returns:
+        int: The power `a^e`.
+
+    Raises:
+        ValueError: If the base is zero and the exponent negative.
+    """
+    if isinstance(field, TableField):
+        return field.pow(a, e)
+    a, e = _normalize(field, a, e)
+    if e == 0:
+        return 1
+    if a == 0:
+        return 0
+
+    width = window_size(e.bit_length())
+    odd = [a]
+    if width > 1:
+        a2 = field.square(a)
+        for _ in range((1 << (width - 1)) - 1):
+            odd.append(field.mul(odd[-1], a2))
+
+    result = 1
+    i = e.bit_length() - 1
+    while i >= 0:
+        if not e >> i & 1:
+            result = field.square(result)
+            i -= 1
+            continue
+        # The longest window [j, i] of at most `width` bits that ends in a one
+        j = max(i - width + 1, 0)
+        while not e >> j & 1:
+            j += 1
+        for _ in range(i - j + 1):
+            result = field.square(result)
+        digit = (e >> j) & ((1 << (i - j + 1)) - 1)
+        result = field.mul(result, odd[digit >> 1])
+        i = j - 1
+    return result
+
+
+class FixedBase:
+    """
+    Precomputed powers of a fixed base for repeated exponentiation.
+
+    The table holds `a^(d * 2^(w*i))` for every `w`-bit digit `d` and every
+    digit position `i` of an exponent below the group order, so `a^e` costs one
+    multiplication per non-zero digit of `e` and no squarings. Bases come from
+    clients, so their tables stay in private memory, bounded by the
+    `FixedBaseRegistry`, instead of being written to the shared table store.
+
+    Attributes:
+        field (NativeField): The field the base belongs to.
+        base (int): The base.
+        width (int): The digit width `w` of the table.
+    """
+
+    def __init__(
+        self,
+        field: NativeField,
+        base: int,
+        width: int = Config.FIELDS.FIXED_BASE_WINDOW,
+    ) -> None:
+        """
+        Initialize the base and precompute its table.
+
+        Args:
+            field (NativeField): The field the base belongs to.
+            base (int): The base, a non-zero field element.
+            width (int, optional): The digit width of the table.
+                Defaults to `Config.FIELDS.FIXED_BASE_WINDOW`.
+
+        Raises:
+            ValueError: If the base is zero.
+        """
+        if base == 0:
+            raise ValueError("The fixed base must be non-zero.")
+        self.field = field
+        self.base = base
+        self.width = width
+        self._mask = (1 << width) - 1
+        self._rows = -(-field.m // width)
+        # Row i holds the 2^w digit multiples of position i, one after the other
+        self._table = self._build_table()
+
+    def pow(self, e: int) -> int:
+        """
+        Raises the base to an integer power.
+
+        Args:
+            e (int): The exponent, which may be negative.
+
+        Returns:
+            int: The power `base^e`.
+        """
+        e %= self.field.order - 1
+        result = 1
+        offset = 0
+        while e:
+            digit = e & self._mask
+            if digit:
+                result = self.field.mul(result, self._table[offset | digit])
+            e >>= self.width
+            offset += self._mask + 1
+        return result
+
+    def _build_table(self) -> list[int]:
+        table = []
+        power = self.base
+        for _ in range(self._rows):
+            row = [1, power]
+            for _ in range(self._mask - 1):
+                row.append(self.field.mul(row[-1], power))
+            table.extend(row)
+            power = self.field.mul(row[-1], power)
+        return table
+
+
+class FixedBaseRegistry:
+    """
+    Bounded LRU of the fixed bases registered by clients.
+
+    Every worker process has its own registry. Base identifiers are a hash of
+    the field and the base, so a worker that has not seen a base rebuilds its
+    table from the polynomial sent along with the identifier (see `load`).
+
+    Attributes:
+        max_size (int): The maximum number of bases kept.
+    """
+
+    def __init__(self, max_size: int = Config.FIELDS.FIXED_BASES) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_size (int, optional): The maximum number of bases kept.
+                Defaults to `Config.FIELDS.FIXED_BASES`.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._bases: OrderedDict[str, FixedBase] = OrderedDict()
+
+    @staticmethod
+    def identify(field: NativeField, base: int) -> str:
+        """
+        Returns the identifier of a base, without building its table.
+
+        Args:
+            field (NativeField): The field the base belongs to.
+            base (int): The base.
+
+        Returns:
+            str: The identifier, the same in every process.
+        """
+        key = f"{field.m}:{field.modulus:x}:{base:x}"
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def register(self, field: NativeField, base: int) -> str:
+        """
+        Precomputes the table of a base, unless it is already registered.
+
+        Args:
+            field (NativeField): The field the base belongs to.
+            base (int): The base.
+
+        Returns:
+            str: The identifier of the base, stable across processes.
+        """
+        base_id = self.identify(field, base)
+        self.load(base_id, field, base)
+        return base_id
+
+    def load(self, base_id: str, field: NativeField, base: int) -> FixedBase:
+        """
+        Returns a base, precomputing and registering its table on a miss.
+
+        Args:
+            base_id (str): The identifier of the base, see `identify`.
+            field (NativeField): The field the base belongs to.
+            base (int): The base.
+
+        Returns:
+            FixedBase: The base.
+
+        Raises:
+            ValueError: If the identifier is not the one of the base, or the
+                base is zero.
+        """
+        fixed = self.get(base_id)
+        if fixed is not None:
+            return fixed
+        if self.identify(field, base) != base_id:
+            raise ValueError(f"Base '{base_id}' is not {base:x} in GF(2^{field.m}).")
+        fixed = FixedBase(field, base)
+        with self._lock:
+            self._bases[base_id] = fixed
+            while len(self._bases) > self.max_size:
+                self._bases.popitem(last=False)
+        return fixed
+
+    def get(self, base_id: str) -> Optional[FixedBase]:
+        """
+        Returns a registered base.
+
+        Args:
+            base_id (str): The identifier returned by `register`.
+
+        Returns:
+            Optional[FixedBase]: The base, or `None` if it is unknown or was evicted.
+        """
+        with self._lock:
+            fixed = self._bases.get(base_id)
+            if fixed is not None:
+                self._bases.move_to_end(base_id)
+            return fixed
+
+    def __len__(self) -> int:
+        return len(self._bases)
+
+
+fixed_bases = FixedBaseRegistry()
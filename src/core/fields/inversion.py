@@ -0,0 +1,163 @@
+from functools import lru_cache
+from typing import Optional
+
+from src.config import Config
+from src.core.fields.native import NativeField
+from src.core.fields.tables import TableField
+
+# Native inversion algorithms; `Config.FIELDS.INVERSION` may also be "galois"
+INVERSION_METHODS = ("eea", "itoh-tsujii")
+
+
+def eea_inverse(a: int, modulus: int) -> int:
+    """
+    Inverts `a` modulo `modulus` with the binary extended Euclidean algorithm.
+
+    The algorithm keeps the invariants `g1 * a = u` and `g2 * a = v` modulo
+    `modulus`, divides `u` and `v` by `x` while they are even and subtracts
+    the lower-degree one from the other until one of them is `1`.
+
+    Args:
+        a (int): A non-zero field element.
+        modulus (int): The irreducible reduction polynomial.
+
+    Returns:
+        int: The inverse of `a`.
+    """
+    u, v = a, modulus
+    g1, g2 = 1, 0
+    while u != 1 and v != 1:
+        while not u & 1:
+            u >>= 1
+            g1 = g1 >> 1 if not g1 & 1 else (g1 ^ modulus) >> 1
+        while not v & 1:
+            v >>= 1
+            g2 = g2 >> 1 if not g2 & 1 else (g2 ^ modulus) >> 1
+        if u.bit_length() > v.bit_length():
+            u ^= v
+            g1 ^= g2
+        else:
+            v ^= u
+            g2 ^= g1
+    return g1 if u == 1 else g2
+
+
+@lru_cache(maxsize=None)
+def addition_chain(n: int) -> tuple[tuple[int, int], ...]:
+    """
+    Builds an addition chain for `n` from the binary expansion of `n`.
+
+    Each step `(i, j)` produces the chain element `i + j` from the earlier
+    elements `i` and `j`; the chain starts at `1`.
+
+    Args:
+        n (int): A positive integer.
+
+    Returns:
+        tuple[tuple[int, int], ...]: The chain steps in order.
+    """
+    steps: list[tuple[int, int]] = []
+    k = 1
+    for bit in format(n, "b")[1:]:
+        steps.append((k, k))
+        k *= 2
+        if bit == "1":
+            steps.append((k, 1))
+            k += 1
+    return tuple(steps)
+
+
+def itoh_tsujii_inverse(field: NativeField, a: int) -> int:
+    """
+    Inverts `a` with the Itoh-Tsujii algorithm.
+
+    Uses `a^-1 = (a^(2^(m-1) - 1))^2` and computes `b_k = a^(2^k - 1)` along the
+    addition chain of `m - 1` with `b_(i+j) = b_i^(2^j) * b_j`, so the cost is
+    `m - 1` squarings and one multiplication per chain step. The repeated
+    squarings of the long chain steps use the table-driven `square_k`.
+
+    Args:
+        field (NativeField): The field `a` belongs to.
+        a (int): A non-zero field element.
+
+    Returns:
+        int: The inverse of `a`.
+    """
+    powers = {1: a}
+    for i, j in addition_chain(field.m - 1):
+        powers[i + j] = field.mul(field.square_k(powers[i], j), powers[j])
+    return field.square(powers[field.m - 1])
+
+
+def invert(field: NativeField, a: int, method: Optional[str] = None) -> int:
+    """
+    Computes the multiplicative inverse of a field element.
+
+    A `TableField` always inverts with a lookup in its logarithm tables.
+
+    Args:
+        field (NativeField): The field `a` belongs to.
+        a (int): The element to invert.
+        method (str, optional): `"eea"` or `"itoh-tsujii"`. Defaults to
+            `Config.FIELDS.INVERSION`.
+
+    Returns:
+        int: The inverse of `a`.
+
+    Raises:
+        ValueError: If `a` is zero or the method is unknown.
+    """
+    if a == 0:
+        raise ValueError("Polynomial inversion is not possible for zero.")
+    if isinstance(field, TableField):
+        return field.inverse(a)
+    method = method or Config.FIELDS.INVERSION
+    if method == "eea":
+        return eea_inverse(a, field.modulus)
+    if method == "itoh-tsujii":
+        if field.m == 1:
+            return a
+        return itoh_tsujii_inverse(field, a)
+    raise ValueError(f"Invalid inversion method. Must be one of {INVERSION_METHODS}.")
+
+
+def batch_invert(
+    field: NativeField, values: list[int], method: Optional[str] = None
+) -> list[Optional[int]]:
+    """
+    Inverts many field elements with Montgomery's simultaneous inversion trick.
+
+    The running products `c_i = a_0 * ... * a_i` of the non-zero elements are
+    inverted once, then every inverse is peeled off walking backwards with
+    `a_i^-1 = c_(i-1) * c_i^-1` and `c_(i-1)^-1 = a_i * c_i^-1`. This costs a
+    single inversion plus about three multiplications per element. A
+    `TableField` looks every inverse up instead.
+
+    Args:
+        field (NativeField): The field the elements belong to.
+        values (list[int]): The elements to invert.
+        method (str, optional): The algorithm used for the single inversion.
+            Defaults to `Config.FIELDS.INVERSION`.
+
+    Returns:
+        list[Optional[int]]: The inverse of every element, in order, or `None`
+        for the elements that are zero.
+    """
+    if isinstance(field, TableField):
+        return [field.inverse(value) if value else None for value in values]
+    indices = [index for index, value in enumerate(values) if value]
+    results: list[Optional[int]] = [None] * len(values)
+    if not indices:
+        return results
+
+    products = [values[indices[0]]]
+    for index in indices[1:]:
+        products.append(field.mul(products[-1], values[index]))
+
+    inverse = invert(field, products[-1], method)
+    for k in range(len(indices) - 1, 0, -1):
+        index = indices[k]
+        results[index] = field.mul(products[k - 1], inverse)
+        inverse = field.mul(inverse, values[index])
+    results[indices[0]] = inverse
+    return results
@@ -0,0 +1,431 @@
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+from numba import njit  # type: ignore[import-untyped]
+
+from src.config import Config
+
+LIMB_BITS = 64
+
+Limbs = npt.NDArray[np.uint64]
+
+_ZERO = np.uint64(0)
+_ONE = np.uint64(1)
+_EVEN = np.uint64(0x5555555555555555)
+_SPREAD = (
+    (np.uint64(16), np.uint64(0x0000FFFF0000FFFF)),
+    (np.uint64(8), np.uint64(0x00FF00FF00FF00FF)),
+    (np.uint64(4), np.uint64(0x0F0F0F0F0F0F0F0F)),
+    (np.uint64(2), np.uint64(0x3333333333333333)),
+    (np.uint64(1), _EVEN),
+)
+
+
+def limb_count(m: int) -> int:
+    """
+    Returns the number of 64-bit limbs that hold an element of GF(2^m).
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        int: `ceil(m / 64)`.
+    """
+    return -(-m // LIMB_BITS)
+
+
+def to_limbs(values: list[int], limbs: int) -> Limbs:
+    """
+    Packs integers into a little-endian limb array.
+
+    Args:
+        values (list[int]): The non-negative integers to pack.
+        limbs (int): The number of 64-bit limbs per integer.
+
+    Returns:
+        Limbs: An array of shape `(len(values), limbs)`; limb 0 holds the lowest bits.
+    """
+    width = limbs * 8
+    data = b"".join(value.to_bytes(width, "little") for value in values)
+    return np.frombuffer(data, dtype="<u8").reshape(len(values), limbs).copy()
+
+
+def from_limbs(array: Limbs) -> list[int]:
+    """
+    Unpacks a little-endian limb array into integers.
+
+    Args:
+        array (Limbs): An array of shape `(N, limbs)`.
+
+    Returns:
+        list[int]: The `N` integers.
+    """
+    data = np.ascontiguousarray(array, dtype="<u8").tobytes()
+    width = array.shape[1] * 8
+    return [
+        int.from_bytes(data[i : i + width], "little")
+        for i in range(0, len(data), width)
+    ]
+
+
+@njit(cache=True)
+def _clmul64(a, b):
+    # Carry-less 64x64 -> 128-bit product as (low, high) words
+    low = _ZERO
+    high = _ZERO
+    for i in range(64):
+        if (b >> np.uint64(i)) & _ONE:
+            low ^= a << np.uint64(i)
+            if i:
+                high ^= a >> np.uint64(64 - i)
+    return low, high
+
+
+@njit(cache=True)
+def _spread32(x):
+    # Moves bit i of a 32-bit word to bit 2i
+    for shift, mask in _SPREAD:
+        x = (x | (x << shift)) & mask
+    return x
+
+
+@njit(cache=True)
+def _shift_right(src, shift, dst):
+    words = shift // 64
+    bits = np.uint64(shift % 64)
+    n = src.shape[0]
+    for i in range(dst.shape[0]):
+        j = i + words
+        value = src[j] >> bits if j < n else _ZERO
+        if bits and j + 1 < n:
+            value |= src[j + 1] << (np.uint64(64) - bits)
+        dst[i] = value
+
+
+@njit(cache=True)
+def _xor_shift_left(dst, src, shift):
+    words = shift // 64
+    bits = np.uint64(shift % 64)
+    n = src.shape[0]
+    for i in range(dst.shape[0] - 1, words - 1, -1):
+        j = i - words
+        value = src[j] << bits if j < n else _ZERO
+        if bits and 0 < j <= n:
+            value |= src[j - 1] >> (np.uint64(64) - bits)
+        dst[i] ^= value
+
+
+@njit(cache=True)
+def _reduce_row(t, taps, m, high, out):
+    # Folds t(x) = low(x) + x^m * high(x) into low(x) + high(x) * (f(x) - x^m)
+    # until no bit at or above m is left, then copies the result to out.
+    words = m // 64
+    bits = np.uint64(m % 64)
+    while True:
+        _shift_right(t, m, high)
+        done = True
+        for i in range(high.shape[0]):
+            if high[i]:
+                done = False
+                break
+        if done:
+            break
+        if words < t.shape[0]:
+            t[words] &= (_ONE << bits) - _ONE
+            for i in range(words + 1, t.shape[0]):
+                t[i] = _ZERO
+        for k in taps:
+            _xor_shift_left(t, high, k)
+    for i in range(out.shape[0]):
+        out[i] = t[i]
+
+
+@njit(cache=True)
+def _mul_row(a, b, taps, m, product, high, out):
+    product[:] = _ZERO
+    n = a.shape[0]
+    for i in range(n):
+        if not a[i]:
+            continue
+        for j in range(n):
+            low, carry = _clmul64(a[i], b[j])
+            product[i + j] ^= low
+            product[i + j + 1] ^= carry
+    _reduce_row(product, taps, m, high, out)
+
+
+@njit(cache=True)
+def _square_row(a, taps, m, product, high, out):
+    mask = np.uint64(0xFFFFFFFF)
+    for i in range(a.shape[0]):
+        product[2 * i] = _spread32(a[i] & mask)
+        product[2 * i + 1] = _spread32(a[i] >> np.uint64(32))
+    _reduce_row(product, taps, m, high, out)
+
+
+@njit(cache=True)
+def _invert_row(a, taps, m, chain, product, high, out):
+    # Itoh-Tsujii: b_k = a^(2^k - 1) along the binary expansion of m - 1,
+    # then a^-1 = b_(m-1)^2
+    b = a.copy()
+    t = np.empty_like(a)
+    k = 1
+    for bit in chain:
+        t[:] = b
+        for _ in range(k):
+            _square_row(t, taps, m, product, high, t)
+        _mul_row(t, b, taps, m, product, high, b)
+        k *= 2
+        if bit:
+            _square_row(b, taps, m, product, high, b)
+            _mul_row(b, a, taps, m, product, high, b)
+            k += 1
+    _square_row(b, taps, m, product, high, out)
+
+
+@njit(cache=True)
+def add_kernel(a, b):
+    """
+    Adds two batches of field elements.
+    """
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        for j in range(a.shape[1]):
+            out[i, j] = a[i, j] ^ b[i, j]
+    return out
+
+
+@njit(cache=True)
+def mul_kernel(a, b, taps, m):
+    """
+    Multiplies two batches of field elements row by row.
+    """
+    n = a.shape[1]
+    out = np.empty_like(a)
+    product = np.empty(2 * n, dtype=np.uint64)
+    high = np.empty(2 * n, dtype=np.uint64)
+    for i in range(a.shape[0]):
+        _mul_row(a[i], b[i], taps, m, product, high, out[i])
+    return out
+
+
+@njit(cache=True)
+def square_kernel(a, taps, m):
+    """
+    Squares a batch of field elements.
+    """
+    n = a.shape[1]
+    out = np.empty_like(a)
+    product = np.empty(2 * n, dtype=np.uint64)
+    high = np.empty(2 * n, dtype=np.uint64)
+    for i in range(a.shape[0]):
+        _square_row(a[i], taps, m, product, high, out[i])
+    return out
+
+
+@njit(cache=True)
+def reduce_kernel(t, taps, m, limbs):
+    """
+    Reduces a batch of polynomials of any width modulo the field polynomial.
+    """
+    out = np.empty((t.shape[0], limbs), dtype=np.uint64)
+    row = np.empty(max(t.shape[1], limbs), dtype=np.uint64)
+    high = np.empty_like(row)
+    for i in range(t.shape[0]):
+        row[:] = _ZERO
+        row[: t.shape[1]] = t[i]
+        _reduce_row(row, taps, m, high, out[i])
+    return out
+
+
+@njit(cache=True)
+def invert_kernel(a, taps, m, chain):
+    """
+    Inverts a batch of field elements with one Itoh-Tsujii inversion shared
+    through Montgomery's trick. Zero rows are left as zero.
+    """
+    count, n = a.shape
+    out = np.zeros_like(a)
+    prefix = np.empty_like(a)
+    product = np.empty(2 * n, dtype=np.uint64)
+    high = np.empty(2 * n, dtype=np.uint64)
+    nonzero = np.zeros(count, dtype=np.bool_)
+    running = np.zeros(n, dtype=np.uint64)
+    running[0] = _ONE
+    last = -1
+    for i in range(count):
+        for j in range(n):
+            if a[i, j]:
+                nonzero[i] = True
+                break
+        if nonzero[i]:
+            _mul_row(running, a[i], taps, m, product, high, running)
+            last = i
+        prefix[i] = running
+    if last < 0:
+        return out
+
+    inverse = np.empty(n, dtype=np.uint64)
+    _invert_row(running, taps, m, chain, product, high, inverse)
+    for i in range(last, -1, -1):
+        if not nonzero[i]:
+            continue
+        # prefix[i - 1] is the product of the non-zero rows before i
+        if i > 0:
+            _mul_row(prefix[i - 1], inverse, taps, m, product, high, out[i])
+        else:
+            out[i] = inverse
+        _mul_row(inverse, a[i], taps, m, product, high, inverse)
+    return out
+
+
+class KernelField:
+    """
+    GF(2^m) arithmetic over whole batches with compiled kernels.
+
+    A batch of `N` elements is a `uint64` array of shape `(N, ceil(m / 64))`
+    holding every element as little-endian limbs. The kernels are compiled on
+    first use and cached on disk, so later processes load them without
+    recompiling.
+
+    Attributes:
+        m (int): The degree of the field extension.
+        modulus (int): The irreducible reduction polynomial.
+        limbs (int): The number of limbs per element.
+    """
+
+    def __init__(self, m: int, modulus: int) -> None:
+        """
+        Initialize the field and precompute the modulus taps.
+
+        Args:
+            m (int): The degree of the field extension.
+            modulus (int): The irreducible reduction polynomial of degree `m`.
+
+        Raises:
+            ValueError: If the modulus does not have degree `m`.
+        """
+        if modulus.bit_length() - 1 != m:
+            raise ValueError(f"The modulus must have degree {m}.")
+        self.m = m
+        self.modulus = modulus
+        self.limbs = limb_count(m)
+        self._taps = np.array(
+            [k for k in range(m - 1, -1, -1) if modulus >> k & 1], dtype=np.int64
+        )
+        self._chain = np.array(
+            [bit == "1" for bit in format(max(m - 1, 1), "b")[1:]], dtype=np.bool_
+        )
+
+    def pack(self, values: list[int]) -> Limbs:
+        """
+        Packs field elements into a limb array.
+
+        Args:
+            values (list[int]): The elements.
+
+        Returns:
+            Limbs: The batch.
+        """
+        return to_limbs(values, self.limbs)
+
+    def add(self, a: Limbs, b: Limbs) -> Limbs:
+        """
+        Adds two batches element-wise.
+
+        Args:
+            a (Limbs): The first batch.
+            b (Limbs): The second batch.
+
+        Returns:
+            Limbs: The sums.
+        """
+        return add_kernel(a, b)
+
+    def mul(self, a: Limbs, b: Limbs) -> Limbs:
+        """
+        Multiplies two batches element-wise.
+
+        Args:
+            a (Limbs): The first batch.
+            b (Limbs): The second batch.
+
+        Returns:
+            Limbs: The products.
+        """
+        return mul_kernel(a, b, self._taps, self.m)
+
+    def square(self, a: Limbs) -> Limbs:
+        """
+        Squares a batch element-wise.
+
+        Args:
+            a (Limbs): The batch.
+
+        Returns:
+            Limbs: The squares.
+        """
+        return square_kernel(a, self._taps, self.m)
+
+    def reduce(self, t: Limbs) -> Limbs:
+        """
+        Reduces a batch of polynomials of any width modulo the field polynomial.
+
+        Args:
+            t (Limbs): The polynomials, as an array of shape `(N, width)`.
+
+        Returns:
+            Limbs: The remainders.
+        """
+        return reduce_kernel(t, self._taps, self.m, self.limbs)
+
+    def invert(self, a: Limbs) -> Limbs:
+        """
+        Inverts a batch element-wise with a single shared field inversion.
+
+        Args:
+            a (Limbs): The batch.
+
+        Returns:
+            Limbs: The inverses; the rows of zero elements stay zero.
+        """
+        if self.m == 1:
+            return a.copy()
+        return invert_kernel(a, self._taps, self.m, self._chain)
+
+
+@lru_cache(maxsize=Config.FIELDS.MAX_CACHED)
+def kernel_field(m: int, modulus: int) -> KernelField:
+    """
+    Returns the cached batch kernels for GF(2^m) with the given modulus.
+
+    Args:
+        m (int): The degree of the field extension.
+        modulus (int): The irreducible reduction polynomial.
+
+    Returns:
+        KernelField: The field, built on first use.
+    """
+    return KernelField(m, modulus)
+
+
+# The batch entry points, each compiled once per argument signature
+KERNELS = {
+    "add": add_kernel,
+    "mul": mul_kernel,
+    "square": square_kernel,
+    "reduce": reduce_kernel,
+    "invert": invert_kernel,
+}
+
+
+def compiled_kernels() -> dict[str, int]:
+    """
+    Returns how many signatures of every batch kernel are compiled.
+
+    Returns:
+        dict[str, int]: The number of compiled signatures by kernel name; zero
+        means the kernel will compile, or load from the numba cache, on first use.
+    """
+    return {name: len(kernel.signatures) for name, kernel in KERNELS.items()}
@@ -0,0 +1,149 @@
+from functools import lru_cache
+from typing import Optional
+
+from src.config import Config
+from src.core.fields.native import spread
+from src.core.fields.reduction import reducer_for
+
+
+def poly_from_exponents(*exponents: int) -> int:
+    """
+    Builds the integer representation of a GF(2) polynomial from its exponents.
+
+    Args:
+        *exponents (int): The exponents of the non-zero terms of the polynomial.
+
+    Returns:
+        int: The polynomial where bit `k` is set for every exponent `k`.
+    """
+    poly = 0
+    for exponent in exponents:
+        poly |= 1 << exponent
+    return poly
+
+
+# Reduction polynomials recommended by NIST (FIPS 186) for binary fields.
+NIST_MODULI: dict[int, int] = {
+    163: poly_from_exponents(163, 7, 6, 3, 0),
+    233: poly_from_exponents(233, 74, 0),
+    283: poly_from_exponents(283, 12, 7, 5, 0),
+    409: poly_from_exponents(409, 87, 0),
+    571: poly_from_exponents(571, 10, 5, 2, 0),
+}
+
+# Reduction polynomial of the AES field GF(2^8).
+AES_MODULUS: int = poly_from_exponents(8, 4, 3, 1, 0)
+
+# The reduction polynomial of GF(2^m) when a request does not name one. Every
+# service reads it through the registry, so all endpoints agree for the same m.
+DEFAULT_MODULI: dict[int, int] = {8: AES_MODULUS, **NIST_MODULI}
+
+
+# Reduction polynomials of the standard NIST binary curves, by curve name.
+CURVES: dict[str, tuple[int, int]] = {
+    f"{family}-{m}": (m, poly)
+    for m, poly in NIST_MODULI.items()
+    for family in ("B", "K")
+}
+
+
+def prime_factors(n: int) -> list[int]:
+    """
+    Factors a positive integer by trial division.
+
+    Args:
+        n (int): The integer to factor.
+
+    Returns:
+        list[int]: The distinct prime factors of `n`, in increasing order.
+    """
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _poly_gcd(a: int, b: int) -> int:
+    while b:
+        while a.bit_length() >= b.bit_length():
+            a ^= b << (a.bit_length() - b.bit_length())
+        a, b = b, a
+    return a
+
+
+@lru_cache(maxsize=Config.FIELDS.MAX_MODULI)
+def is_irreducible(modulus: int) -> bool:
+    """
+    Tests whether a GF(2) polynomial is irreducible with Rabin's test.
+
+    A polynomial `f` of degree `m` is irreducible if and only if `f` divides
+    `x^(2^m) - x` and `gcd(x^(2^(m/p)) - x, f) = 1` for every prime `p`
+    dividing `m`. The powers `x^(2^k)` cost one squaring each, so a test costs
+    `m` squarings and a few polynomial gcds. Results are cached, so repeated
+    custom moduli are only tested once.
+
+    Args:
+        modulus (int): The polynomial.
+
+    Returns:
+        bool: Whether the polynomial is irreducible.
+    """
+    m = modulus.bit_length() - 1
+    if m < 1:
+        return False
+    reducer = reducer_for(modulus)
+    x = reducer.reduce(0b10)
+    # frobenius[k] = x^(2^k) mod f
+    frobenius = [x]
+    for _ in range(m):
+        frobenius.append(reducer.reduce(spread(frobenius[-1])))
+    if frobenius[m] != x:
+        return False
+    return all(_poly_gcd(modulus, frobenius[m // p] ^ x) == 1 for p in prime_factors(m))
+
+
+def resolve_modulus(m: int, modulus: Optional[str] = None) -> Optional[int]:
+    """
+    Resolves the reduction polynomial requested for GF(2^m).
+
+    Args:
+        m (int): The degree of the field extension.
+        modulus (str, optional): The polynomial in hexadecimal, or the name of a
+            standard curve such as `B-163` or `K-233`.
+
+    Returns:
+        Optional[int]: The reduction polynomial, or `None` when no modulus was
+        requested and the default of the service applies.
+
+    Raises:
+        ValueError: If the modulus is not a curve name or hexadecimal number, the
+            curve is defined over another field, or the polynomial does not have
+            degree `m` or is not irreducible.
+    """
+    if modulus is None:
+        return None
+    curve = CURVES.get(modulus.strip().upper())
+    if curve is not None:
+        if curve[0] != m:
+            raise ValueError(
+                f"Curve {modulus} is defined over GF(2^{curve[0]}), not GF(2^{m})."
+            )
+        return curve[1]
+    try:
+        poly = int(modulus, 16)
+    except ValueError:
+        raise ValueError(
+            f"Invalid modulus. Must be a hexadecimal polynomial or one of {tuple(CURVES)}."
+        ) from None
+    if poly.bit_length() - 1 != m:
+        raise ValueError(f"The modulus must have degree {m}.")
+    if not is_irreducible(poly):
+        raise ValueError("The modulus must be irreducible.")
+    return poly
@@ -0,0 +1,246 @@
+from collections import OrderedDict
+from typing import Union
+
+from src.config import Config
+from src.core.codec import bounds
+from src.core.fields.reduction import reducer_for
+from src.core.fields.store import IntTable, table_store
+
+WINDOW = 4
+_WINDOW_MASK = (1 << WINDOW) - 1
+
+
+def _spread_byte(byte: int) -> int:
+    return sum(1 << 2 * i for i in range(8) if byte >> i & 1)
+
+
+# Every byte with a zero bit inserted after each of its bits, as 2 little-endian bytes
+_SPREAD_BYTES = [_spread_byte(byte).to_bytes(2, "little") for byte in range(256)]
+
+
+def clmul(a: int, b: int) -> int:
+    """
+    Carry-less multiplication of two GF(2) polynomials stored as integers.
+
+    Uses a left-to-right comb over `WINDOW`-bit digits of `a` with a table of
+    the `2^WINDOW` carry-less multiples of `b`, so the cost is one shift and
+    one XOR per digit instead of one per bit.
+
+    Args:
+        a (int): The first polynomial.
+        b (int): The second polynomial.
+
+    Returns:
+        int: The unreduced product `a(x) * b(x)`.
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    if b < 2:
+        return a if b else 0
+
+    table = [0] * (1 << WINDOW)
+    table[1] = b
+    for i in range(2, 1 << WINDOW, 2):
+        table[i] = table[i >> 1] << 1
+        table[i + 1] = table[i] ^ b
+
+    shift = (a.bit_length() - 1) // WINDOW * WINDOW
+    result = 0
+    while shift >= 0:
+        result = (result << WINDOW) ^ table[(a >> shift) & _WINDOW_MASK]
+        shift -= WINDOW
+    return result
+
+
+def spread(a: int) -> int:
+    """
+    Squares a GF(2) polynomial stored as an integer.
+
+    Squaring over GF(2) only interleaves zero bits between the coefficients,
+    so every byte of `a` is mapped through a 256-entry table of 16-bit spreads.
+
+    Args:
+        a (int): The polynomial.
+
+    Returns:
+        int: The unreduced square `a(x)^2`.
+    """
+    data = a.to_bytes((a.bit_length() + 7) // 8, "little")
+    return int.from_bytes(b"".join([_SPREAD_BYTES[byte] for byte in data]), "little")
+
+
+class NativeField:
+    """
+    GF(2^m) arithmetic on plain Python integers.
+
+    Elements are integers `0 <= x < 2^m` whose bits are the polynomial
+    coefficients. Products are reduced with the shared `Reducer` of the modulus.
+
+    Attributes:
+        m (int): The degree of the field extension.
+        modulus (int): The irreducible reduction polynomial.
+        order (int): The number of elements of the field, `2^m`.
+    """
+
+    def __init__(self, m: int, modulus: int) -> None:
+        """
+        Initialize the field.
+
+        Args:
+            m (int): The degree of the field extension.
+            modulus (int): The irreducible reduction polynomial of degree `m`.
+
+        Raises:
+            ValueError: If the modulus does not have degree `m`.
+        """
+        if modulus.bit_length() - 1 != m:
+            raise ValueError(f"The modulus must have degree {m}.")
+        self.m = m
+        self.modulus = modulus
+        self.order = 1 << m
+        self._bounds = bounds(m)
+        self._reducer = reducer_for(modulus)
+        self._bytes = (m + 7) // 8
+        self._square_tables: OrderedDict[int, Union[list[int], IntTable]] = (
+            OrderedDict()
+        )
+
+    def element(self, value: int) -> int:
+        """
+        Validates that an integer is an element of the field.
+
+        Args:
+            value (int): The integer to validate.
+
+        Returns:
+            int: The validated element.
+
+        Raises:
+            ValueError: If the value is outside `0 <= x < 2^m`.
+        """
+        return self._bounds.check(value)
+
+    def reduce(self, value: int) -> int:
+        """
+        Reduces a polynomial of any degree modulo the field polynomial.
+
+        Args:
+            value (int): The polynomial to reduce.
+
+        Returns:
+            int: The remainder, an element of the field.
+        """
+        return self._reducer.reduce(value)
+
+    def add(self, a: int, b: int) -> int:
+        """
+        Adds two field elements.
+
+        Args:
+            a (int): The first element.
+            b (int): The second element.
+
+        Returns:
+            int: The sum `a + b`.
+        """
+        return a ^ b
+
+    def mul(self, a: int, b: int) -> int:
+        """
+        Multiplies two field elements.
+
+        Args:
+            a (int): The first element.
+            b (int): The second element.
+
+        Returns:
+            int: The product `a * b`.
+        """
+        return self._reducer.reduce(clmul(a, b))
+
+    def square(self, a: int) -> int:
+        """
+        Squares a field element.
+
+        Args:
+            a (int): The element to square.
+
+        Returns:
+            int: The square `a * a`.
+        """
+        return self._reducer.reduce(spread(a))
+
+    def square_k(self, a: int, k: int) -> int:
+        """
+        Raises a field element to the power `2^k`.
+
+        The map `x -> x^(2^k)` is linear over GF(2), so from
+        `Config.FIELDS.SQUARE_TABLE_MIN_K` squarings on it is evaluated with a
+        precomputed table holding the image of every byte value at every byte
+        position, at one XOR per byte of `a`. Smaller `k` square repeatedly.
+        When the shared table store is enabled, the tables are mapped from it.
+
+        Args:
+            a (int): The element.
+            k (int): The number of squarings.
+
+        Returns:
+            int: The power `a^(2^k)`.
+
+        Raises:
+            ValueError: If `k` is negative.
+        """
+        if k < 0:
+            raise ValueError("The number of squarings must be non-negative.")
+        # The Frobenius map has order m
+        k %= self.m
+        if k < Config.FIELDS.SQUARE_TABLE_MIN_K:
+            for _ in range(k):
+                a = self.square(a)
+            return a
+
+        table = self._square_table(k)
+        result = 0
+        for position, byte in enumerate(a.to_bytes(self._bytes, "little")):
+            if byte:
+                result ^= table[position << 8 | byte]
+        return result
+
+    def _square_table(self, k: int) -> Union[list[int], IntTable]:
+        table = self._square_tables.get(k)
+        if table is not None:
+            self._square_tables.move_to_end(k)
+            return table
+
+        if table_store.enabled:
+            table = table_store.ints(
+                self.m,
+                self.modulus,
+                f"square{k}",
+                self._bytes,
+                lambda: self._build_square_table(k),
+            )
+        else:
+            table = self._build_square_table(k)
+        self._square_tables[k] = table
+        if len(self._square_tables) > Config.FIELDS.SQUARE_TABLES:
+            self._square_tables.popitem(last=False)
+        return table
+
+    def _build_square_table(self, k: int) -> list[int]:
+        # Images of the basis x^i, then of every byte value by linearity
+        basis = []
+        for i in range(self.m):
+            value = 1 << i
+            for _ in range(k):
+                value = self.square(value)
+            basis.append(value)
+        table = [0] * (self._bytes << 8)
+        for position in range(self._bytes):
+            offset = position << 8
+            for byte in range(1, 256):
+                low = byte & -byte
+                bit = 8 * position + low.bit_length() - 1
+                image = basis[bit] if bit < self.m else 0
+                table[offset | byte] = table[offset | byte ^ low] ^ image
+        return table
@@ -0,0 +1,143 @@
+from functools import lru_cache
+from typing import Callable
+
+from src.config import Config
+
+WINDOW = 8
+
+
+class Reducer:
+    """
+    Reduces GF(2) polynomials of any degree modulo a fixed polynomial.
+
+    Sparse moduli (trinomials and pentanomials whose second-highest term is at
+    most half the degree, such as the NIST polynomials) fold the high part of
+    the dividend back onto the taps of the modulus, which clears a whole word
+    of high bits per pass. Dense moduli use a precomputed table of the
+    `2^WINDOW` multiples of the modulus indexed by their top `WINDOW` bits, so
+    each step clears `WINDOW` leading bits instead of one.
+
+    Attributes:
+        modulus (int): The polynomial to reduce by.
+        degree (int): The degree of the modulus.
+    """
+
+    def __init__(self, modulus: int) -> None:
+        """
+        Initialize the reducer and precompute its tables.
+
+        Args:
+            modulus (int): The polynomial to reduce by.
+
+        Raises:
+            ValueError: If the modulus is zero.
+        """
+        if modulus <= 0:
+            raise ValueError("Modulo by zero is not allowed!")
+        self.modulus = modulus
+        self.degree = modulus.bit_length() - 1
+        self._mask = (1 << self.degree) - 1
+        # Exponents of the modulus below its degree, highest first
+        self._taps = [k for k in range(self.degree - 1, -1, -1) if modulus >> k & 1]
+        self._table: list[int] = []
+
+        self._reduce: Callable[[int], int]
+        if self.degree == 0:
+            self._reduce = self._reduce_constant
+        elif not self._taps:
+            self._reduce = self._reduce_monomial
+        elif self._taps[0] > self.degree // 2:
+            self._table = self._shift_table()
+            self._reduce = self._reduce_table
+        elif len(self._taps) == 2 and self._taps[1] == 0:
+            self._reduce = self._reduce_trinomial
+        elif len(self._taps) == 4 and self._taps[3] == 0:
+            self._reduce = self._reduce_pentanomial
+        else:
+            self._reduce = self._reduce_sparse
+
+    def reduce(self, value: int) -> int:
+        """
+        Computes `value mod modulus`.
+
+        Args:
+            value (int): The dividend, of any degree.
+
+        Returns:
+            int: The remainder, of degree lower than the modulus.
+        """
+        return self._reduce(value)
+
+    def _shift_table(self) -> list[int]:
+        # table[u] is the multiple of the modulus whose bits
+        # [degree, degree + WINDOW) are exactly u and whose degree is lower
+        # than degree + WINDOW.
+        degree = self.degree
+        table = [0] * (1 << WINDOW)
+        for i in range(WINDOW):
+            entry = self.modulus << i
+            for j in range(i - 1, -1, -1):
+                if entry >> (degree + j) & 1:
+                    entry ^= table[1 << j]
+            table[1 << i] = entry
+        for u in range(3, 1 << WINDOW):
+            low = u & -u
+            if u != low:
+                table[u] = table[u ^ low] ^ table[low]
+        return table
+
+    def _reduce_constant(self, value: int) -> int:
+        return 0
+
+    def _reduce_monomial(self, value: int) -> int:
+        return value & self._mask
+
+    def _reduce_table(self, value: int) -> int:
+        degree = self.degree
+        table = self._table
+        excess = value.bit_length() - degree
+        while excess > 0:
+            shift = excess - WINDOW if excess > WINDOW else 0
+            value ^= table[value >> (degree + shift)] << shift
+            excess = value.bit_length() - degree
+        return value
+
+    def _reduce_trinomial(self, value: int) -> int:
+        degree, mask = self.degree, self._mask
+        k = self._taps[0]
+        while value >> degree:
+            high = value >> degree
+            value = (value & mask) ^ high ^ (high << k)
+        return value
+
+    def _reduce_pentanomial(self, value: int) -> int:
+        degree, mask = self.degree, self._mask
+        k1, k2, k3, _ = self._taps
+        while value >> degree:
+            high = value >> degree
+            value = (value & mask) ^ high ^ (high << k1) ^ (high << k2) ^ (high << k3)
+        return value
+
+    def _reduce_sparse(self, value: int) -> int:
+        degree, mask = self.degree, self._mask
+        taps = self._taps
+        while value >> degree:
+            high = value >> degree
+            value &= mask
+            for k in taps:
+                value ^= high << k
+        return value
+
+
+@lru_cache(maxsize=Config.FIELDS.MAX_CACHED)
+def reducer_for(modulus: int) -> Reducer:
+    """
+    Returns the cached reducer for a modulus.
+
+    Args:
+        modulus (int): The polynomial to reduce by.
+
+    Returns:
+        Reducer: The reducer, built on first use.
+    """
+    return Reducer(modulus)
@@ -0,0 +1,287 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from src.common.profiling import metrics
+from src.config import Config
+from src.core.fields.moduli import DEFAULT_MODULI
+from src.core.fields.native import NativeField
+from src.core.fields.tables import table_field
+
+if TYPE_CHECKING:
+    import galois
+
+FieldKey = tuple[int, int]
+
+
+class FieldRegistry:
+    """
+    Process-wide cache of GF(2^m) field classes.
+
+    Fields are keyed by `(m, irreducible_poly)` and built at most once. The
+    default polynomial of a degree is the one in `DEFAULT_MODULI` (AES for m=8,
+    NIST for the curve degrees), or else the library default. Fields
+    registered through `preload` are pinned for the lifetime of the process;
+    every other field lives in a bounded LRU and is evicted once more than
+    `max_size` ad-hoc fields have been requested.
+
+    Attributes:
+        max_size (int): The maximum number of unpinned fields kept in the registry.
+    """
+
+    def __init__(self, max_size: int = Config.FIELDS.MAX_CACHED) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_size (int, optional): The maximum number of unpinned fields to keep.
+                Defaults to `Config.FIELDS.MAX_CACHED`.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._fields: OrderedDict[FieldKey, type[galois.FieldArray]] = OrderedDict()
+        self._native: OrderedDict[FieldKey, NativeField] = OrderedDict()
+        self._build_times: dict[FieldKey, float] = {}
+        self._defaults: dict[int, int] = dict(DEFAULT_MODULI)
+        self._pinned: set[FieldKey] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_time = 0.0
+
+    def get(
+        self, m: int, irreducible_poly: Optional[int] = None
+    ) -> "type[galois.FieldArray]":
+        """
+        Returns the field GF(2^m), building it on first use.
+
+        Args:
+            m (int): The degree of the field extension.
+            irreducible_poly (int, optional): The reduction polynomial of the field.
+                Defaults to the default polynomial of `m`, see `modulus`.
+
+        Returns:
+            type[galois.FieldArray]: The field class.
+        """
+        with self._lock:
+            return self._get(m, irreducible_poly, pin=False)
+
+    def modulus(self, m: int, irreducible_poly: Optional[int] = None) -> int:
+        """
+        Returns the reduction polynomial the registry uses for GF(2^m).
+
+        Args:
+            m (int): The degree of the field extension.
+            irreducible_poly (int, optional): An explicit reduction polynomial.
+
+        Returns:
+            int: The reduction polynomial as an integer; every service uses it
+            for GF(2^m) when no polynomial is requested.
+        """
+        if irreducible_poly is not None:
+            return irreducible_poly
+        with self._lock:
+            if m not in self._defaults:
+                self._get(m, None, pin=False)
+            return self._defaults[m]
+
+    def native(self, m: int, irreducible_poly: Optional[int] = None) -> NativeField:
+        """
+        Returns the native-integer implementation of GF(2^m).
+
+        The field uses the same reduction polynomial as `get(m, irreducible_poly)`.
+        Degrees up to `Config.FIELDS.TABLE_MAX_M` get a `TableField`, which
+        computes through precomputed logarithm tables.
+
+        Args:
+            m (int): The degree of the field extension.
+            irreducible_poly (int, optional): The reduction polynomial of the field.
+                Defaults to the default polynomial of `m`, see `modulus`.
+
+        Returns:
+            NativeField: The field, a `TableField` for small degrees.
+        """
+        modulus = self.modulus(m, irreducible_poly)
+        key = (m, modulus)
+        with self._lock:
+            field = self._native.get(key)
+            if field is None:
+                field = self._native[key] = (
+                    table_field(m, modulus)
+                    if m <= Config.FIELDS.TABLE_MAX_M
+                    else NativeField(m, modulus)
+                )
+                self._evict()
+            else:
+                self._native.move_to_end(key)
+            return field
+
+    def preload(self, fields: Iterable[tuple[int, Optional[int]]]) -> None:
+        """
+        Builds and pins the given fields so they are never evicted.
+
+        Only the implementations the configuration computes with are built: the
+        galois field when `uses_galois(m)`, and the native field on the native
+        backend.
+
+        Args:
+            fields (Iterable[tuple[int, Optional[int]]]): `(m, irreducible_poly)` pairs
+                to build. `None` selects the default polynomial for `m`.
+        """
+        for m, irreducible_poly in fields:
+            if uses_galois(m):
+                with self._lock:
+                    field = self._get(m, irreducible_poly, pin=True)
+                irreducible_poly = int(field.irreducible_poly)
+            if backend_for(m) == "native":
+                key = (m, self.modulus(m, irreducible_poly))
+                self.native(*key)
+                with self._lock:
+                    self._pinned.add(key)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the registry counters.
+
+        Returns:
+            dict[str, Any]: Hit/miss/eviction counters, total build time in seconds
+            and the list of fields currently held.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "build_time": self.build_time,
+                "size": len(self._fields),
+                "native_size": len(self._native),
+                "max_size": self.max_size,
+                "fields": [
+                    {
+                        "m": m,
+                        "irreducible_poly": format(poly, "x"),
+                        "build_time": self._build_times[(m, poly)],
+                        "pinned": (m, poly) in self._pinned,
+                    }
+                    for m, poly in self._fields
+                ],
+            }
+
+    def clear(self) -> None:
+        """
+        Drops every field and resets the counters.
+        """
+        with self._lock:
+            self._fields.clear()
+            self._native.clear()
+            self._build_times.clear()
+            self._defaults = dict(DEFAULT_MODULI)
+            self._pinned.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.build_time = 0.0
+
+    def _get(
+        self, m: int, irreducible_poly: Optional[int], pin: bool
+    ) -> "type[galois.FieldArray]":
+        if irreducible_poly is None:
+            irreducible_poly = self._defaults.get(m)
+
+        if irreducible_poly is not None:
+            key = (m, irreducible_poly)
+            field = self._fields.get(key)
+            if field is not None:
+                self.hits += 1
+                self._fields.move_to_end(key)
+                if pin:
+                    self._pinned.add(key)
+                return field
+
+        self.misses += 1
+        start = time.perf_counter()
+        field = self._build(m, irreducible_poly)
+        elapsed = time.perf_counter() - start
+        self.build_time += elapsed
+        metrics.record("field_build", elapsed)
+
+        key = (m, int(field.irreducible_poly))
+        if irreducible_poly is None:
+            self._defaults[m] = key[1]
+        self._fields[key] = field
+        self._build_times[key] = elapsed
+        if pin:
+            self._pinned.add(key)
+        self._evict()
+        return field
+
+    def _build(
+        self, m: int, irreducible_poly: Optional[int]
+    ) -> "type[galois.FieldArray]":
+        # galois pulls in numba, so it is only imported once a field is built
+        import galois
+
+        if irreducible_poly is not None:
+            return galois.GF(2**m, irreducible_poly=irreducible_poly)
+        try:
+            return galois.GF(2**m)
+        except LookupError:
+            # No Conway polynomial is known for this degree
+            poly = int(galois.irreducible_poly(2, m, method="min"))
+            return galois.GF(2**m, irreducible_poly=poly)
+
+    def _evict(self) -> None:
+        unpinned = [key for key in self._fields if key not in self._pinned]
+        while len(unpinned) > self.max_size:
+            key = unpinned.pop(0)
+            del self._fields[key]
+            del self._build_times[key]
+            self.evictions += 1
+        unpinned = [key for key in self._native if key not in self._pinned]
+        while len(unpinned) > self.max_size:
+            del self._native[unpinned.pop(0)]
+
+
+field_registry = FieldRegistry()
+
+
+def backend_for(m: int) -> str:
+    """
+    Returns the arithmetic backend configured for GF(2^m).
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        str: `"native"` or `"galois"`.
+    """
+    return Config.FIELDS.BACKEND_OVERRIDES.get(m, Config.FIELDS.BACKEND)
+
+
+def uses_galois(m: int) -> bool:
+    """
+    Returns whether GF(2^m) computes through galois.
+
+    That is the case on the galois backend, and for every inversion and
+    division when galois is the configured inversion method.
+
+    Args:
+        m (int): The degree of the field extension.
+
+    Returns:
+        bool: Whether the operations on GF(2^m) need its galois field.
+    """
+    return backend_for(m) == "galois" or Config.FIELDS.INVERSION == "galois"
+
+
+def preload_fields(registry: FieldRegistry = field_registry) -> None:
+    """
+    Builds the default fields of every degree in `Config.FIELDS.PRELOAD`, see
+    `FieldRegistry.preload`.
+
+    Args:
+        registry (FieldRegistry, optional): The registry to warm. Defaults to the
+            process-wide registry.
+    """
+    registry.preload([(m, None) for m in Config.FIELDS.PRELOAD])
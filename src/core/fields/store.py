@@ -0,0 +1,265 @@
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from src.config import Config
+
+TableKey = tuple[int, int, str]
+
+# Every file starts with its layout version, the field it was built for and the
+# size of the table; the header is padded so the table stays 8-byte aligned
+_MAGIC = b"GF2T"
+_HEADER = struct.Struct("<4sIIQ")
+
+
+class IntTable:
+    """
+    Read-only sequence of fixed-width little-endian integers over a byte buffer.
+
+    Attributes:
+        width (int): The number of bytes of every integer.
+    """
+
+    __slots__ = ("_view", "width")
+
+    def __init__(self, buffer: memoryview, width: int) -> None:
+        """
+        Initialize the table.
+
+        Args:
+            buffer (memoryview): The packed integers.
+            width (int): The number of bytes of every integer.
+        """
+        self._view = buffer
+        self.width = width
+
+    @staticmethod
+    def pack(values: Iterable[int], width: int) -> bytes:
+        """
+        Packs integers into the layout read by `IntTable`.
+
+        Args:
+            values (Iterable[int]): The non-negative integers, each below `2^(8 * width)`.
+            width (int): The number of bytes of every integer.
+
+        Returns:
+            bytes: The packed integers.
+        """
+        return b"".join([value.to_bytes(width, "little") for value in values])
+
+    def __len__(self) -> int:
+        return len(self._view) // self.width
+
+    def __getitem__(self, index: int) -> int:
+        start = index * self.width
+        return int.from_bytes(self._view[start : start + self.width], "little")
+
+
+class TableStore:
+    """
+    Precomputed field tables shared by every worker through memory-mapped files.
+
+    A table is identified by `(m, modulus, kind)` and lives in
+    `<directory>/v<version>/gf2^<m>-<modulus>/<kind>.bin`. The first process
+    that needs a table builds it and publishes the file with an atomic rename;
+    every process then maps it read-only, so the pages are shared through the
+    page cache instead of being rebuilt in the private memory of each worker.
+    Bumping the version invalidates every table written by older layouts.
+
+    Every file starts with a header holding the version, `m`, the modulus and
+    the size of the table. A file whose header or size does not match, such as
+    one truncated by a crash or left by another layout, is rebuilt. Tables are
+    built outside the store lock, one build per key at a time, and at most
+    `max_size` tables stay mapped, the least recently used being released first.
+
+    Attributes:
+        directory (str): The root directory of the tables.
+        enabled (bool): Whether tables are stored at all. When disabled, callers
+            build their tables in private memory.
+        version (int): The layout version, part of every path.
+        max_size (int): The maximum number of mapped tables kept by the store.
+    """
+
+    def __init__(
+        self,
+        directory: str = Config.TABLES.DIRECTORY,
+        enabled: bool = Config.TABLES.ENABLED,
+        version: int = Config.TABLES.VERSION,
+        max_size: int = Config.TABLES.MAX_MAPPED,
+    ) -> None:
+        """
+        Initialize a store with no mapped tables.
+
+        Args:
+            directory (str, optional): The root directory of the tables.
+                Defaults to `Config.TABLES.DIRECTORY`.
+            enabled (bool, optional): Whether tables are stored. Defaults to
+                `Config.TABLES.ENABLED`.
+            version (int, optional): The layout version. Defaults to
+                `Config.TABLES.VERSION`.
+            max_size (int, optional): The maximum number of mapped tables to keep.
+                Defaults to `Config.TABLES.MAX_MAPPED`.
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.version = version
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._maps: OrderedDict[TableKey, memoryview] = OrderedDict()
+        self._building: dict[TableKey, threading.Lock] = {}
+        self.builds = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def path(self, m: int, modulus: int, kind: str) -> str:
+        """
+        Returns the file of a table.
+
+        Args:
+            m (int): The degree of the field extension.
+            modulus (int): The reduction polynomial of the field.
+            kind (str): The table kind, such as `log` or `square8`.
+
+        Returns:
+            str: The path of the table file.
+        """
+        return os.path.join(
+            self.directory, f"v{self.version}", f"gf2^{m}-{modulus:x}", f"{kind}.bin"
+        )
+
+    def load(
+        self, m: int, modulus: int, kind: str, build: Callable[[], bytes]
+    ) -> memoryview:
+        """
+        Returns a read-only mapping of a table, building and publishing it first
+        if no process has yet.
+
+        Args:
+            m (int): The degree of the field extension.
+            modulus (int): The reduction polynomial of the field.
+            kind (str): The table kind.
+            build (Callable[[], bytes]): Computes the contents of the table.
+
+        Returns:
+            memoryview: The table bytes.
+        """
+        key = (m, modulus, kind)
+        with self._lock:
+            view = self._cached(key)
+            if view is not None:
+                return view
+            guard = self._building.setdefault(key, threading.Lock())
+
+        with guard:
+            try:
+                with self._lock:
+                    # Another thread may have mapped it while this one waited
+                    view = self._cached(key)
+                    if view is not None:
+                        return view
+
+                path = self.path(m, modulus, kind)
+                built = False
+                try:
+                    view = self._map(path, m, modulus)
+                except (FileNotFoundError, ValueError):
+                    # Missing, truncated or written for another table: (re)build it
+                    self._publish(path, m, modulus, build())
+                    built = True
+                    view = self._map(path, m, modulus)
+
+                with self._lock:
+                    if built:
+                        self.builds += 1
+                    self.loads += 1
+                    self._maps[key] = view
+                    self._evict()
+                return view
+            finally:
+                # Also when the build raises, so the guard does not outlive it
+                with self._lock:
+                    if self._building.get(key) is guard:
+                        del self._building[key]
+
+    def ints(
+        self,
+        m: int,
+        modulus: int,
+        kind: str,
+        width: int,
+        build: Callable[[], Iterable[int]],
+    ) -> IntTable:
+        """
+        Returns a table of fixed-width integers, see `load`.
+
+        Args:
+            m (int): The degree of the field extension.
+            modulus (int): The reduction polynomial of the field.
+            kind (str): The table kind.
+            width (int): The number of bytes of every integer.
+            build (Callable[[], Iterable[int]]): Computes the integers of the table.
+
+        Returns:
+            IntTable: The table.
+        """
+        view = self.load(m, modulus, kind, lambda: IntTable.pack(build(), width))
+        return IntTable(view, width)
+
+    def clear(self) -> None:
+        """
+        Forgets every mapped table; the files are kept.
+
+        Mappings still referenced by fields stay valid until they are released.
+        """
+        with self._lock:
+            self._maps.clear()
+            self.builds = 0
+            self.loads = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._maps)
+
+    def _cached(self, key: TableKey) -> Optional[memoryview]:
+        view = self._maps.get(key)
+        if view is not None:
+            self._maps.move_to_end(key)
+        return view
+
+    def _header(self, m: int, modulus: int, size: int) -> bytes:
+        header = _HEADER.pack(_MAGIC, self.version, m, size)
+        header += modulus.to_bytes(m // 8 + 1, "little")
+        return header.ljust(-(-len(header) // 8) * 8, b"\0")
+
+    def _map(self, path: str, m: int, modulus: int) -> memoryview:
+        with open(path, "rb") as file:
+            length = os.fstat(file.fileno()).st_size
+            header = self._header(m, modulus, 0)
+            if length < len(header):
+                raise ValueError(f"Truncated table file {path}.")
+            size = length - len(header)
+            if file.read(len(header)) != self._header(m, modulus, size):
+                raise ValueError(f"Stale table file {path}.")
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(data)[len(header) :]
+
+    def _publish(self, path: str, m: int, modulus: int, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Readers only ever see a missing or a complete file
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(self._header(m, modulus, len(data)))
+            file.write(data)
+        os.replace(temporary, path)
+
+    def _evict(self) -> None:
+        # Fields keep the views they hold valid; only the store releases them
+        while len(self._maps) > self.max_size:
+            self._maps.popitem(last=False)
+            self.evictions += 1
+
+
+table_store = TableStore()
@@ -0,0 +1,254 @@
+from array import array
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+from src.core.fields.moduli import prime_factors
+from src.core.fields.native import NativeField
+from src.core.fields.store import TableStore, table_store
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# A flat uint16 buffer, in memory or mapped from a file
+Table = Union["array[int]", memoryview]
+
+
+class TableField(NativeField):
+    """
+    GF(2^m) arithmetic through discrete logarithm tables, for small degrees.
+
+    The multiplicative group of the field is cyclic, so with a generator `g`
+    every non-zero element is `g^i` and products, squares, powers and inverses
+    become additions of logarithms followed by one lookup in the table of powers.
+    The table of powers holds `2 * (2^m - 1)` entries so that the sum of two
+    logarithms never needs a reduction. Both tables are flat `uint16` buffers,
+    about `6 * 2^m` bytes, and may be backed by a memory-mapped file.
+
+    Attributes:
+        generator (int): The primitive element `g` the tables are built from.
+        exp (Table): `exp[i] = g^i` for `0 <= i < 2 * (2^m - 1)`.
+        log (Table): `log[x]` such that `g^log[x] = x`; `log[0]` is unused.
+    """
+
+    def __init__(
+        self,
+        m: int,
+        modulus: int,
+        exp: Optional[Table] = None,
+        log: Optional[Table] = None,
+    ) -> None:
+        """
+        Initialize the field, building the tables unless they are given.
+
+        Args:
+            m (int): The degree of the field extension, at most 16.
+            modulus (int): The irreducible reduction polynomial of degree `m`.
+            exp (Table, optional): A prebuilt table of powers.
+            log (Table, optional): A prebuilt table of logarithms.
+
+        Raises:
+            ValueError: If the modulus does not have degree `m`, `m` exceeds 16,
+                the prebuilt tables have the wrong length or the modulus is not
+                irreducible.
+        """
+        super().__init__(m, modulus)
+        if m > 16:
+            raise ValueError("Logarithm tables are limited to m <= 16.")
+        group = self.order - 1
+        if exp is None or log is None:
+            self.generator = self._find_generator()
+            exp, log = self._build_tables(self.generator)
+        elif len(exp) != 2 * group or len(log) != self.order:
+            raise ValueError(f"The tables do not match GF(2^{m}).")
+        else:
+            self.generator = exp[1] if group > 1 else 1
+        self.exp = exp
+        self.log = log
+        self._group = group
+
+    def mul(self, a: int, b: int) -> int:
+        """
+        Multiplies two field elements with one lookup.
+
+        Args:
+            a (int): The first element.
+            b (int): The second element.
+
+        Returns:
+            int: The product `a * b`.
+        """
+        if a and b:
+            return self.exp[self.log[a] + self.log[b]]
+        return 0
+
+    def square(self, a: int) -> int:
+        """
+        Squares a field element with one lookup.
+
+        Args:
+            a (int): The element to square.
+
+        Returns:
+            int: The square `a * a`.
+        """
+        return self.exp[2 * self.log[a]] if a else 0
+
+    def square_k(self, a: int, k: int) -> int:
+        """
+        Raises a field element to the power `2^k` with one lookup.
+
+        Args:
+            a (int): The element.
+            k (int): The number of squarings.
+
+        Returns:
+            int: The power `a^(2^k)`.
+
+        Raises:
+            ValueError: If `k` is negative.
+        """
+        if k < 0:
+            raise ValueError("The number of squarings must be non-negative.")
+        if not a:
+            return 0
+        return self.exp[(self.log[a] << k % self.m) % self._group]
+
+    def inverse(self, a: int) -> int:
+        """
+        Inverts a field element with one lookup.
+
+        Args:
+            a (int): The element to invert.
+
+        Returns:
+            int: The inverse of `a`.
+
+        Raises:
+            ValueError: If `a` is zero.
+        """
+        if a == 0:
+            raise ValueError("Polynomial inversion is not possible for zero.")
+        return self.exp[self._group - self.log[a]]
+
+    def pow(self, a: int, e: int) -> int:
+        """
+        Raises a field element to an integer power with one lookup.
+
+        Args:
+            a (int): The base.
+            e (int): The exponent, which may be negative for a non-zero base.
+
+        Returns:
+            int: The power `a^e`.
+
+        Raises:
+            ValueError: If the base is zero and the exponent negative.
+        """
+        if a == 0:
+            if e < 0:
+                raise ValueError("Polynomial inversion is not possible for zero.")
+            return 0 if e else 1
+        return self.exp[self.log[a] * e % self._group]
+
+    def mul_many(self, a: Sequence[int], b: Sequence[int]) -> list[int]:
+        """
+        Multiplies two sequences of field elements pairwise with vectorised lookups.
+
+        Args:
+            a (Sequence[int]): The first factors.
+            b (Sequence[int]): The second factors, as many as `a`.
+
+        Returns:
+            list[int]: The products, in order.
+        """
+        import numpy as np
+
+        exp, log = self._arrays()
+        x = np.asarray(a, dtype=np.intp)
+        y = np.asarray(b, dtype=np.intp)
+        products = exp[log[x].astype(np.intp) + log[y]]
+        products[(x == 0) | (y == 0)] = 0
+        return products.tolist()
+
+    def inverse_many(self, values: Sequence[int]) -> list[Optional[int]]:
+        """
+        Inverts a sequence of field elements with vectorised lookups.
+
+        Args:
+            values (Sequence[int]): The elements to invert.
+
+        Returns:
+            list[Optional[int]]: The inverse of every element, in order, or `None`
+            for the elements that are zero.
+        """
+        import numpy as np
+
+        exp, log = self._arrays()
+        x = np.asarray(values, dtype=np.intp)
+        inverses = exp[self._group - log[x].astype(np.intp)].tolist()
+        return [inverse if value else None for inverse, value in zip(inverses, values)]
+
+    def _arrays(self) -> tuple["np.ndarray", "np.ndarray"]:
+        import numpy as np
+
+        # Zero-copy views over the tables, whatever buffer backs them
+        return np.frombuffer(self.exp, dtype=np.uint16), np.frombuffer(
+            self.log, dtype=np.uint16
+        )
+
+    def _find_generator(self) -> int:
+        group = self.order - 1
+        if group == 1:
+            return 1
+        cofactors = [group // p for p in prime_factors(group)]
+        for g in range(2, self.order):
+            if all(self._slow_pow(g, e) != 1 for e in cofactors):
+                if self._slow_pow(g, group) != 1:
+                    break
+                return g
+        raise ValueError("The modulus must be irreducible.")
+
+    def _slow_pow(self, a: int, e: int) -> int:
+        result = 1
+        for bit in format(e, "b"):
+            result = NativeField.square(self, result)
+            if bit == "1":
+                result = NativeField.mul(self, result, a)
+        return result
+
+    def _build_tables(self, generator: int) -> tuple[Table, Table]:
+        group = self.order - 1
+        exp = array("H", bytes(4 * group))
+        log = array("H", bytes(2 * self.order))
+        value = 1
+        for i in range(group):
+            exp[i] = exp[i + group] = value
+            log[value] = i
+            value = NativeField.mul(self, value, generator)
+        return exp, log
+
+
+def table_field(m: int, modulus: int, store: TableStore = table_store) -> TableField:
+    """
+    Builds the `TableField` of GF(2^m), mapping its tables from the shared store
+    when it is enabled.
+
+    Args:
+        m (int): The degree of the field extension, at most 16.
+        modulus (int): The irreducible reduction polynomial of degree `m`.
+        store (TableStore, optional): The table store. Defaults to the
+            process-wide store.
+
+    Returns:
+        TableField: The field.
+    """
+    if not store.enabled:
+        return TableField(m, modulus)
+
+    def build() -> bytes:
+        field = TableField(m, modulus)
+        return bytes(field.exp) + bytes(field.log)
+
+    # The table of powers followed by the table of logarithms
+    tables = store.load(m, modulus, "log", build).cast("H")
+    split = 2 * ((1 << m) - 1)
+    return TableField(m, modulus, tables[:split], tables[split:])
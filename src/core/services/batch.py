@@ -0,0 +1,165 @@
+from typing import Callable, Optional, Sequence, Union
+
+from src.config import Config
+from src.core.codec import Operand, parse
+from src.core.fields import TableField, backend_for, field_registry
+from src.core.fields.inversion import batch_invert
+from src.core.fields.reduction import reducer_for
+
+BATCH_OPERATIONS = (
+    "addition",
+    "subtraction",
+    "multiplication",
+    "division",
+    "mod-reduction",
+)
+
+
+def _mod_reduction(a: int, b: int) -> int:
+    if b == 0:
+        raise ValueError("Modulo by zero is not allowed!")
+    return reducer_for(b).reduce(a)
+
+
+def _kernel(
+    operation: str, m: int, modulus: Optional[int]
+) -> Callable[[int, int], int]:
+    if operation in ("addition", "subtraction"):
+        return int.__xor__
+    if operation == "mod-reduction":
+        return _mod_reduction
+    return field_registry.native(m, modulus).mul
+
+
+def _galois_pass(
+    operation: str, a: list[int], b: list[int], m: int, modulus: Optional[int]
+) -> Optional[list[int]]:
+    # Vectorised multiplication/division over a single galois FieldArray
+    if operation not in ("multiplication", "division") or 0 in b:
+        return None
+    gf = field_registry.get(m, modulus)
+    x, y = gf(a), gf(b)
+    result = x * y if operation == "multiplication" else x / y
+    return [int(value) for value in result]
+
+
+def _table_pass(
+    operation: str, a: list[int], b: list[int], field: TableField
+) -> Optional[Sequence[Optional[int]]]:
+    # Vectorised logarithm table lookups; None marks a zero divisor
+    if operation == "multiplication":
+        return field.mul_many(a, b)
+    if operation != "division":
+        return None
+    inverses = field.inverse_many(b)
+    quotients = field.mul_many(a, [inverse or 0 for inverse in inverses])
+    return [value if divisor else None for value, divisor in zip(quotients, b)]
+
+
+def _kernel_pass(
+    operation: str, a: list[int], b: list[int], m: int, modulus: Optional[int]
+) -> Optional[Sequence[Optional[int]]]:
+    # Compiled limb-array kernels for large batches; None marks a zero divisor
+    if operation == "mod-reduction" or len(a) < Config.FIELDS.KERNEL_MIN_BATCH:
+        return None
+    native = field_registry.native(m, modulus)
+    if isinstance(native, TableField):
+        return _table_pass(operation, a, b, native)
+    from src.core.fields.kernels import from_limbs, kernel_field
+
+    field = kernel_field(m, native.modulus)
+    x, y = field.pack(a), field.pack(b)
+    if operation in ("addition", "subtraction"):
+        return from_limbs(field.add(x, y))
+    if operation == "multiplication":
+        return from_limbs(field.mul(x, y))
+    quotients = from_limbs(field.mul(x, field.invert(y)))
+    return [value if divisor else None for value, divisor in zip(quotients, b)]
+
+
+def batch_operation(
+    operation: str,
+    poly1: Sequence[Operand],
+    poly2: Sequence[Operand],
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> list[Union[int, ValueError]]:
+    """
+    Applies an operation to every pair of polynomials in GF(2^m).
+
+    The operands are parsed once, then every valid pair is computed in a single
+    pass over the field. Items that fail keep their position in the output. On the
+    native backend, batches of at least `Config.FIELDS.KERNEL_MIN_BATCH` pairs run
+    on the compiled limb-array kernels, or on vectorised logarithm table lookups
+    up to `Config.FIELDS.TABLE_MAX_M`.
+
+    Args:
+        operation (str): One of `BATCH_OPERATIONS`.
+        poly1 (Sequence[Operand]): The first polynomial of every pair.
+        poly2 (Sequence[Operand]): The second polynomial of every pair.
+        input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        list[Union[int, ValueError]]: The result of every pair, in order, or the
+        error raised while computing it.
+
+    Raises:
+        ValueError: If the operation is unknown or the operand lists differ in length.
+    """
+    if operation not in BATCH_OPERATIONS:
+        raise ValueError(f"Invalid operation. Must be one of {BATCH_OPERATIONS}.")
+    if len(poly1) != len(poly2):
+        raise ValueError("poly1 and poly2 must have the same length")
+
+    results: list[Union[int, ValueError]] = []
+    indices: list[int] = []
+    a: list[int] = []
+    b: list[int] = []
+    for index, (p1, p2) in enumerate(zip(poly1, poly2)):
+        try:
+            a.append(parse(p1, input_type, m).value)
+            b.append(parse(p2, input_type, m).value)
+        except ValueError as e:
+            del a[len(b) :]
+            results.append(e)
+            continue
+        results.append(0)
+        indices.append(index)
+
+    values: Optional[Sequence[Optional[int]]]
+    if backend_for(m) == "galois":
+        values = _galois_pass(operation, a, b, m, modulus)
+    else:
+        values = _kernel_pass(operation, a, b, m, modulus)
+    if values is not None:
+        for index, value in zip(indices, values):
+            results[index] = (
+                ValueError("Division by zero is not allowed in Galois fields")
+                if value is None
+                else value
+            )
+        return results
+
+    if operation == "division":
+        # All divisors share one inversion; a / b is then a * b^-1
+        field = field_registry.native(m, modulus)
+        inverses = batch_invert(field, b)
+        for index, x, y in zip(indices, a, inverses):
+            if y is None:
+                results[index] = ValueError(
+                    "Division by zero is not allowed in Galois fields"
+                )
+            else:
+                results[index] = field.mul(x, y)
+        return results
+
+    kernel = _kernel(operation, m, modulus)
+    for index, x, y in zip(indices, a, b):
+        try:
+            results[index] = kernel(x, y)
+        except ValueError as e:
+            results[index] = e
+    return results
@@ -1,41 +1,47 @@
-import galois
+from typing import Optional
 
+from src.config import Config
+from src.core.codec import Operand, parse
+from src.core.fields import backend_for, field_registry
+from src.core.fields.inversion import invert
 
-def divide(poly1: str, poly2: str, input_type: str, m: int = 163) -> galois.FieldArray:
+
+def divide(
+    poly1: Operand,
+    poly2: Operand,
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> int:
     """
     Divides two polynomials in a Galois field.
 
+    On the native backend the dividend is multiplied by the inverse of the
+    divisor, computed with `Config.FIELDS.INVERSION`; fields up to
+    `Config.FIELDS.TABLE_MAX_M` do both with lookups in their logarithm tables.
+    galois divides when it is the configured backend or inversion method.
+
     Args:
-        poly1 (str): The dividend polynomial in either binary or hexadecimal format.
-        poly2 (str): The divisor polynomial in either binary or hexadecimal format.
+        poly1 (Operand): The dividend polynomial in either binary or hexadecimal format.
+        poly2 (Operand): The divisor polynomial in either binary or hexadecimal format.
         input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
         m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for `m`.
 
     Returns:
-        galois.FieldArray: The result of the division in the Galois field.
+        int: The result of the division in the Galois field.
 
     Raises:
         ValueError: If the input type is invalid, conversion fails, or division by zero occurs.
     """
-    gf = galois.GF(2**m)
-    field_poly1, field_poly2 = None, None
-
-    try:
-        # Convert based on input type
-        if input_type == "binary":
-            field_poly1 = gf(int(poly1, 2))
-            field_poly2 = gf(int(poly2, 2))
-        elif input_type == "hexadecimal":
-            field_poly1 = gf(int(poly1, 16))
-            field_poly2 = gf(int(poly2, 16))
-
-        if field_poly1 is None or field_poly2 is None:
-            raise ValueError("Invalid input type")
-
-        # Perform division
-        if field_poly2 == 0:
-            raise ValueError("Division by zero is not allowed in Galois fields")
-
-        return field_poly1 / field_poly2
-    except ValueError as e:
-        raise ValueError(e)
+    dividend = parse(poly1, input_type, m).value
+    divisor = parse(poly2, input_type, m).value
+    if divisor == 0:
+        raise ValueError("Division by zero is not allowed in Galois fields")
+
+    if backend_for(m) == "native" and Config.FIELDS.INVERSION != "galois":
+        field = field_registry.native(m, modulus)
+        return field.mul(dividend, invert(field, divisor))
+
+    gf = field_registry.get(m, modulus)
+    return int(gf(dividend) / gf(divisor))
@@ -0,0 +1,66 @@
+from typing import Mapping, Optional, Sequence, Union
+
+from src.config import Config
+from src.core.codec import Operand, parse
+from src.core.expression import compile_expression
+from src.core.fields import field_registry
+
+
+def evaluate(
+    expression: str,
+    bindings: Sequence[Mapping[str, Operand]],
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> list[Union[int, ValueError]]:
+    """
+    Evaluates an expression in GF(2^m) for many bindings of its variables.
+
+    The expression is compiled once and cached (see `compile_expression`), then
+    every binding is computed in a single pass in which all divisions share one
+    batched inversion per stage. Bindings that fail keep their position in the
+    output.
+
+    Args:
+        expression (str): The expression, such as `(a * b + c) / d`.
+        bindings (Sequence[Mapping[str, Operand]]): The value of every variable,
+            for every evaluation. Extra names are ignored.
+        input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        list[Union[int, ValueError]]: The result of every binding, in order, or
+        the error raised while computing it.
+
+    Raises:
+        ValueError: If the expression is invalid, a constant is outside the field
+            or there are too many bindings.
+    """
+    if len(bindings) > Config.EXPRESSIONS.MAX_BINDINGS:
+        raise ValueError(
+            f"At most {Config.EXPRESSIONS.MAX_BINDINGS} bindings can be evaluated at once."
+        )
+    program = compile_expression(expression)
+
+    results: list[Union[int, ValueError]] = []
+    indices: list[int] = []
+    values: list[list[int]] = []
+    for index, binding in enumerate(bindings):
+        try:
+            row = []
+            for name in program.variables:
+                if name not in binding:
+                    raise ValueError(f"Missing variable '{name}'.")
+                row.append(parse(binding[name], input_type, m).value)
+        except ValueError as e:
+            results.append(e)
+            continue
+        results.append(0)
+        indices.append(index)
+        values.append(row)
+
+    field = field_registry.native(m, modulus)
+    for index, result in zip(indices, program.run(field, values)):
+        results[index] = result
+    return results
@@ -1,59 +1,107 @@
 # inverse.py
 
-import math
+from typing import Optional, Sequence, Union
 
-import galois
+from src.config import Config
+from src.core.codec import Operand, parse
+from src.core.fields import TableField, field_registry
+from src.core.fields.inversion import batch_invert, invert
 
 
-def inverse(poly: str, input_type: str, m: int = 163) -> str:
+def inverse(
+    poly: Operand, input_type: str, m: int = 163, modulus: Optional[int] = None
+) -> int:
     """
     Compute the multiplicative inverse of a polynomial in a Galois Field.
 
     Args:
-        poly (str): The polynomial to invert, represented as a string.
+        poly (Operand): The polynomial to invert.
         input_type (str): The format of the input polynomial, either 'binary' or 'hexadecimal'.
         m (int, optional): The degree of the Galois Field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
 
     Returns:
-        str: The multiplicative inverse of the polynomial in the same format as the input.
+        int: The multiplicative inverse of the polynomial.
 
     Raises:
         ValueError: If the input type is not 'binary' or 'hexadecimal'.
         ValueError: If the polynomial is not within the valid range for the specified Galois Field.
         ValueError: If the polynomial is zero, as inversion is not possible for zero.
     """
-    if m == 8:
-        gf = galois.GF(2**m, irreducible_poly=0x11B)
-    elif m == 233:
-        irreducible_poly_233 = (1 << 233) | (1 << 74) | 1
-        gf = galois.GF(2**m, irreducible_poly=irreducible_poly_233)
-    else:
-        gf = galois.GF(2**m)
+    poly_int = parse(poly, input_type, m).value
+
+    if poly_int == 0:
+        raise ValueError("Polynomial inversion is not possible for zero.")
 
-    if input_type == "binary":
-        poly_int = int(poly, 2)
-    elif input_type == "hexadecimal":
-        poly_int = int(poly, 16)
+    if Config.FIELDS.INVERSION == "galois":
+        gf = field_registry.get(m, modulus)
+        inverse_int = int(gf(1) / gf(poly_int))
     else:
-        raise ValueError("Invalid input type. Must be 'binary' or 'hexadecimal'.")
+        field = field_registry.native(m, modulus)
+        inverse_int = invert(field, poly_int, Config.FIELDS.INVERSION)
 
-    if not (0 <= poly_int < 2**m):
-        raise ValueError(
-            f"GF(2^{m}) scalars must be in `0 <= x < {2**m}`, not {poly_int}."
-        )
+    return inverse_int
 
-    field_poly = gf(poly_int)
 
-    if field_poly == 0:
-        raise ValueError("Polynomial inversion is not possible for zero.")
+def inverse_batch(
+    polys: Sequence[Operand],
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> list[Union[int, ValueError]]:
+    """
+    Compute the multiplicative inverses of many polynomials in a Galois Field.
+
+    All non-zero inputs share a single field inversion through Montgomery's
+    simultaneous inversion trick. Batches of at least `Config.FIELDS.KERNEL_MIN_BATCH`
+    polynomials run on the compiled limb-array kernels, or on vectorised logarithm
+    table lookups up to `Config.FIELDS.TABLE_MAX_M`.
+
+    Args:
+        polys (Sequence[Operand]): The polynomials to invert.
+        input_type (str): The format of the input polynomials, either 'binary' or 'hexadecimal'.
+        m (int, optional): The degree of the Galois Field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        list[Union[int, ValueError]]: The inverse of every polynomial, in order, or
+        the error for the polynomials that are invalid or zero.
+    """
+    field = field_registry.native(m, modulus)
+    results: list[Union[int, ValueError]] = []
+    values: list[int] = []
+    for poly in polys:
+        try:
+            values.append(parse(poly, input_type, m).value)
+        except ValueError as e:
+            values.append(0)
+            results.append(e)
+        else:
+            results.append(0)
 
-    inverse_poly = gf(1) / field_poly
-    inverse_int = int(inverse_poly)
+    inverses: Sequence[Optional[int]]
+    if isinstance(field, TableField) and len(values) >= Config.FIELDS.KERNEL_MIN_BATCH:
+        inverses = field.inverse_many(values)
+    elif len(values) >= Config.FIELDS.KERNEL_MIN_BATCH:
+        from src.core.fields.kernels import from_limbs, kernel_field
 
-    if input_type == "binary":
-        result = bin(inverse_int)[2:].zfill(m)
+        kernels = kernel_field(m, field.modulus)
+        inverses = [
+            inverse_int if value else None
+            for inverse_int, value in zip(
+                from_limbs(kernels.invert(kernels.pack(values))), values
+            )
+        ]
     else:
-        hex_length = math.ceil(m / 4)
-        result = hex(inverse_int)[2:].upper().zfill(hex_length)
+        inverses = batch_invert(field, values)
 
-    return result
+    for index, inverse_int in enumerate(inverses):
+        if isinstance(results[index], ValueError):
+            continue
+        if inverse_int is None:
+            results[index] = ValueError(
+                "Polynomial inversion is not possible for zero."
+            )
+        else:
+            results[index] = inverse_int
+    return results
@@ -1,4 +1,8 @@
-def modReduction(poly1: str, poly2: str, inputType: str, m: int = 163) -> int:
+from src.core.codec import Operand, parse
+from src.core.fields.reduction import reducer_for
+
+
+def modReduction(poly1: Operand, poly2: Operand, inputType: str, m: int = 163) -> int:
     """
     Computes modulo reduction given 2 polynomials (poly1 % poly2) in a Galois Field GF(2^m).
 
@@ -15,28 +19,13 @@ def modReduction(poly1: str, poly2: str, inputType: str, m: int = 163) -> int:
     ValueError: If the input type is invalid or conversion fails.
     """
     try:
-        if inputType == "binary":
-            poly1Int = int(poly1, 2)
-            poly2Int = int(poly2, 2)
-        elif inputType == "hexadecimal":
-            poly1Int = int(poly1, 16)
-            poly2Int = int(poly2, 16)
-        else:
-            raise ValueError("Invalid input type. Use 'binary' or 'hexadecimal'.")
-        if poly1Int >= 2**m or poly2Int >= 2**m:
-            raise ValueError("Not Valid Input for specified m")
+        poly1Int = parse(poly1, inputType, m).value
+        poly2Int = parse(poly2, inputType, m).value
 
         if poly2Int == 0:
             raise ValueError("Modulo by zero is not allowed!")
 
-        resultInt = 0
-        resultInt = poly1Int
-        modDegree = poly2Int.bit_length() - 1
-
-        while resultInt.bit_length() - 1 >= modDegree:
-            degreeDiff = resultInt.bit_length() - modDegree - 1
-            resultInt ^= poly2Int << degreeDiff
-        return resultInt
+        return reducer_for(poly2Int).reduce(poly1Int)
 
     except ValueError as e:
-        raise ValueError(e)
\ No newline at end of file
+        raise ValueError(e)
@@ -1,35 +1,39 @@
-import galois
+from typing import Optional
+
+from src.core.codec import Operand, parse
+from src.core.fields import backend_for, field_registry
 
 
 def multiplication(
-    poly1: str, poly2: str, input_type: str, m: int = 163
-) -> galois.FieldArray:
+    poly1: Operand,
+    poly2: Operand,
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> int:
     """
     Multiplies two polynomials in any Galois field.
     Args:
-        poly1 (str): The first polynomial in either binary or hexadecimal format.
-        poly2 (str): The second polynomial in either binary or hexadecimal format.
+        poly1 (Operand): The first polynomial in either binary or hexadecimal format.
+        poly2 (Operand): The second polynomial in either binary or hexadecimal format.
         input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
         m (int): The degree of the polynomial field. Default is 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
     Returns:
-        galois.FieldArray: The result of the multiplication in the Galois field.
+        int: The result of the multiplication in the Galois field.
     Raises:
         ValueError: If the input type is invalid or conversion doesnt work.
     """
-    gf = galois.GF(2**m)
-    field_poly1 = None
-    field_poly2 = None
     try:
-        # Convert based on input type
-        if input_type == "binary":
-            field_poly1 = gf(int(poly1, 2))
-            field_poly2 = gf(int(poly2, 2))
-        elif input_type == "hexadecimal":
-            field_poly1 = gf(int(poly1, 16))
-            field_poly2 = gf(int(poly2, 16))
-        if field_poly1 is None or field_poly2 is None:
-            raise ValueError("Invalid input type")
+        poly1_int = parse(poly1, input_type, m).value
+        poly2_int = parse(poly2, input_type, m).value
+
         # Do multiplication
-        return field_poly1 * field_poly2
+        if backend_for(m) == "native":
+            field = field_registry.native(m, modulus)
+            return field.mul(poly1_int, poly2_int)
+
+        gf = field_registry.get(m, modulus)
+        return int(gf(poly1_int) * gf(poly2_int))
     except ValueError as e:
         raise ValueError(e)
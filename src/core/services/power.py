@@ -0,0 +1,116 @@
+from typing import Optional
+
+from src.core.codec import Operand, parse
+from src.core.fields import backend_for, field_registry
+from src.core.fields.exponentiation import fixed_bases, sliding_window_pow
+
+
+def power(
+    poly: Operand,
+    exponent: int,
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> int:
+    """
+    Raises a polynomial to an integer power in a Galois field.
+
+    Args:
+        poly (Operand): The base polynomial in either binary or hexadecimal format.
+        exponent (int): The exponent; negative exponents raise the inverse of the base.
+        input_type (str): The format of the input polynomial ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        int: The power `poly^exponent` in the Galois field.
+
+    Raises:
+        ValueError: If the input type is invalid, conversion fails, the polynomial
+            is outside the field or a zero base is raised to a negative power.
+    """
+    poly_int = parse(poly, input_type, m).value
+
+    if backend_for(m) == "native":
+        field = field_registry.native(m, modulus)
+        return sliding_window_pow(field, poly_int, exponent)
+
+    gf = field_registry.get(m, modulus)
+    base = gf(poly_int)
+    if poly_int:
+        # galois needs the exponent to fit in a machine integer
+        exponent %= gf.order - 1
+    elif exponent < 0:
+        raise ValueError("Polynomial inversion is not possible for zero.")
+    else:
+        exponent = min(exponent, 1)
+    return int(base**exponent)
+
+
+def register_base(
+    poly: Operand, input_type: str, m: int = 163, modulus: Optional[int] = None
+) -> str:
+    """
+    Registers a fixed base whose powers are then computed from a precomputed table.
+
+    Args:
+        poly (Operand): The base polynomial in either binary or hexadecimal format.
+        input_type (str): The format of the input polynomial ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        str: The identifier to pass to `power_fixed_base`.
+
+    Raises:
+        ValueError: If the input type is invalid, conversion fails or the
+            polynomial is zero or outside the field.
+    """
+    field = field_registry.native(m, modulus)
+    return fixed_bases.register(field, parse(poly, input_type, m).value)
+
+
+def power_fixed_base(
+    base_id: str,
+    exponent: int,
+    m: int = 163,
+    modulus: Optional[int] = None,
+    poly: Optional[Operand] = None,
+    input_type: str = "hexadecimal",
+) -> int:
+    """
+    Raises a registered fixed base to an integer power.
+
+    Registered bases live in the process that registered them. A process that
+    does not know `base_id` rebuilds the table from `poly`, so clients of a
+    multi-worker deployment send the base along with its identifier.
+
+    Args:
+        base_id (str): The identifier returned by `register_base`.
+        exponent (int): The exponent, which may be negative.
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+        poly (Operand, optional): The base, used when it is not registered here.
+        input_type (str, optional): The format of `poly` ('binary' or 'hexadecimal').
+            Defaults to 'hexadecimal'.
+
+    Returns:
+        int: The power `base^exponent` in the Galois field.
+
+    Raises:
+        ValueError: If the base is unknown and `poly` is missing, `poly` is not
+            the base of `base_id`, or the base belongs to another field.
+    """
+    fixed = fixed_bases.get(base_id)
+    if fixed is None:
+        if poly is None:
+            raise ValueError(
+                f"Unknown base '{base_id}'. Register it first or send it as poly."
+            )
+        field = field_registry.native(m, modulus)
+        fixed = fixed_bases.load(base_id, field, parse(poly, input_type, m).value)
+    if (fixed.field.m, fixed.field.modulus) != (m, field_registry.modulus(m, modulus)):
+        raise ValueError(
+            f"Base '{base_id}' belongs to GF(2^{fixed.field.m}) with modulus {fixed.field.modulus:x}."
+        )
+    return fixed.pow(exponent)
@@ -0,0 +1,40 @@
+from typing import Optional
+
+from src.core.codec import Operand, parse
+from src.core.fields import backend_for, field_registry
+
+
+def square(
+    poly: Operand,
+    input_type: str,
+    m: int = 163,
+    k: int = 1,
+    modulus: Optional[int] = None,
+) -> int:
+    """
+    Squares a polynomial `k` times in a Galois field, computing `poly^(2^k)`.
+
+    Args:
+        poly (Operand): The polynomial in either binary or hexadecimal format.
+        input_type (str): The format of the input polynomial ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        k (int, optional): The number of squarings. Defaults to 1.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        int: The power `poly^(2^k)` in the Galois field.
+
+    Raises:
+        ValueError: If the input type is invalid, conversion fails, the polynomial
+            is outside the field or `k` is negative.
+    """
+    poly_int = parse(poly, input_type, m).value
+    if k < 0:
+        raise ValueError("The number of squarings must be non-negative.")
+
+    if backend_for(m) == "native":
+        field = field_registry.native(m, modulus)
+        return field.square_k(poly_int, k)
+
+    gf = field_registry.get(m, modulus)
+    return int(gf(poly_int) ** (1 << k % m))
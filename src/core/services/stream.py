@@ -0,0 +1,83 @@
+import json
+from typing import Optional, Sequence, Union
+
+from src.config import Config
+from src.core.services.batch import BATCH_OPERATIONS, batch_operation
+from src.core.services.inverse import inverse_batch
+
+STREAM_OPERATIONS = (*BATCH_OPERATIONS, "inverse")
+
+
+def _operands(line: bytes) -> tuple[str, str, Optional[str]]:
+    item = json.loads(line)
+    if not isinstance(item, dict):
+        raise ValueError("Every line must be a JSON object.")
+    operation = item.get("operation")
+    if operation == "inverse":
+        operands = (item["poly"], None)
+    elif operation in BATCH_OPERATIONS:
+        operands = (item["poly1"], item["poly2"])
+    else:
+        raise ValueError(f"Invalid operation. Must be one of {STREAM_OPERATIONS}.")
+    if not all(isinstance(poly, str) for poly in operands if poly is not None):
+        raise ValueError("Polynomials must be strings.")
+    return operation, operands[0], operands[1]
+
+
+def stream_chunk(
+    lines: Sequence[Optional[bytes]],
+    input_type: str,
+    m: int = 163,
+    modulus: Optional[int] = None,
+) -> list[Union[int, ValueError]]:
+    """
+    Computes a chunk of streamed operations.
+
+    Every line is a JSON object with an `operation` and its operands, `poly1`
+    and `poly2` for the batch operations or `poly` for `inverse`. The lines are
+    grouped by operation and every group is computed with one batch call, so
+    large chunks run on the compiled limb-array kernels and all inversions of
+    the chunk share a single field inversion.
+
+    Args:
+        lines (Sequence[Optional[bytes]]): The operation lines; `None` marks a
+            line that was too long to read.
+        input_type (str): The format of the input polynomials ('binary' or 'hexadecimal').
+        m (int, optional): The degree of the polynomial field. Defaults to 163.
+        modulus (int, optional): The reduction polynomial. Defaults to the registry default for m.
+
+    Returns:
+        list[Union[int, ValueError]]: The result of every line, in order, or the
+        error raised while reading or computing it.
+    """
+    results: list[Union[int, ValueError]] = [0] * len(lines)
+    groups: dict[str, tuple[list[int], list[str], list[str]]] = {}
+    for index, line in enumerate(lines):
+        if line is None:
+            results[index] = ValueError(
+                f"Lines must be at most {Config.STREAM.MAX_LINE_BYTES} bytes."
+            )
+            continue
+        try:
+            operation, poly1, poly2 = _operands(line)
+        except KeyError as e:
+            results[index] = ValueError(f"Missing field {e}.")
+            continue
+        except (TypeError, ValueError) as e:
+            results[index] = ValueError(str(e))
+            continue
+        indices, a, b = groups.setdefault(operation, ([], [], []))
+        indices.append(index)
+        a.append(poly1)
+        if poly2 is not None:
+            b.append(poly2)
+
+    for operation, (indices, a, b) in groups.items():
+        values = (
+            inverse_batch(a, input_type, m, modulus)
+            if operation == "inverse"
+            else batch_operation(operation, a, b, input_type, m, modulus)
+        )
+        for index, value in zip(indices, values):
+            results[index] = value
+    return results
@@ -1,6 +1,7 @@
-def subtraction(
-    poly1: str, poly2: str, inputType: str, m: int = 163
-) -> int:
+from src.core.codec import Operand, parse
+
+
+def subtraction(poly1: Operand, poly2: Operand, inputType: str, m: int = 163) -> int:
     """
     Subtracts 2 polynomials in a Galois Field GF(2^m).
 
@@ -19,19 +20,10 @@ def subtraction(
     """
 
     try:
-        if inputType == "binary":
-            poly1Int = int(poly1, 2)
-            poly2Int = int(poly2, 2)
-        elif inputType == "hexadecimal":
-            poly1Int = int(poly1, 16)
-            poly2Int = int(poly2, 16)
-        else:
-            raise ValueError("Invalid input type! Use 'binary' or 'hexadecimal'.")
-
-        if poly1Int >= 2**m or poly2Int >= 2**m:
-            raise ValueError ("Invalid Input for Specified m!")
+        poly1Int = parse(poly1, inputType, m).value
+        poly2Int = parse(poly2, inputType, m).value
         resultInt = poly1Int ^ poly2Int
         return resultInt
 
     except ValueError as e:
-        raise ValueError(e)
\ No newline at end of file
+        raise ValueError(e)
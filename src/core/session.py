@@ -0,0 +1,239 @@
+from typing import Any, Optional, Sequence
+
+from src.config import Config
+from src.core.codec import OUTPUT_TYPES, encode, parse
+from src.core.fields import field_registry
+from src.core.fields.exponentiation import sliding_window_pow
+from src.core.fields.inversion import INVERSION_METHODS, invert
+from src.core.fields.reduction import reducer_for
+
+# The number of operands of every session operation
+SESSION_OPERATIONS = {
+    "add": 2,
+    "sub": 2,
+    "mul": 2,
+    "div": 2,
+    "mod": 2,
+    "sqr": 1,
+    "inv": 1,
+    "pow": 2,
+    "set": 1,
+}
+
+
+class FieldSession:
+    """
+    A sequence of operations over one field with named registers.
+
+    Operands are either polynomials in the session input type or `$name`
+    references to a register, so dependent operations can keep their
+    intermediate results on the server. Operations run directly on the native
+    field, without the per-request parsing and dispatch of the services.
+
+    Attributes:
+        field (NativeField): The field of the session.
+        input_type (str): The format of polynomial operands ('binary' or 'hexadecimal').
+        output_type (str): The format of returned results.
+        max_registers (int): The maximum number of registers.
+        registers (dict[str, int]): The stored elements by name.
+    """
+
+    def __init__(
+        self,
+        m: int,
+        modulus: Optional[int] = None,
+        input_type: str = "hexadecimal",
+        output_type: str = "hexadecimal",
+        max_registers: int = Config.SESSION.MAX_REGISTERS,
+    ) -> None:
+        """
+        Initialize a session bound to GF(2^m).
+
+        Args:
+            m (int): The degree of the field.
+            modulus (int, optional): The reduction polynomial. Defaults to the
+                registry default for `m`.
+            input_type (str, optional): The format of polynomial operands.
+                Defaults to 'hexadecimal'.
+            output_type (str, optional): The format of returned results ('binary',
+                'hexadecimal' or 'base64'). Defaults to 'hexadecimal'.
+            max_registers (int, optional): The maximum number of registers.
+                Defaults to `Config.SESSION.MAX_REGISTERS`.
+
+        Raises:
+            ValueError: If the input or output type is invalid or the modulus
+                does not have degree `m`.
+        """
+        if input_type not in ("binary", "hexadecimal"):
+            raise ValueError("Invalid input type. Must be 'binary' or 'hexadecimal'.")
+        if output_type not in OUTPUT_TYPES:
+            raise ValueError(f"Invalid output type. Must be one of {OUTPUT_TYPES}.")
+        self.field = field_registry.native(m, modulus)
+        self.input_type = input_type
+        self.output_type = output_type
+        self.max_registers = max_registers
+        self.registers: dict[str, int] = {}
+        self._method = (
+            Config.FIELDS.INVERSION
+            if Config.FIELDS.INVERSION in INVERSION_METHODS
+            else "eea"
+        )
+
+    def operand(self, token: Any) -> int:
+        """
+        Resolves an operand to a field element.
+
+        Args:
+            token (Any): A polynomial in the session input type or a `$name`
+                register reference.
+
+        Returns:
+            int: The element.
+
+        Raises:
+            ValueError: If the register is unknown or the polynomial is invalid.
+        """
+        if not isinstance(token, str):
+            raise ValueError("Operands must be strings.")
+        if token.startswith("$"):
+            value = self.registers.get(token[1:])
+            if value is None:
+                raise ValueError(f"Unknown register '{token[1:]}'.")
+            return value
+        return parse(token, self.input_type, self.field.m).value
+
+    def execute(self, op: str, args: Sequence[Any], to: Optional[str] = None) -> int:
+        """
+        Runs one operation and optionally stores its result in a register.
+
+        Args:
+            op (str): One of `SESSION_OPERATIONS`; `set` loads its operand as is.
+            args (Sequence[Any]): The operands; the second operand of `pow` is an
+                integer exponent.
+            to (str, optional): The register the result is stored in.
+
+        Returns:
+            int: The result.
+
+        Raises:
+            ValueError: If the operation is unknown, an operand is invalid, a
+                division by zero occurs or the registers are full.
+        """
+        arity = SESSION_OPERATIONS.get(op)
+        if arity is None:
+            raise ValueError(
+                f"Invalid operation. Must be one of {(*SESSION_OPERATIONS, 'del')}."
+            )
+        if len(args) != arity:
+            raise ValueError(f"'{op}' takes {arity} operand(s), not {len(args)}.")
+
+        field = self.field
+        a = self.operand(args[0])
+        if op == "pow":
+            exponent = args[1]
+            if not isinstance(exponent, int) or isinstance(exponent, bool):
+                raise ValueError("The exponent must be an integer.")
+            result = sliding_window_pow(field, a, exponent)
+        elif arity == 1:
+            if op == "sqr":
+                result = field.square(a)
+            elif op == "inv":
+                result = invert(field, a, self._method)
+            else:
+                result = a
+        else:
+            b = self.operand(args[1])
+            if op in ("add", "sub"):
+                result = a ^ b
+            elif op == "mul":
+                result = field.mul(a, b)
+            elif op == "div":
+                if b == 0:
+                    raise ValueError("Division by zero is not allowed in Galois fields")
+                result = field.mul(a, invert(field, b, self._method))
+            else:
+                if b == 0:
+                    raise ValueError("Modulo by zero is not allowed!")
+                result = reducer_for(b).reduce(a)
+
+        if to is not None:
+            self.store(to, result)
+        return result
+
+    def store(self, name: str, value: int) -> None:
+        """
+        Stores an element in a register.
+
+        Args:
+            name (str): The register name.
+            value (int): The element.
+
+        Raises:
+            ValueError: If the name is not a string or all registers are in use.
+        """
+        if not isinstance(name, str) or not name:
+            raise ValueError("Register names must be non-empty strings.")
+        if name not in self.registers and len(self.registers) >= self.max_registers:
+            raise ValueError(f"A session holds at most {self.max_registers} registers.")
+        self.registers[name] = value
+
+    def drop(self, names: Sequence[Any]) -> None:
+        """
+        Frees registers; unknown names are ignored.
+
+        Args:
+            names (Sequence[Any]): The register names.
+        """
+        for name in names:
+            if isinstance(name, str):
+                self.registers.pop(name, None)
+
+    def handle(self, frame: Any) -> dict[str, Any]:
+        """
+        Runs one operation frame.
+
+        A frame is an object `{"id", "op", "args", "to", "ret"}`: `op` is one of
+        `SESSION_OPERATIONS` or `del`, which frees the registers named in `args`,
+        `to` optionally stores the result and `ret` asks for the result to be sent
+        back, which by default happens only when it is not stored. Only `op` is
+        required.
+
+        Args:
+            frame (Any): The decoded frame.
+
+        Returns:
+            dict[str, Any]: The reply `{"id"}`, with the encoded `result` when it
+            is returned, or with the `error` message when the frame failed.
+        """
+        if not isinstance(frame, dict):
+            return {"id": None, "error": "Every operation must be a JSON object."}
+        reply: dict[str, Any] = {"id": frame.get("id")}
+        try:
+            op = frame.get("op")
+            args = frame.get("args", [])
+            to = frame.get("to")
+            if not isinstance(op, str):
+                raise ValueError("Missing field 'op'.")
+            if not isinstance(args, list):
+                raise ValueError("The operands must be a list.")
+            if op == "del":
+                self.drop(args)
+                return reply
+            result = self.execute(op, args, to)
+            if frame.get("ret", to is None):
+                reply["result"] = encode(result, self.output_type, self.field.m)
+        except ValueError as e:
+            reply["error"] = str(e)
+        return reply
+
+    def handle_many(self, frames: Sequence[Any]) -> list[dict[str, Any]]:
+        """
+        Runs the operation frames of one message, in order.
+
+        Args:
+            frames (Sequence[Any]): The decoded frames.
+
+        Returns:
+            list[dict[str, Any]]: The reply of every frame, see `handle`.
+        """
+        return [self.handle(frame) for frame in frames]
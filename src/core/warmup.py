@@ -0,0 +1,152 @@
+import importlib
+import logging
+import sys
+import time
+from typing import Any, Callable
+
+from src.config import Config
+from src.core.fields import DEFAULT_MODULI, field_registry, preload_fields
+from src.core.fields.registry import FieldRegistry
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def configured_backends() -> set[str]:
+    """
+    Returns the arithmetic backends the configuration can select.
+
+    Returns:
+        set[str]: `Config.FIELDS.BACKEND` and every per-degree override.
+    """
+    return {Config.FIELDS.BACKEND, *Config.FIELDS.BACKEND_OVERRIDES.values()}
+
+
+def heavy_modules() -> tuple[str, ...]:
+    """
+    Returns the slow-to-import modules the configured backends need.
+
+    galois is needed when a configured degree computes through it, see
+    `uses_galois`, or has no entry in `DEFAULT_MODULI`, since galois then picks
+    its default modulus. The numba limb-array kernels only serve the batches of
+    the native backend.
+
+    Returns:
+        tuple[str, ...]: The module names, in import order.
+    """
+    degrees = {*Config.FIELDS.PRELOAD, *Config.FIELDS.BACKEND_OVERRIDES}
+    modules: list[str] = []
+    if (
+        "galois" in configured_backends()
+        or Config.FIELDS.INVERSION == "galois"
+        or any(m not in DEFAULT_MODULI for m in degrees)
+    ):
+        modules.append("galois")
+    if "native" in configured_backends():
+        modules.append("src.core.fields.kernels")
+    return tuple(modules)
+
+
+def compiled_kernels() -> dict[str, int]:
+    """
+    Returns how many signatures of every batch kernel are compiled, without
+    importing the kernels.
+
+    Returns:
+        dict[str, int]: The number of compiled signatures by kernel name, or an
+        empty dictionary while the kernels are not loaded.
+    """
+    kernels = sys.modules.get("src.core.fields.kernels")
+    if kernels is None:
+        return {}
+    return kernels.compiled_kernels()
+
+
+def _operations(m: int) -> list[tuple[str, Callable[..., Any], tuple[Any, ...]]]:
+    # One call of every service on non-zero operands, with batches large enough
+    # to reach the compiled kernels
+    from src.core.services.addition import add
+    from src.core.services.batch import batch_operation
+    from src.core.services.division import divide
+    from src.core.services.inverse import inverse, inverse_batch
+    from src.core.services.mod_reduction import modReduction
+    from src.core.services.multiplication import multiplication
+    from src.core.services.power import power
+    from src.core.services.square import square
+
+    a = b = 1
+    if m > 1:
+        a, b = 2, 3
+    batch = [a] * Config.FIELDS.KERNEL_MIN_BATCH
+    return [
+        ("addition", add, (a, b, "hexadecimal", m)),
+        ("multiplication", multiplication, (a, b, "hexadecimal", m)),
+        ("division", divide, (a, b, "hexadecimal", m)),
+        ("mod-reduction", modReduction, (a, b, "hexadecimal", m)),
+        ("square", square, (a, "hexadecimal", m)),
+        ("power", power, (a, 3, "hexadecimal", m)),
+        ("inverse", inverse, (a, "hexadecimal", m)),
+        ("batch", batch_operation, ("division", batch, batch, "hexadecimal", m)),
+        ("batch-inverse", inverse_batch, (batch, "hexadecimal", m)),
+    ]
+
+
+class Warmup:
+    """
+    The startup phase that makes the first requests as fast as the later ones.
+
+    Attributes:
+        ready (bool): Whether the warm-up has completed.
+        timings (dict[str, float]): The seconds spent importing every heavy
+            module, building the preloaded fields and running the operations on
+            every preloaded degree.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a warm-up that has not run yet.
+        """
+        self.ready = False
+        self.timings: dict[str, float] = {}
+
+    def run(self, registry: FieldRegistry = field_registry) -> None:
+        """
+        Imports the configured backends, builds the preloaded fields and runs
+        every operation once on each of them.
+
+        The operations compile the numba kernels, and the galois ufuncs of the
+        fields that use galois, so no request pays for JIT compilation. `ready`
+        is only set once everything ran, so it can run in a background thread
+        while the worker already answers its status endpoints. Operations are
+        skipped when `Config.FIELDS.WARMUP` is off.
+
+        Args:
+            registry (FieldRegistry, optional): The registry to warm. Defaults to
+                the process-wide registry.
+        """
+        start = time.perf_counter()
+        for module in heavy_modules():
+            step = time.perf_counter()
+            importlib.import_module(module)
+            self.timings[f"import {module}"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        preload_fields(registry)
+        self.timings["preload fields"] = time.perf_counter() - step
+
+        if Config.FIELDS.WARMUP:
+            for m in Config.FIELDS.PRELOAD:
+                step = time.perf_counter()
+                for operation, fn, args in _operations(m):
+                    try:
+                        fn(*args)
+                    except Exception as e:
+                        logger.warning(
+                            "Warm-up of %s in GF(2^%d) failed: %s", operation, m, e
+                        )
+                self.timings[f"operations GF(2^{m})"] = time.perf_counter() - step
+
+        self.timings["total"] = time.perf_counter() - start
+        self.ready = True
+
+
+warmup = Warmup()
@@ -1,14 +1,53 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 
+from src.common.profiling import ProfilingMiddleware
 from src.config import Config
 from src.controller import services_router, status_router
+from src.core.executor import executor
+from src.core.warmup import warmup
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def _warm_up() -> None:
+    start = time.perf_counter()
+    warmup.run()
+    logger.info("Worker %d ready in %.3fs", os.getpid(), time.perf_counter() - start)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warms the worker up in the background once the application has started and
+    stops the operation executor on shutdown. The heavy modules of the
+    configured backends are imported, the preloaded Galois fields built and
+    every operation run once on them, and the startup time is logged per worker
+    process. Until then `/status/ready` reports the worker as warming up.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    warming = asyncio.create_task(asyncio.to_thread(_warm_up))
+    yield
+    # A warm-up thread cannot be interrupted, so shutdown waits for it
+    await warming
+    executor.shutdown()
+
 
 app = FastAPI(
     title=Config.APP.TITLE,
     description=Config.APP.DESCRIPTION,
     version=Config.APP.VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -18,6 +57,7 @@
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ProfilingMiddleware)
 
 app.include_router(status_router)
 app.include_router(services_router)
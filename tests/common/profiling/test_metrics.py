@@ -0,0 +1,64 @@
+import pytest
+
+from src.common.profiling import Histogram, MetricsRegistry, metrics, span
+
+
+class TestHistogram:
+    def test_samples_are_cumulative(self) -> None:
+        histogram = Histogram("test_seconds", "Test.", ("stage",), (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, "parse")
+
+        counts, total = histogram.samples()[("parse",)]
+        assert counts == [2, 3, 4]
+        assert total == pytest.approx(2.65)
+
+    def test_render(self) -> None:
+        histogram = Histogram("test_seconds", "Test.", ("route",), (0.1,))
+        histogram.observe(0.05, '/a"b')
+
+        assert histogram.render() == (
+            "# HELP test_seconds Test.\n"
+            "# TYPE test_seconds histogram\n"
+            'test_seconds_bucket{route="/a\\"b",le="0.1"} 1\n'
+            'test_seconds_bucket{route="/a\\"b",le="+Inf"} 1\n'
+            'test_seconds_sum{route="/a\\"b"} 0.05\n'
+            'test_seconds_count{route="/a\\"b"} 1\n'
+        )
+
+
+class TestMetricsRegistry:
+    def test_record(self, metrics_registry: MetricsRegistry) -> None:
+        metrics_registry.record("parse", 0.001)
+        assert metrics_registry.stages.samples()[("parse",)][0][-1] == 1
+
+        metrics_registry.enabled = False
+        metrics_registry.record("parse", 0.001)
+        assert metrics_registry.stages.samples()[("parse",)][0][-1] == 1
+
+    def test_render_and_clear(self, metrics_registry: MetricsRegistry) -> None:
+        metrics_registry.requests.observe(0.01, "POST", "/operations/addition", "200")
+        page = metrics_registry.render()
+        assert "# TYPE gf_request_duration_seconds histogram" in page
+        assert "# TYPE gf_stage_duration_seconds histogram" in page
+        assert 'route="/operations/addition"' in page
+
+        metrics_registry.clear()
+        assert metrics_registry.requests.samples() == {}
+
+
+class TestSpan:
+    def test_span_records_even_on_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(metrics, "enabled", True)
+        before = metrics.stages.samples().get(("test-span",), ([0], 0.0))[0][-1]
+        with pytest.raises(ValueError):
+            with span("test-span"):
+                raise ValueError
+        assert metrics.stages.samples()[("test-span",)][0][-1] == before + 1
+
+    def test_disabled_span_is_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(metrics, "enabled", False)
+        assert span("parse") is span("encode")
+        with span("disabled-span"):
+            pass
+        assert ("disabled-span",) not in metrics.stages.samples()
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.common.profiling import MetricsRegistry, ProfilingMiddleware
+
+
+def _app(registry: MetricsRegistry, **options: object) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a", b"b"]))
+
+    app.add_middleware(ProfilingMiddleware, registry=registry, **options)
+    return app
+
+
+class TestProfilingMiddleware:
+    def test_requests_are_timed_by_route_template(
+        self, metrics_registry: MetricsRegistry
+    ) -> None:
+        client = TestClient(_app(metrics_registry, slow_seconds=None))
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+        assert client.get("/missing").status_code == 404
+        assert client.get("/stream").text == "ab"
+
+        samples = metrics_registry.requests.samples()
+        assert samples[("GET", "/items/{item_id}", "200")][0][-1] == 2
+        assert samples[("GET", "unmatched", "404")][0][-1] == 1
+        assert samples[("GET", "/stream", "200")][0][-1] == 1
+
+    def test_disabled_registry(self, metrics_registry: MetricsRegistry) -> None:
+        metrics_registry.enabled = False
+        TestClient(_app(metrics_registry)).get("/items/1")
+        assert metrics_registry.requests.samples() == {}
+
+    def test_slow_requests_are_profiled(
+        self, metrics_registry: MetricsRegistry, tmp_path: Path
+    ) -> None:
+        client = TestClient(
+            _app(
+                metrics_registry,
+                slow_seconds=0.0,
+                sample_rate=1.0,
+                profile_dir=str(tmp_path),
+            )
+        )
+        client.get("/items/1")
+
+        dumps = list(tmp_path.glob("*-GET-items-1-*ms.prof"))
+        assert len(dumps) == 1
+
+    def test_fast_requests_are_not_dumped(
+        self, metrics_registry: MetricsRegistry, tmp_path: Path
+    ) -> None:
+        client = TestClient(
+            _app(
+                metrics_registry,
+                slow_seconds=60.0,
+                sample_rate=1.0,
+                profile_dir=str(tmp_path),
+            )
+        )
+        client.get("/items/1")
+
+        assert list(tmp_path.iterdir()) == []
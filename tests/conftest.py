@@ -1,3 +1,4 @@
+from .fixtures.common.profiling.metrics import metrics_registry
 from .fixtures.common.utils.types.BinStr import invalid_bin_type, valid_bin_type
 from .fixtures.common.utils.types.HexStr import invalid_hex_type, valid_hex_type
 from .fixtures.controller.routes.operations import (
@@ -10,6 +11,13 @@
     valid_bin_input,
     valid_hex_input,
 )
+from .fixtures.core.cache import cache
+from .fixtures.core.executor import thread_executor
+from .fixtures.core.fields.exponentiation import base_registry
+from .fixtures.core.fields.native import random_elements
+from .fixtures.core.fields.registry import registry
+from .fixtures.core.fields.store import shared_tables
+from .fixtures.core.services.batch import valid_batch_input
 from .fixtures.core.services.operations import (
     empty_input,
     invalid_binary_input,
@@ -23,3 +31,4 @@
     valid_hex_input_large_m_div,
     valid_hex_input_small_m,
 )
+from .fixtures.core.session import field_session
@@ -1,17 +1,41 @@
 import json
 
 import pytest
-from fastapi import status
+from fastapi import WebSocketDisconnect, status
+from fastapi.testclient import TestClient
 
+from src.common.profiling import metrics
+from src.config import Config
 from src.controller.routes.operations import (
     addition,
+    batch,
+    batch_inverse,
     division,
+    evaluate,
     inverse_operation,
     mod_reduction,
     multiplication,
+    power,
+    power_base,
+    square,
     sub,
 )
-from src.controller.schemas import InverseRequest, OperationRequest
+from src.controller.schemas import (
+    BatchInverseRequest,
+    BatchOperationRequest,
+    EvaluateRequest,
+    FixedBaseRequest,
+    InverseRequest,
+    OperationRequest,
+    PowerRequest,
+    SquareRequest,
+)
+from src.core.cache import result_cache
+from src.core.executor import executor
+from src.core.fields import field_registry
+from src.core.fields.exponentiation import FixedBaseRegistry
+from src.core.services import power as power_module
+from src.main import app
 
 @pytest.mark.asyncio
 class TestAddPolynomials:
@@ -75,7 +99,7 @@ async def test_addition_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -142,7 +166,7 @@ async def test_division_hex_polynomials_successful(
         assert response.status_code == status.HTTP_200_OK
         assert res == {
             "message": "Polynomials divided successfully!",
-            "data": {"result": "54"},
+            "data": {"result": "33"},
         }
 
     async def test_division_bin_polynomials_successful(
@@ -158,7 +182,7 @@ async def test_division_bin_polynomials_successful(
         assert response.status_code == status.HTTP_200_OK
         assert res == {
             "message": "Polynomials divided successfully!",
-            "data": {"result": "10001111"},
+            "data": {"result": "10001100"},
         }
 
     async def test_division_invalid_input_type(
@@ -189,7 +213,7 @@ async def test_division_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -320,7 +344,7 @@ async def test_subtraction_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -427,7 +451,7 @@ async def test_mod_reduction_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -495,7 +519,7 @@ async def test_multiplication_hex_polynomials_successful(
         assert response.status_code == status.HTTP_200_OK
         assert res == {
             "message": "Polynomials multiplied successfully!",
-            "data": {"result": "0b"},
+            "data": {"result": "48"},
         }
 
     async def test_multiplication_bin_polynomials_successful(
@@ -511,7 +535,7 @@ async def test_multiplication_bin_polynomials_successful(
         assert response.status_code == status.HTTP_200_OK
         assert res == {
             "message": "Polynomials multiplied successfully!",
-            "data": {"result": "11001001"},
+            "data": {"result": "11011100"},
         }
 
     async def test_multiplication_invalid_input_type(
@@ -542,7 +566,7 @@ async def test_multiplication_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -595,6 +619,187 @@ async def test_multiplication_out_of_field_error(
         }
 
 
+@pytest.mark.asyncio
+class TestSquarePolynomials:
+    async def test_square_hex_polynomial_successful(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = valid_hex_input.values()
+        request = SquareRequest(
+            poly=poly, input_type=input_type, output_type=output_type, m=m_value, k=1
+        )
+        response = await square(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Polynomial squared successfully!",
+            "data": {"result": "f7"},
+        }
+
+    async def test_square_k_bin_polynomial_successful(
+        self,
+        valid_bin_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = valid_bin_input.values()
+        # x^(2^8) = x in GF(2^8)
+        request = SquareRequest(
+            poly=poly, input_type=input_type, output_type=output_type, m=m_value, k=8
+        )
+        response = await square(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Polynomial squared successfully!",
+            "data": {"result": poly},
+        }
+
+    async def test_square_invalid_output_type(
+        self,
+        invalid_output_type: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = invalid_output_type.values()
+        request = SquareRequest(
+            poly=poly, input_type=input_type, output_type=output_type, m=m_value, k=1
+        )
+        response = await square(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_square_negative_k(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = valid_hex_input.values()
+        request = SquareRequest(
+            poly=poly, input_type=input_type, output_type=output_type, m=m_value, k=-1
+        )
+        response = await square(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert res == {
+            "message": "The number of squarings must be non-negative.",
+            "data": {"result": None},
+        }
+
+
+@pytest.mark.asyncio
+class TestPowerPolynomials:
+    async def test_power_hex_polynomial_successful(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = valid_hex_input.values()
+        request = PowerRequest(
+            poly=poly,
+            base_id=None,
+            exponent=2,
+            input_type=input_type,
+            output_type=output_type,
+            m=m_value,
+        )
+        response = await power(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Polynomial power computed successfully!",
+            "data": {"result": "f7"},
+        }
+
+    async def test_power_fixed_base_successful(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, output_type = valid_hex_input.values()
+        response = await power_base(
+            FixedBaseRequest(poly=poly, input_type=input_type, m=m_value)
+        )
+        res = json.loads(response.body)
+        assert response.status_code == status.HTTP_200_OK
+        assert res["message"] == "Fixed base registered successfully!"
+
+        request = PowerRequest(
+            poly=None,
+            base_id=res["data"]["base_id"],
+            exponent=2,
+            input_type=input_type,
+            output_type=output_type,
+            m=m_value,
+        )
+        response = await power(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"result": "f7"}
+
+    async def test_power_rebuilds_unknown_base_from_poly(
+        self, m_value: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        response = await power_base(FixedBaseRequest(poly="A1", input_type="hexadecimal", m=m_value, modulus=None))
+        base_id = json.loads(response.body)["data"]["base_id"]
+        # Another worker, which has not seen the base
+        monkeypatch.setattr(power_module, "fixed_bases", FixedBaseRegistry())
+        request = PowerRequest(poly="A1", base_id=base_id, exponent=2, input_type="hexadecimal", output_type="hexadecimal", m=m_value)
+        response = await power(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.body)["data"] == {"result": "f7"}
+        assert power_module.fixed_bases.get(base_id) is not None
+
+    async def test_power_unknown_base(self, m_value: int) -> None:
+        request = PowerRequest(
+            poly=None,
+            base_id="missing",
+            exponent=2,
+            input_type="hexadecimal",
+            output_type="hexadecimal",
+            m=m_value,
+        )
+        response = await power(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert res == {
+            "message": "Unknown base 'missing'. Register it first or send it as poly.",
+            "data": {"result": None},
+        }
+
+    async def test_power_base_invalid_input_type(
+        self,
+        invalid_input_type: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, _ = invalid_input_type.values()
+        response = await power_base(
+            FixedBaseRequest(poly=poly, input_type=input_type, m=m_value)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+
+def test_power_requires_a_base() -> None:
+    with pytest.raises(ValueError):
+        PowerRequest(
+            poly=None,
+            base_id=None,
+            exponent=2,
+            input_type="hexadecimal",
+            output_type="hexadecimal",
+            m=8,
+        )
+
+
 @pytest.mark.asyncio
 class TestInversePolynomials:
     async def test_inverse_hex_polynomial_successful(
@@ -650,7 +855,7 @@ async def test_inverse_invalid_output_type(
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert res == {
-            "message": "Invalid output type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "message": "Invalid output type.\nPlease provide 'binary', 'hexadecimal' or 'base64'.",
             "data": {"result": None},
         }
 
@@ -697,3 +902,446 @@ async def test_inverse_out_of_field_error(
             "message": "GF(2^8) scalars must be in `0 <= x < 256`, not 4081.",
             "data": {"result": None},
         }
+
+
+@pytest.mark.asyncio
+class TestBatchOperations:
+    async def test_batch_multiplication_successful(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly1, poly2, input_type, output_type = valid_hex_input.values()
+        request = BatchOperationRequest(
+            poly1=[poly1, poly1],
+            poly2=[poly2, "FF1"],
+            input_type=input_type,
+            output_type=output_type,
+            m=m_value,
+        )
+        response = await batch("multiplication", request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Batch operation performed successfully!",
+            "data": {
+                "results": [
+                    {"result": "48", "error": None},
+                    {
+                        "result": None,
+                        "error": "GF(2^8) scalars must be in `0 <= x < 256`, not 4081.",
+                    },
+                ]
+            },
+        }
+
+    async def test_batch_invalid_operation(
+        self,
+        valid_bin_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly1, poly2, input_type, output_type = valid_bin_input.values()
+        request = BatchOperationRequest(
+            poly1=[poly1], poly2=[poly2], input_type=input_type, output_type=output_type, m=m_value
+        )
+        response = await batch("power", request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_batch_invalid_input_type(
+        self,
+        invalid_input_type: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly1, poly2, input_type, output_type = invalid_input_type.values()
+        request = BatchOperationRequest(
+            poly1=[poly1], poly2=[poly2], input_type=input_type, output_type=output_type, m=m_value
+        )
+        response = await batch("addition", request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert res == {
+            "message": "Invalid input type.\nPlease provide either 'binary' or 'hexadecimal'.",
+            "data": {"results": None},
+        }
+
+
+
+def test_batch_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        BatchOperationRequest(
+            poly1=["A1"], poly2=[], input_type="hexadecimal", output_type="hexadecimal", m=8
+        )
+
+
+@pytest.mark.asyncio
+class TestBatchInverse:
+    async def test_batch_inverse_successful(self, m_value: int) -> None:
+        request = BatchInverseRequest(
+            poly=["01", "00", "FF1"], input_type="hexadecimal", output_type="binary", m=m_value
+        )
+        response = await batch_inverse(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Polynomial inverses computed successfully!",
+            "data": {
+                "results": [
+                    {"result": "00000001", "error": None},
+                    {
+                        "result": None,
+                        "error": "Polynomial inversion is not possible for zero.",
+                    },
+                    {
+                        "result": None,
+                        "error": "GF(2^8) scalars must be in `0 <= x < 256`, not 4081.",
+                    },
+                ]
+            },
+        }
+
+    async def test_batch_inverse_invalid_output_type(
+        self, invalid_output_type: dict[str, str], m_value: int
+    ) -> None:
+        poly, _, input_type, output_type = invalid_output_type.values()
+        request = BatchInverseRequest(
+            poly=[poly], input_type=input_type, output_type=output_type, m=m_value
+        )
+        response = await batch_inverse(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+class TestExecutorBackpressure:
+    async def test_busy_executor_returns_503(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(executor, "heavy_operations", {"inverse": 0})
+        monkeypatch.setattr(executor, "max_queue", 0)
+        poly, _, input_type, output_type = valid_hex_input.values()
+        request = InverseRequest(poly=poly, input_type=input_type, output_type=output_type, m=m_value)
+        response = await inverse_operation(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert res == {
+            "message": "Too many pending operations. Try again later.",
+            "data": {"result": None},
+        }
+
+
+@pytest.mark.asyncio
+class TestResultCache:
+    async def test_repeated_operation_hits_cache(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(result_cache, "enabled", True)
+        result_cache.clear()
+        poly1, poly2, input_type, output_type = valid_hex_input.values()
+        request = OperationRequest(poly1=poly1, poly2=poly2, input_type=input_type, output_type=output_type, m=m_value)
+        padded = OperationRequest(poly1="0" + poly1.lower(), poly2=poly2, input_type=input_type, output_type=output_type, m=m_value)
+        responses = [await division(request), await division(padded), await division(request, x_cache_bypass=True)]
+        stats = result_cache.stats()
+        result_cache.clear()
+
+        for response in responses:
+            assert response.status_code == status.HTTP_200_OK
+            assert json.loads(response.body)["data"] == {"result": "33"}
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bypassed"] == 1
+        assert stats["entries"] == 1
+
+
+@pytest.mark.asyncio
+class TestOutputEncoding:
+    async def test_hex_output_keeps_every_digit(self) -> None:
+        request = OperationRequest(poly1="1" + "0" * 162, poly2="0", input_type="binary", output_type="hexadecimal", m=163)
+        response = await addition(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"result": "4" + "0" * 40}
+
+    async def test_base64_output(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, _ = valid_hex_input.values()
+        request = SquareRequest(poly=poly, input_type=input_type, output_type="base64", m=m_value, k=1)
+        response = await square(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"result": "9w=="}
+
+    async def test_inverse_output_type_is_honoured(
+        self,
+        valid_hex_input: dict[str, str],
+        m_value: int,
+    ) -> None:
+        poly, _, input_type, _ = valid_hex_input.values()
+        request = InverseRequest(poly=poly, input_type=input_type, output_type="binary", m=m_value)
+        response = await inverse_operation(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(res["data"]["result"]) == m_value
+        assert set(res["data"]["result"]) <= {"0", "1"}
+
+
+class TestStream:
+    def test_stream_results_in_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Config.STREAM, "CHUNK_SIZE", 2)
+        monkeypatch.setattr(Config.STREAM, "MAX_LINE_BYTES", 64)
+        field_registry.get(8)
+        body = b"\n".join(
+            [
+                b'{"operation": "multiplication", "poly1": "A1", "poly2": "FF"}',
+                b'{"operation": "addition", "poly1": "A1", "poly2": "FF"}',
+                b"",
+                b'{"operation": "division", "poly1": "A1", "poly2": "00"}',
+                b'{"operation": "addition", "poly1": "' + b"0" * 64 + b'", "poly2": "FF"}',
+                b'{"operation": "subtraction", "poly1": "A1", "poly2": "FF"}',
+            ]
+        )
+        response = TestClient(app).post("/operations/stream?m=8", content=body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"result": "48", "error": None},
+            {"result": "5e", "error": None},
+            {"result": None, "error": "Division by zero is not allowed in Galois fields"},
+            {"result": None, "error": "Lines must be at most 64 bytes."},
+            {"result": "5e", "error": None},
+        ]
+
+    def test_stream_invalid_output_type(self) -> None:
+        response = TestClient(app).post("/operations/stream?m=8&output_type=octal", content=b"")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_stream_modulus(self) -> None:
+        field_registry.get(8, 0x11D)
+        body = b'{"operation": "multiplication", "poly1": "A1", "poly2": "FF"}'
+        response = TestClient(app).post("/operations/stream?m=8&modulus=11d", content=body)
+        invalid = TestClient(app).post("/operations/stream?m=8&modulus=101", content=body)
+
+        assert [json.loads(line) for line in response.text.splitlines()] == [{"result": "0b", "error": None}]
+        assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestSession:
+    def test_session_chains_operations(self) -> None:
+        field_registry.get(8)
+        with TestClient(app).websocket_connect("/operations/session?m=8") as websocket:
+            assert websocket.receive_json() == {"m": 8, "modulus": "11b"}
+            websocket.send_json({"id": 1, "op": "set", "args": ["A1"], "to": "x"})
+            assert websocket.receive_json() == {"id": 1}
+            websocket.send_json(
+                [
+                    {"id": 2, "op": "mul", "args": ["$x", "FF"], "to": "y"},
+                    {"id": 3, "op": "div", "args": ["$y", "FF"]},
+                    {"id": 4, "op": "div", "args": ["$x", "00"]},
+                ]
+            )
+            assert websocket.receive_json() == [
+                {"id": 2},
+                {"id": 3, "result": "a1"},
+                {"id": 4, "error": "Division by zero is not allowed in Galois fields"},
+            ]
+            websocket.send_text("not json")
+            assert websocket.receive_json() == {"id": None, "error": "Invalid JSON frame."}
+            websocket.send_bytes(b"\x01")
+            assert websocket.receive_json() == {"id": None, "error": "Frames must be text."}
+            websocket.send_json({"id": 5, "op": "sqr", "args": ["$x"]})
+            assert websocket.receive_json() == {"id": 5, "result": "f7"}
+
+    def test_session_frames_are_offloaded(self) -> None:
+        field_registry.get(8)
+        submitted = executor.stats()["submitted"]
+        with TestClient(app).websocket_connect("/operations/session?m=8") as websocket:
+            websocket.receive_json()
+            websocket.send_json([{"id": 1, "op": "set", "args": ["A1"], "to": "x"}, {"id": 2, "op": "inv", "args": ["$x"]}])
+            assert websocket.receive_json()[1]["id"] == 2
+
+        assert executor.stats()["submitted"] == submitted + 1
+
+    def test_session_invalid_parameters(self) -> None:
+        with pytest.raises(WebSocketDisconnect) as disconnect:
+            with TestClient(app).websocket_connect("/operations/session?m=8&modulus=25"):
+                pass
+        assert disconnect.value.code == status.WS_1008_POLICY_VIOLATION
+        assert disconnect.value.reason == "The modulus must have degree 8."
+
+
+@pytest.mark.asyncio
+class TestEvaluate:
+    async def test_evaluate_successful(self, m_value: int) -> None:
+        field_registry.get(m_value)
+        request = EvaluateRequest(
+            expression="t = a * b; (t + c) / d",
+            bindings=[
+                {"a": "A1", "b": "FF", "c": "00", "d": "FF"},
+                {"a": "A1", "b": "FF", "c": "00", "d": "00"},
+                {"a": "A1"},
+            ],
+            input_type="hexadecimal",
+            output_type="hexadecimal",
+            m=m_value,
+        )
+        response = await evaluate(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res == {
+            "message": "Expression evaluated successfully!",
+            "data": {
+                "results": [
+                    {"result": "a1", "error": None},
+                    {"result": None, "error": "Division by zero is not allowed in Galois fields"},
+                    {"result": None, "error": "Missing variable 'b'."},
+                ]
+            },
+        }
+
+    async def test_evaluate_invalid_expression(self, m_value: int) -> None:
+        request = EvaluateRequest(
+            expression="a ** b",
+            bindings=[{"a": "A1", "b": "02"}],
+            input_type="hexadecimal",
+            output_type="hexadecimal",
+            m=m_value,
+        )
+        response = await evaluate(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert res == {"message": "Exponents must be integer literals.", "data": {"results": None}}
+
+    async def test_evaluate_invalid_output_type(self, m_value: int) -> None:
+        request = EvaluateRequest(
+            expression="a",
+            bindings=[{"a": "A1"}],
+            input_type="hexadecimal",
+            output_type="octal",
+            m=m_value,
+        )
+        response = await evaluate(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestMetrics:
+    def test_request_stages_are_recorded(self) -> None:
+        field_registry.get(8)
+        metrics.clear()
+        response = TestClient(app).post(
+            "/operations/multiplication",
+            json={"poly1": "A1", "poly2": "FF", "input_type": "hexadecimal", "output_type": "hexadecimal", "m": 8},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        stages = {labels[0] for labels in metrics.stages.samples()}
+        assert {"validate", "parse", "compute", "encode", "render"} <= stages
+        assert ("POST", "/operations/multiplication", "200") in metrics.requests.samples()
+
+
+@pytest.mark.asyncio
+class TestModulus:
+    async def test_multiplication_custom_modulus(self, m_value: int) -> None:
+        request = OperationRequest(poly1="A1", poly2="FF", input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11b")
+        response = await multiplication(request)
+        res = json.loads(response.body)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"]["result"] == "48"
+
+    async def test_endpoints_agree_on_modulus(self, m_value: int) -> None:
+        for modulus in ("11b", "11d"):
+            inverse_response = await inverse_operation(
+                InverseRequest(poly="A1", input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus=modulus)
+            )
+            a_inverse = json.loads(inverse_response.body)["data"]["result"]
+            product_response = await multiplication(
+                OperationRequest(poly1="A1", poly2=a_inverse, input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus=modulus)
+            )
+            quotient_response = await division(
+                OperationRequest(poly1="01", poly2="A1", input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus=modulus)
+            )
+
+            assert json.loads(product_response.body)["data"]["result"] == "01"
+            assert json.loads(quotient_response.body)["data"]["result"] == a_inverse
+
+    async def test_curve_name(self) -> None:
+        request = InverseRequest(poly="1", input_type="hexadecimal", output_type="hexadecimal", m=163, modulus="B-163")
+        response = await inverse_operation(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert int(json.loads(response.body)["data"]["result"], 16) == 1
+
+    @pytest.mark.parametrize(
+        "modulus, message",
+        [
+            ("101", "The modulus must be irreducible."),
+            ("1b", "The modulus must have degree 8."),
+            ("K-233", "Curve K-233 is defined over GF(2^233), not GF(2^8)."),
+        ],
+    )
+    async def test_invalid_modulus(self, m_value: int, modulus: str, message: str) -> None:
+        for endpoint in (addition, sub, mod_reduction, multiplication, division):
+            request = OperationRequest(poly1="A1", poly2="FF", input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus=modulus)
+            response = await endpoint(request)
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            assert json.loads(response.body) == {"message": message, "data": {"result": None}}
+
+    async def test_every_endpoint_takes_modulus(self, m_value: int) -> None:
+        # A1 * FF = 0B, A1^2 = 66 and A1^-1 = 82 with the modulus 0x11D
+        square_response = await square(SquareRequest(poly="A1", input_type="hexadecimal", output_type="hexadecimal", m=m_value, k=1, modulus="11d"))
+        power_response = await power(PowerRequest(poly="A1", base_id=None, exponent=2, input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11d"))
+        batch_response = await batch("multiplication", BatchOperationRequest(poly1=["A1"], poly2=["FF"], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11d"))
+        inverse_response = await batch_inverse(BatchInverseRequest(poly=["A1"], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11d"))
+        evaluate_response = await evaluate(EvaluateRequest(expression="a * b", bindings=[{"a": "A1", "b": "FF"}], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11d"))
+
+        assert json.loads(square_response.body)["data"] == {"result": "66"}
+        assert json.loads(power_response.body)["data"] == {"result": "66"}
+        assert json.loads(batch_response.body)["data"] == {"results": [{"result": "0b", "error": None}]}
+        assert json.loads(inverse_response.body)["data"] == {"results": [{"result": "82", "error": None}]}
+        assert json.loads(evaluate_response.body)["data"] == {"results": [{"result": "0b", "error": None}]}
+
+    async def test_fixed_base_keeps_its_modulus(self, m_value: int) -> None:
+        response = await power_base(FixedBaseRequest(poly="A1", input_type="hexadecimal", m=m_value, modulus="11d"))
+        base_id = json.loads(response.body)["data"]["base_id"]
+
+        same_field = await power(PowerRequest(poly=None, base_id=base_id, exponent=2, input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="11d"))
+        default_field = await power(PowerRequest(poly=None, base_id=base_id, exponent=2, input_type="hexadecimal", output_type="hexadecimal", m=m_value))
+
+        assert json.loads(same_field.body)["data"] == {"result": "66"}
+        assert default_field.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_invalid_modulus_on_every_endpoint(self, m_value: int) -> None:
+        responses = [
+            await square(SquareRequest(poly="A1", input_type="hexadecimal", output_type="hexadecimal", m=m_value, k=1, modulus="101")),
+            await power(PowerRequest(poly="A1", base_id=None, exponent=2, input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="101")),
+            await power_base(FixedBaseRequest(poly="A1", input_type="hexadecimal", m=m_value, modulus="101")),
+            await batch("addition", BatchOperationRequest(poly1=["A1"], poly2=["FF"], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="101")),
+            await batch_inverse(BatchInverseRequest(poly=["A1"], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="101")),
+            await evaluate(EvaluateRequest(expression="a", bindings=[{"a": "A1"}], input_type="hexadecimal", output_type="hexadecimal", m=m_value, modulus="101")),
+        ]
+
+        for response in responses:
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            assert json.loads(response.body)["message"] == "The modulus must be irreducible."
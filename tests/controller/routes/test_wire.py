@@ -0,0 +1,234 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.controller.routes.wire import (
+    WireError,
+    accept_format,
+    available,
+    content_format,
+    decode_body,
+    wire_model,
+)
+from src.controller.schemas import BatchOperationRequest, OperationRequest
+from src.core.codec import Element
+from src.core.fields import field_registry
+from src.main import app
+
+client = TestClient(app)
+
+OCTET_STREAM = "application/octet-stream"
+
+
+@pytest.fixture(autouse=True)
+def built_field() -> None:
+    # Build the field in the main thread before the test client uses it
+    field_registry.get(8)
+
+
+class TestNegotiation:
+    def test_content_format(self) -> None:
+        assert content_format("application/octet-stream") == "octet-stream"
+        assert content_format("application/msgpack; charset=binary") == "msgpack"
+        assert content_format("application/json") is None
+        assert content_format(None) is None
+
+    def test_accept_format_follows_client_order(self) -> None:
+        assert accept_format("application/octet-stream, */*") == "octet-stream"
+        assert accept_format("application/json, application/octet-stream") is None
+        assert accept_format("*/*") is None
+
+    def test_unavailable_formats_are_not_offered(self) -> None:
+        expected = "cbor" if available("cbor") else None
+        assert accept_format("application/cbor") == expected
+
+
+class TestDecodeBody:
+    def test_octet_stream_scalars(self) -> None:
+        content = decode_body("octet-stream", b"\xa1\xff", {"m": "8"}, OperationRequest)
+        assert content == {
+            "m": "8",
+            "poly1": Element(0xA1, 8),
+            "poly2": Element(0xFF, 8),
+        }
+
+    def test_octet_stream_lists(self) -> None:
+        content = decode_body(
+            "octet-stream", bytes(range(1, 7)), {"m": "8"}, BatchOperationRequest
+        )
+        assert [item.value for item in content["poly1"]] == [1, 2, 3]
+        assert [item.value for item in content["poly2"]] == [4, 5, 6]
+
+    def test_map_polynomials(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        body = msgpack.packb(
+            {"poly1": b"\x01\x00", "poly2": "101", "input_type": "binary", "m": 9}
+        )
+        content = decode_body("msgpack", body, {}, OperationRequest)
+        assert content["poly1"] == Element(0x100, 9)
+        assert content["poly2"] == Element(0b101, 9)
+
+    @pytest.mark.parametrize(
+        "body, query, message",
+        [
+            (b"\xa1", {}, "`m` as a query parameter"),
+            (b"\x00\xa1\xff", {"m": "9"}, "elements of 2 bytes"),
+            (b"\xa1\xff\x01", {"m": "8"}, "at most 2 elements"),
+        ],
+    )
+    def test_octet_stream_errors(
+        self, body: bytes, query: dict[str, str], message: str
+    ) -> None:
+        with pytest.raises(WireError, match=message):
+            decode_body("octet-stream", body, query, OperationRequest)
+
+    def test_elements_outside_the_field(self) -> None:
+        with pytest.raises(ValueError, match="GF\\(2\\^4\\)"):
+            decode_body("octet-stream", b"\xa1", {"m": "4"}, OperationRequest)
+
+
+class TestWireModel:
+    def test_polynomials_are_elements(self) -> None:
+        model = wire_model(OperationRequest)
+        request = model.model_validate(
+            {"poly1": Element(1, 8), "poly2": Element(2, 8), "m": "8"}
+        )
+        assert isinstance(request, OperationRequest)
+        assert request.poly1 == Element(1, 8)
+        with pytest.raises(ValueError):
+            model.model_validate({"poly1": "01", "poly2": Element(2, 8), "m": 8})
+
+    def test_model_validators_are_kept(self) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            wire_model(BatchOperationRequest).model_validate(
+                {"poly1": [Element(1, 8)], "poly2": [], "m": 8}
+            )
+
+
+class TestWireRoute:
+    def test_octet_stream_round_trip(self) -> None:
+        response = client.post(
+            "/operations/multiplication?m=8",
+            content=b"\xa1\xff",
+            headers={"Content-Type": OCTET_STREAM, "Accept": OCTET_STREAM},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OCTET_STREAM
+        assert response.content == b"\x48"
+
+    def test_json_request_binary_response(self) -> None:
+        response = client.post(
+            "/operations/addition",
+            json={
+                "poly1": "10101010",
+                "poly2": "11001100",
+                "input_type": "binary",
+                "output_type": "binary",
+                "m": 163,
+            },
+            headers={"Accept": OCTET_STREAM},
+        )
+        assert response.status_code == 200
+        assert response.content == (0b01100110).to_bytes(21, "big")
+
+    def test_binary_request_json_response(self) -> None:
+        response = client.post(
+            "/operations/addition?m=8&output_type=binary",
+            content=b"\xa1\xff",
+            headers={"Content-Type": OCTET_STREAM},
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == {"result": "01011110"}
+
+    def test_batch_failed_items(self) -> None:
+        response = client.post(
+            "/operations/batch/division?m=8",
+            content=b"\xa1\x03\xff\x00",
+            headers={"Content-Type": OCTET_STREAM, "Accept": OCTET_STREAM},
+        )
+        assert response.status_code == 200
+        assert len(response.content) == 2
+        assert response.content[1:] == b"\x00"
+        assert response.headers["x-failed-items"] == "1"
+
+    def test_errors_stay_json(self) -> None:
+        response = client.post(
+            "/operations/division?m=8",
+            content=b"\xa1\x00",
+            headers={"Content-Type": OCTET_STREAM, "Accept": OCTET_STREAM},
+        )
+        assert response.status_code == 422
+        assert json.loads(response.content)["data"] == {"result": None}
+
+    def test_malformed_body(self) -> None:
+        response = client.post(
+            "/operations/addition",
+            content=b"\xa1",
+            headers={"Content-Type": OCTET_STREAM},
+        )
+        assert response.status_code == 400
+        assert "query parameter" in response.json()["message"]
+
+    def test_missing_codec(self) -> None:
+        if available("cbor"):
+            pytest.skip("cbor2 is installed")
+        response = client.post(
+            "/operations/addition",
+            content=b"\xa0",
+            headers={"Content-Type": "application/cbor"},
+        )
+        assert response.status_code == 415
+
+    def test_msgpack_round_trip(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        response = client.post(
+            "/operations/multiplication",
+            content=msgpack.packb({"poly1": b"\xa1", "poly2": b"\xff", "m": 8}),
+            headers={
+                "Content-Type": "application/msgpack",
+                "Accept": "application/msgpack",
+            },
+        )
+        assert response.status_code == 200
+        assert msgpack.unpackb(response.content)["data"] == {"result": b"\x48"}
+
+    def test_cbor_batch(self) -> None:
+        cbor2 = pytest.importorskip("cbor2")
+        response = client.post(
+            "/operations/batch/division",
+            content=cbor2.dumps(
+                {"poly1": [b"\xa1", b"\x03"], "poly2": [b"\xff", b"\x00"], "m": 8}
+            ),
+            headers={"Content-Type": "application/cbor", "Accept": "application/cbor"},
+        )
+        assert response.status_code == 200
+        results = cbor2.loads(response.content)["data"]["results"]
+        assert results[0]["result"] == b"\x33"
+        assert results[1] == {
+            "result": None,
+            "error": "Division by zero is not allowed in Galois fields",
+        }
+
+    def test_binary_validation_errors(self) -> None:
+        response = client.post(
+            "/operations/batch/addition?m=8",
+            content=b"\xa1\x03\xff",
+            headers={"Content-Type": OCTET_STREAM},
+        )
+        assert response.status_code == 400
+        response = client.post(
+            "/operations/power?m=8",
+            content=b"\xa1",
+            headers={"Content-Type": OCTET_STREAM},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "exponent"]
+
+    def test_routes_without_service_take_json(self) -> None:
+        response = client.post(
+            "/operations/power/base?m=8",
+            content=b"\xa1",
+            headers={"Content-Type": OCTET_STREAM},
+        )
+        assert response.status_code == 415
@@ -1,7 +1,19 @@
+import json
+
 import pytest
 from fastapi import status
 
-from src.controller.status import status_check
+from src.controller.status import (
+    cache_status,
+    executor_status,
+    fields_status,
+    live_check,
+    metrics_status,
+    ready_check,
+    status_check,
+)
+from src.core.executor import executor
+from src.core.warmup import warmup
 
 
 @pytest.mark.asyncio
@@ -17,3 +29,89 @@ async def test_status_check() -> None:
 
     assert response.status_code == status.HTTP_200_OK
     assert res == {"message": "Status check successful", "data": {}}
+
+
+@pytest.mark.asyncio
+async def test_fields_status() -> None:
+    response = await fields_status()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert res["message"] == "Field registry statistics retrieved successfully!"
+    assert {"hits", "misses", "evictions", "build_time", "fields"} <= res["data"].keys()
+
+
+@pytest.mark.asyncio
+async def test_executor_status() -> None:
+    response = await executor_status()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert res["message"] == "Executor statistics retrieved successfully!"
+    assert {"mode", "queue_depth", "wait_time", "rejected"} <= res["data"].keys()
+
+
+@pytest.mark.asyncio
+async def test_cache_status() -> None:
+    response = await cache_status()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert res["message"] == "Result cache statistics retrieved successfully!"
+    assert {"enabled", "entries", "bytes", "hit_rate"} <= res["data"].keys()
+
+
+@pytest.mark.asyncio
+async def test_metrics_status() -> None:
+    response = await metrics_status()
+    body = bytes(response.body).decode()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.media_type == "text/plain; version=0.0.4"
+    assert "# TYPE gf_request_duration_seconds histogram" in body
+    assert "# TYPE gf_stage_duration_seconds histogram" in body
+
+
+@pytest.mark.asyncio
+async def test_live_check() -> None:
+    response = await live_check()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert res["message"] == "Worker is alive"
+    assert {"pid", "uptime"} <= res["data"].keys()
+
+
+@pytest.mark.asyncio
+async def test_ready_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warmup, "ready", True)
+    response = await ready_check()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert res["message"] == "Worker is ready"
+    assert res["data"]["ready"] is True
+    assert {"warmup", "fields", "kernels", "executor", "caches"} <= res["data"].keys()
+    assert {"queue_depth", "max_queue"} <= res["data"]["executor"].keys()
+
+
+@pytest.mark.asyncio
+async def test_ready_check_while_warming_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warmup, "ready", False)
+    response = await ready_check()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert res["message"] == "Worker is warming up"
+    assert res["data"]["ready"] is False
+
+
+@pytest.mark.asyncio
+async def test_ready_check_when_saturated(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warmup, "ready", True)
+    monkeypatch.setattr(executor, "pending", executor.max_queue)
+    response = await ready_check()
+    res = json.loads(response.body)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert res["message"] == "Worker is saturated"
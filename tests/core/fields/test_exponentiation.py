@@ -0,0 +1,80 @@
+import galois
+import pytest
+
+from src.core.fields.exponentiation import (
+    FixedBase,
+    FixedBaseRegistry,
+    sliding_window_pow,
+    window_size,
+)
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.native import NativeField
+
+FIELDS = [(8, AES_MODULUS), *NIST_MODULI.items()]
+
+
+def test_window_size_grows_with_exponent() -> None:
+    sizes = [window_size(bits) for bits in (1, 8, 9, 100, 571, 5000)]
+    assert sizes == sorted(sizes)
+    assert sizes[0] == 1 and sizes[-1] == 6
+
+
+@pytest.mark.parametrize("m, modulus", FIELDS)
+class TestPow:
+    def test_sliding_window_matches_galois(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field = NativeField(m, modulus)
+        gf = galois.GF(2**m, irreducible_poly=modulus)
+        a = random_elements[0] & (1 << m) - 1 | 1
+        for e in (0, 1, 2, 3, 255, random_elements[1], random_elements[2] << 571, -5):
+            assert sliding_window_pow(field, a, e) == int(gf(a) ** (e % (gf.order - 1)))
+
+    def test_fixed_base_matches_sliding_window(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field = NativeField(m, modulus)
+        a = random_elements[3] & (1 << m) - 1 | 1
+        fixed = FixedBase(field, a)
+        for e in (0, 1, 15, 16, random_elements[4], (1 << m) - 1, -3):
+            assert fixed.pow(e) == sliding_window_pow(field, a, e)
+
+
+class TestZeroBase:
+    def test_zero_powers(self) -> None:
+        field = NativeField(8, AES_MODULUS)
+        assert sliding_window_pow(field, 0, 0) == 1
+        assert sliding_window_pow(field, 0, 7) == 0
+
+    def test_zero_negative_power(self) -> None:
+        field = NativeField(8, AES_MODULUS)
+        with pytest.raises(
+            ValueError, match="Polynomial inversion is not possible for zero."
+        ):
+            sliding_window_pow(field, 0, -1)
+
+    def test_zero_fixed_base(self) -> None:
+        with pytest.raises(ValueError, match="The fixed base must be non-zero."):
+            FixedBase(NativeField(8, AES_MODULUS), 0)
+
+
+class TestFixedBaseRegistry:
+    def test_register_is_idempotent(self, base_registry: FixedBaseRegistry) -> None:
+        field = NativeField(8, AES_MODULUS)
+        base_id = base_registry.register(field, 3)
+        assert base_registry.register(field, 3) == base_id
+        assert len(base_registry) == 1
+        fixed = base_registry.get(base_id)
+        assert fixed is not None and fixed.base == 3
+
+    def test_ids_depend_on_the_field(self, base_registry: FixedBaseRegistry) -> None:
+        aes, other = NativeField(8, AES_MODULUS), NativeField(8, 0x11D)
+        assert base_registry.register(aes, 3) != base_registry.register(other, 3)
+
+    def test_eviction(self, base_registry: FixedBaseRegistry) -> None:
+        field = NativeField(8, AES_MODULUS)
+        first = base_registry.register(field, 2)
+        base_registry.register(field, 3)
+        base_registry.register(field, 4)
+        assert base_registry.get(first) is None
+        assert len(base_registry) == 2
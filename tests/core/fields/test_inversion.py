@@ -0,0 +1,67 @@
+import galois
+import pytest
+
+from src.core.fields.inversion import (
+    INVERSION_METHODS,
+    addition_chain,
+    batch_invert,
+    eea_inverse,
+    invert,
+    itoh_tsujii_inverse,
+)
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.native import NativeField
+
+
+class TestInversion:
+    @pytest.mark.parametrize("m, modulus", [(8, AES_MODULUS), *NIST_MODULI.items()])
+    def test_methods_match_galois(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field = NativeField(m, modulus)
+        gf = galois.GF(2**m, irreducible_poly=modulus)
+        for value in random_elements[:3]:
+            a = value & (field.order - 1) or 1
+            expected = int(gf(1) / gf(a))
+            assert eea_inverse(a, modulus) == expected
+            assert itoh_tsujii_inverse(field, a) == expected
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 162, 570])
+    def test_addition_chain(self, n: int) -> None:
+        reached = {1}
+        for i, j in addition_chain(n):
+            assert i in reached and j in reached
+            reached.add(i + j)
+        assert n in reached
+
+    @pytest.mark.parametrize("method", INVERSION_METHODS)
+    def test_invert_one(self, method: str) -> None:
+        assert invert(NativeField(8, AES_MODULUS), 1, method) == 1
+
+    def test_invert_zero(self) -> None:
+        with pytest.raises(
+            ValueError, match="Polynomial inversion is not possible for zero."
+        ):
+            invert(NativeField(8, AES_MODULUS), 0)
+
+    def test_invert_unknown_method(self) -> None:
+        with pytest.raises(ValueError):
+            invert(NativeField(8, AES_MODULUS), 1, "fermat")
+
+
+class TestBatchInvert:
+    def test_batch_matches_single(self, random_elements: list[int]) -> None:
+        field = NativeField(163, NIST_MODULI[163])
+        values = [value & (field.order - 1) for value in random_elements]
+        values[3] = 0
+        results = batch_invert(field, values)
+        assert results[3] is None
+        for value, result in zip(values, results):
+            if value:
+                assert result == invert(field, value)
+
+    def test_batch_all_zero(self) -> None:
+        assert batch_invert(NativeField(8, AES_MODULUS), [0, 0]) == [None, None]
+
+    def test_batch_empty(self) -> None:
+        assert batch_invert(NativeField(8, AES_MODULUS), []) == []
@@ -0,0 +1,77 @@
+import pytest
+
+from src.core.fields import AES_MODULUS, NIST_MODULI, NativeField, kernel_field
+from src.core.fields.inversion import invert
+from src.core.fields.kernels import (
+    KernelField,
+    compiled_kernels,
+    from_limbs,
+    limb_count,
+    to_limbs,
+)
+
+FIELDS = [(2, 0b111), (8, AES_MODULUS), (64, 1 << 64 | 0b11011), *NIST_MODULI.items()]
+
+
+class TestLimbs:
+    def test_limb_count(self) -> None:
+        assert [limb_count(m) for m in (1, 64, 65, 163, 571)] == [1, 1, 2, 3, 9]
+
+    def test_round_trip(self, random_elements: list[int]) -> None:
+        array = to_limbs(random_elements, 9)
+        assert array.shape == (len(random_elements), 9)
+        assert from_limbs(array) == random_elements
+
+
+@pytest.mark.parametrize("m, modulus", FIELDS)
+class TestKernelField:
+    def test_add(self, m: int, modulus: int, random_elements: list[int]) -> None:
+        field = kernel_field(m, modulus)
+        a = [x % (1 << m) for x in random_elements]
+        b = a[::-1]
+        assert from_limbs(field.add(field.pack(a), field.pack(b))) == [
+            x ^ y for x, y in zip(a, b)
+        ]
+
+    def test_mul_and_square(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field, native = kernel_field(m, modulus), NativeField(m, modulus)
+        a = [x % (1 << m) for x in random_elements]
+        b = a[::-1]
+        x, y = field.pack(a), field.pack(b)
+        assert from_limbs(field.mul(x, y)) == [native.mul(p, q) for p, q in zip(a, b)]
+        assert from_limbs(field.square(x)) == [native.square(p) for p in a]
+
+    def test_reduce(self, m: int, modulus: int, random_elements: list[int]) -> None:
+        field, native = kernel_field(m, modulus), NativeField(m, modulus)
+        wide = [x << 571 | x for x in random_elements]
+        assert from_limbs(field.reduce(to_limbs(wide, 18))) == [
+            native.reduce(value) for value in wide
+        ]
+
+    def test_invert(self, m: int, modulus: int, random_elements: list[int]) -> None:
+        field, native = kernel_field(m, modulus), NativeField(m, modulus)
+        a = [x % (1 << m) for x in random_elements] + [0]
+        assert from_limbs(field.invert(field.pack(a))) == [
+            invert(native, x) if x else 0 for x in a
+        ]
+
+
+def test_kernel_field_is_cached() -> None:
+    assert kernel_field(8, AES_MODULUS) is kernel_field(8, AES_MODULUS)
+
+
+def test_invalid_modulus_degree() -> None:
+    with pytest.raises(ValueError, match="The modulus must have degree 163."):
+        KernelField(163, AES_MODULUS)
+
+
+class TestCompiledKernels:
+    def test_every_kernel_is_listed(self) -> None:
+        field = kernel_field(8, AES_MODULUS)
+        field.mul(field.pack([3]), field.pack([7]))
+
+        counts = compiled_kernels()
+        assert counts.keys() == {"add", "mul", "square", "reduce", "invert"}
+        assert counts["mul"] >= 1
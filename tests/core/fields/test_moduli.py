@@ -0,0 +1,91 @@
+import galois
+import pytest
+
+from src.core.fields.moduli import (
+    AES_MODULUS,
+    CURVES,
+    NIST_MODULI,
+    is_irreducible,
+    poly_from_exponents,
+    prime_factors,
+    resolve_modulus,
+)
+
+
+class TestModuli:
+    def test_poly_from_exponents(self) -> None:
+        assert poly_from_exponents(8, 4, 3, 1, 0) == 0x11B
+
+    def test_aes_modulus(self) -> None:
+        assert AES_MODULUS == 0x11B
+
+    def test_nist_moduli_degrees(self) -> None:
+        for m, poly in NIST_MODULI.items():
+            assert poly.bit_length() - 1 == m
+
+    def test_curves(self) -> None:
+        assert CURVES["B-163"] == CURVES["K-163"] == (163, NIST_MODULI[163])
+        assert len(CURVES) == 2 * len(NIST_MODULI)
+
+
+class TestPrimeFactors:
+    def test_prime_factors(self) -> None:
+        assert prime_factors(255) == [3, 5, 17]
+        assert prime_factors(65535) == [3, 5, 17, 257]
+        assert prime_factors(8191) == [8191]
+        assert prime_factors(1) == []
+
+
+class TestIsIrreducible:
+    def test_known_moduli(self) -> None:
+        assert is_irreducible(AES_MODULUS)
+        assert is_irreducible(0x11D)
+        assert all(is_irreducible(poly) for poly in NIST_MODULI.values())
+
+    def test_reducible(self) -> None:
+        # x^8 + 1 = (x + 1)^8 and x^2 + x = x(x + 1)
+        assert not is_irreducible(0x101)
+        assert not is_irreducible(0b110)
+        assert not is_irreducible(1)
+
+    def test_matches_galois(self) -> None:
+        for poly in range(1 << 9, 1 << 10):
+            assert is_irreducible(poly) == galois.Poly.Int(poly).is_irreducible()
+
+    def test_cached(self) -> None:
+        is_irreducible.cache_clear()
+        is_irreducible(NIST_MODULI[571])
+        is_irreducible(NIST_MODULI[571])
+        assert is_irreducible.cache_info().hits == 1
+
+
+class TestResolveModulus:
+    def test_default(self) -> None:
+        assert resolve_modulus(8) is None
+
+    def test_hexadecimal(self) -> None:
+        assert resolve_modulus(8, "11b") == AES_MODULUS
+        assert resolve_modulus(8, "0x11D") == 0x11D
+
+    def test_curve_name(self) -> None:
+        assert resolve_modulus(163, "B-163") == NIST_MODULI[163]
+        assert resolve_modulus(233, "k-233") == NIST_MODULI[233]
+
+    def test_curve_of_another_field(self) -> None:
+        with pytest.raises(
+            ValueError,
+            match="Curve B-163 is defined over GF\\(2\\^163\\), not GF\\(2\\^233\\).",
+        ):
+            resolve_modulus(233, "B-163")
+
+    def test_wrong_degree(self) -> None:
+        with pytest.raises(ValueError, match="The modulus must have degree 8."):
+            resolve_modulus(8, "1b")
+
+    def test_reducible(self) -> None:
+        with pytest.raises(ValueError, match="The modulus must be irreducible."):
+            resolve_modulus(8, "101")
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid modulus"):
+            resolve_modulus(8, "P-256")
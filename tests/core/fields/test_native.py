@@ -0,0 +1,96 @@
+import galois
+import pytest
+
+from src.config import Config
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.native import NativeField, clmul, spread
+
+
+class TestClmul:
+    def test_clmul_small(self) -> None:
+        # (x + 1)(x + 1) = x^2 + 1 over GF(2)
+        assert clmul(0b11, 0b11) == 0b101
+
+    def test_clmul_zero_and_one(self) -> None:
+        assert clmul(0, 12345) == 0
+        assert clmul(12345, 1) == 12345
+
+    def test_clmul_matches_galois_poly(self, random_elements: list[int]) -> None:
+        a, b = random_elements[:2]
+        expected = galois.Poly.Int(a) * galois.Poly.Int(b)
+        assert clmul(a, b) == int(expected)
+
+
+class TestSpread:
+    def test_spread_small(self) -> None:
+        assert spread(0b1011) == 0b1000101
+        assert spread(0) == 0
+
+    def test_spread_matches_clmul(self, random_elements: list[int]) -> None:
+        for a in random_elements:
+            assert spread(a) == clmul(a, a)
+
+
+class TestNativeField:
+    @pytest.mark.parametrize(
+        "m, modulus",
+        [(8, AES_MODULUS), (8, 0x11D), *NIST_MODULI.items()],
+    )
+    def test_mul_matches_galois(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field = NativeField(m, modulus)
+        gf = galois.GF(2**m, irreducible_poly=modulus)
+        mask = (1 << m) - 1
+        for a, b in zip(random_elements[::2], random_elements[1::2]):
+            a, b = a & mask, b & mask
+            assert field.mul(a, b) == int(gf(a) * gf(b))
+            assert field.square(a) == int(gf(a) ** 2)
+
+    def test_dense_modulus_reduce(self) -> None:
+        # x^8 + x^7 + x^2 + x + 1 has its second term above m / 2
+        field = NativeField(8, 0x187)
+        gf = galois.GF(2**8, irreducible_poly=0x187)
+        assert field.mul(0xAB, 0xCD) == int(gf(0xAB) * gf(0xCD))
+
+    def test_element_out_of_field(self) -> None:
+        field = NativeField(8, AES_MODULUS)
+        with pytest.raises(
+            ValueError,
+            match="GF\\(2\\^8\\) scalars must be in `0 <= x < 256`, not 256.",
+        ):
+            field.element(256)
+
+    def test_invalid_modulus_degree(self) -> None:
+        with pytest.raises(ValueError):
+            NativeField(9, AES_MODULUS)
+
+    @pytest.mark.parametrize("m, modulus", [(8, AES_MODULUS), *NIST_MODULI.items()])
+    def test_square_k(
+        self,
+        m: int,
+        modulus: int,
+        random_elements: list[int],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        field = NativeField(m, modulus)
+        a = random_elements[0] & (1 << m) - 1
+        repeated = [a]
+        for _ in range(m):
+            repeated.append(field.square(repeated[-1]))
+        for k in (0, 1, 7, Config.FIELDS.SQUARE_TABLE_MIN_K, m // 2, m - 1):
+            assert field.square_k(a, k) == repeated[k]
+        # x^(2^m) = x for every element of GF(2^m)
+        assert field.square_k(a, m) == a
+        assert field.square_k(a, m + 3) == repeated[3]
+
+        monkeypatch.setattr(Config.FIELDS, "SQUARE_TABLES", 1)
+        assert field.square_k(a, 9) == repeated[9 % m]
+        assert field.square_k(a, 10) == repeated[10 % m]
+        assert field.square_k(a, 9) == repeated[9 % m]
+
+    def test_square_k_negative(self) -> None:
+        with pytest.raises(
+            ValueError, match="The number of squarings must be non-negative."
+        ):
+            NativeField(8, AES_MODULUS).square_k(3, -1)
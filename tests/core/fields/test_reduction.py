@@ -0,0 +1,46 @@
+import pytest
+
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.reduction import Reducer, reducer_for
+
+
+def naive_reduce(value: int, modulus: int) -> int:
+    degree = modulus.bit_length() - 1
+    while value.bit_length() - 1 >= degree:
+        value ^= modulus << (value.bit_length() - 1 - degree)
+    return value
+
+
+class TestReducer:
+    @pytest.mark.parametrize(
+        "modulus",
+        [
+            AES_MODULUS,
+            0x187,  # dense: x^8 + x^7 + x^2 + x + 1
+            (1 << 233) - 1,  # every term set
+            0b1100,  # no constant term
+            0x10,  # a power of x
+            *NIST_MODULI.values(),
+        ],
+    )
+    def test_reduce_matches_naive(
+        self, modulus: int, random_elements: list[int]
+    ) -> None:
+        reducer = Reducer(modulus)
+        for a, b in zip(random_elements[::2], random_elements[1::2]):
+            # Dividends up to twice the width of a 571-bit element
+            for value in (a, a * b, (a << 571) | b, a & 0xFF):
+                assert reducer.reduce(value) == naive_reduce(value, modulus)
+
+    def test_reduce_below_degree_is_identity(self) -> None:
+        assert Reducer(AES_MODULUS).reduce(0xAB) == 0xAB
+
+    def test_reduce_by_constant(self) -> None:
+        assert Reducer(1).reduce(0xABCDEF) == 0
+
+    def test_reduce_by_zero(self) -> None:
+        with pytest.raises(ValueError, match="Modulo by zero is not allowed!"):
+            Reducer(0)
+
+    def test_reducer_for_is_cached(self) -> None:
+        assert reducer_for(AES_MODULUS) is reducer_for(AES_MODULUS)
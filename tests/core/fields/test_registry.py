@@ -0,0 +1,85 @@
+import galois
+import pytest
+
+from src.config import Config
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.registry import FieldRegistry
+from src.core.fields.tables import TableField
+
+
+class TestFieldRegistry:
+    def test_get_builds_once(self, registry: FieldRegistry) -> None:
+        first = registry.get(8)
+        second = registry.get(8)
+        assert first is second
+        assert registry.misses == 1
+        assert registry.hits == 1
+
+    def test_get_default_matches_library(self, registry: FieldRegistry) -> None:
+        assert registry.get(4) is galois.GF(2**4)
+        assert registry.modulus(4) == int(galois.GF(2**4).irreducible_poly)
+
+    def test_standard_defaults(self, registry: FieldRegistry) -> None:
+        assert registry.modulus(8) == AES_MODULUS
+        assert int(registry.get(8).irreducible_poly) == AES_MODULUS
+        assert registry.native(8).modulus == AES_MODULUS
+        for m, modulus in NIST_MODULI.items():
+            assert registry.modulus(m) == modulus
+        assert registry.misses == 1
+
+    def test_get_explicit_modulus(self, registry: FieldRegistry) -> None:
+        gf = registry.get(8, 0x11D)
+        assert int(gf.irreducible_poly) == 0x11D
+        assert registry.get(8) is not gf
+
+    def test_get_without_conway_poly_uses_nist(self, registry: FieldRegistry) -> None:
+        assert registry.modulus(571) == NIST_MODULI[571]
+
+    def test_eviction(self, registry: FieldRegistry) -> None:
+        registry.get(2)
+        registry.get(3)
+        registry.get(4)
+        stats = registry.stats()
+        assert stats["evictions"] == 1
+        assert [field["m"] for field in stats["fields"]] == [3, 4]
+
+    def test_preloaded_fields_are_pinned(self, registry: FieldRegistry) -> None:
+        registry.preload([(5, None)])
+        registry.get(2)
+        registry.get(3)
+        registry.get(4)
+        fields = {field["m"]: field for field in registry.stats()["fields"]}
+        assert fields[5]["pinned"]
+        assert 2 not in fields
+
+    def test_native_preload_skips_galois(
+        self, registry: FieldRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "native")
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {})
+        registry.preload([(8, None)])
+        field = registry.native(8)
+        for m in (163, 233, 283):
+            registry.native(m)
+        assert registry.stats()["size"] == 0
+        assert registry.native(8) is field
+
+    def test_clear(self, registry: FieldRegistry) -> None:
+        registry.get(2)
+        registry.clear()
+        assert registry.stats()["size"] == 0
+        assert registry.misses == 0
+        assert registry.modulus(8) == AES_MODULUS
+
+    def test_native_shares_modulus(self, registry: FieldRegistry) -> None:
+        field = registry.native(8)
+        assert field.modulus == int(registry.get(8).irreducible_poly)
+        assert registry.native(8) is field
+
+    def test_native_uses_tables_for_small_degrees(
+        self, registry: FieldRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        assert isinstance(registry.native(8, AES_MODULUS), TableField)
+        assert not isinstance(registry.native(163, NIST_MODULI[163]), TableField)
+        monkeypatch.setattr(Config.FIELDS, "TABLE_MAX_M", 0)
+        assert not isinstance(registry.native(8, 0x11D), TableField)
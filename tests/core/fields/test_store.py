@@ -0,0 +1,200 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.fields.exponentiation import FixedBase, sliding_window_pow
+from src.core.fields.moduli import AES_MODULUS, NIST_MODULI
+from src.core.fields.native import NativeField
+from src.core.fields.store import IntTable, TableStore
+from src.core.fields.tables import TableField, table_field
+
+
+class TestIntTable:
+    def test_pack_round_trip(self) -> None:
+        values = [0, 1, 255, 256, (1 << 72) - 1]
+        table = IntTable(memoryview(IntTable.pack(values, 9)), 9)
+        assert len(table) == 5
+        assert [table[i] for i in range(len(table))] == values
+
+
+class TestTableStore:
+    def test_path_is_versioned(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True, version=3)
+        assert store.path(8, AES_MODULUS, "log") == os.path.join(
+            str(tmp_path), "v3", "gf2^8-11b", "log.bin"
+        )
+
+    def test_builds_once_across_processes(self, tmp_path: Path) -> None:
+        calls = []
+
+        def build() -> bytes:
+            calls.append(1)
+            return b"table"
+
+        first = TableStore(str(tmp_path), enabled=True)
+        assert bytes(first.load(8, AES_MODULUS, "log", build)) == b"table"
+        assert bytes(first.load(8, AES_MODULUS, "log", build)) == b"table"
+        # A second store stands for another worker mapping the same directory
+        second = TableStore(str(tmp_path), enabled=True)
+        assert bytes(second.load(8, AES_MODULUS, "log", build)) == b"table"
+        assert len(calls) == 1
+        assert (first.builds, first.loads, len(first)) == (1, 1, 1)
+        assert (second.builds, second.loads) == (0, 1)
+
+    def test_tables_are_read_only(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        view = store.load(8, AES_MODULUS, "log", lambda: b"table")
+        with pytest.raises(TypeError):
+            view[0] = 0
+
+    def test_keys_are_distinct(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        store.load(8, AES_MODULUS, "log", lambda: b"a")
+        assert bytes(store.load(8, 0x11D, "log", lambda: b"b")) == b"b"
+        assert bytes(store.load(8, AES_MODULUS, "square8", lambda: b"c")) == b"c"
+        newer = TableStore(str(tmp_path), enabled=True, version=store.version + 1)
+        assert bytes(newer.load(8, AES_MODULUS, "log", lambda: b"d")) == b"d"
+
+    def test_empty_file_is_rebuilt(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        path = store.path(8, AES_MODULUS, "log")
+        os.makedirs(os.path.dirname(path))
+        open(path, "wb").close()
+        assert bytes(store.load(8, AES_MODULUS, "log", lambda: b"table")) == b"table"
+        assert store.builds == 1
+
+    def test_truncated_file_is_rebuilt(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        store.load(8, AES_MODULUS, "log", lambda: b"table")
+        path = store.path(8, AES_MODULUS, "log")
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 1)
+        other = TableStore(str(tmp_path), enabled=True)
+        assert bytes(other.load(8, AES_MODULUS, "log", lambda: b"table")) == b"table"
+        assert other.builds == 1
+
+    def test_stale_file_is_rebuilt(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        store.load(8, 0x11D, "log", lambda: b"other")
+        # A file of another field under the path of this one
+        os.makedirs(os.path.dirname(store.path(8, AES_MODULUS, "log")))
+        os.replace(store.path(8, 0x11D, "log"), store.path(8, AES_MODULUS, "log"))
+        assert bytes(store.load(8, AES_MODULUS, "log", lambda: b"table")) == b"table"
+        assert store.builds == 2
+
+    def test_mappings_are_capped(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True, max_size=2)
+        first = store.load(8, AES_MODULUS, "a", lambda: b"a")
+        store.load(8, AES_MODULUS, "b", lambda: b"b")
+        store.load(8, AES_MODULUS, "a", lambda: b"a")
+        store.load(8, AES_MODULUS, "c", lambda: b"c")
+        assert (len(store), store.evictions) == (2, 1)
+        # The least recently used table was released; views already handed out stay valid
+        assert bytes(first) == b"a"
+        store.load(8, AES_MODULUS, "b", lambda: b"b")
+        assert (store.builds, store.loads) == (3, 4)
+
+    def test_concurrent_loads_build_once(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        calls = []
+
+        def build() -> bytes:
+            calls.append(1)
+            time.sleep(0.05)
+            return b"table"
+
+        threads = [
+            threading.Thread(target=store.load, args=(8, AES_MODULUS, "log", build))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert (store.builds, store.loads) == (1, 1)
+
+    def test_builds_do_not_block_other_tables(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        started, release = threading.Event(), threading.Event()
+
+        def slow() -> bytes:
+            started.set()
+            release.wait(5)
+            return b"slow"
+
+        thread = threading.Thread(
+            target=store.load, args=(8, AES_MODULUS, "slow", slow)
+        )
+        thread.start()
+        started.wait(5)
+        assert bytes(store.load(8, AES_MODULUS, "fast", lambda: b"fast")) == b"fast"
+        release.set()
+        thread.join()
+        assert len(store) == 2
+
+    def test_failed_build_is_retried(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+
+        def fail() -> bytes:
+            raise RuntimeError("build failed")
+
+        with pytest.raises(RuntimeError):
+            store.load(8, AES_MODULUS, "log", fail)
+        assert store._building == {}
+        assert bytes(store.load(8, AES_MODULUS, "log", lambda: b"table")) == b"table"
+        assert store._building == {}
+
+    def test_ints(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        table = store.ints(8, AES_MODULUS, "square8", 2, lambda: [1, 2, 300])
+        assert [table[0], table[1], table[2]] == [1, 2, 300]
+
+    def test_clear(self, tmp_path: Path) -> None:
+        store = TableStore(str(tmp_path), enabled=True)
+        store.load(8, AES_MODULUS, "log", lambda: b"table")
+        store.clear()
+        assert len(store) == 0
+        assert (store.builds, store.evictions) == (0, 0)
+        store.load(8, AES_MODULUS, "log", lambda: b"other")
+        assert store.builds == 0
+
+
+class TestSharedTables:
+    def test_table_field(self, shared_tables: TableStore) -> None:
+        field = table_field(8, AES_MODULUS)
+        private = TableField(8, AES_MODULUS)
+        assert isinstance(field.exp, memoryview)
+        assert os.path.exists(shared_tables.path(8, AES_MODULUS, "log"))
+        assert field.generator == private.generator
+        assert list(field.exp) == list(private.exp)
+        assert list(field.log) == list(private.log)
+        assert field.mul_many([0x57, 0], [0x83, 1]) == [0xC1, 0]
+        assert table_field(8, AES_MODULUS).mul(0x57, 0x83) == 0xC1
+        assert (shared_tables.builds, shared_tables.loads) == (1, 1)
+
+    def test_square_tables(
+        self, shared_tables: TableStore, random_elements: list[int]
+    ) -> None:
+        m, modulus = 163, NIST_MODULI[163]
+        field = NativeField(m, modulus)
+        private = NativeField(m, modulus)
+        a = random_elements[0] & (1 << m) - 1
+        assert field.square_k(a, 20) == private.square_k(a, 20)
+        assert isinstance(field._square_table(20), IntTable)
+        assert os.path.exists(shared_tables.path(m, modulus, "square20"))
+
+    def test_fixed_base_tables_stay_private(
+        self, shared_tables: TableStore, random_elements: list[int]
+    ) -> None:
+        m, modulus = 233, NIST_MODULI[233]
+        field = NativeField(m, modulus)
+        a = random_elements[1] & (1 << m) - 1 | 1
+        fixed = FixedBase(field, a)
+        assert not os.path.exists(os.path.dirname(shared_tables.path(m, modulus, "")))
+        assert shared_tables.loads == 0
+        for e in (0, 1, 15, 16, random_elements[2], -3):
+            assert fixed.pow(e) == sliding_window_pow(field, a, e)
@@ -0,0 +1,91 @@
+from array import array
+
+import galois
+import pytest
+
+from src.core.fields.inversion import batch_invert, invert
+from src.core.fields.moduli import AES_MODULUS
+from src.core.fields.native import NativeField
+from src.core.fields.tables import TableField
+
+
+class TestTableField:
+    @pytest.mark.parametrize(
+        "m, modulus", [(1, 0b11), (4, 0x13), (8, AES_MODULUS), (8, 0x11D), (12, 0x1053)]
+    )
+    def test_matches_native_field(
+        self, m: int, modulus: int, random_elements: list[int]
+    ) -> None:
+        field = TableField(m, modulus)
+        native = NativeField(m, modulus)
+        mask = field.order - 1
+        for a, b in zip(random_elements[::2], random_elements[1::2]):
+            a, b = a & mask, b & mask
+            assert field.mul(a, b) == native.mul(a, b)
+            assert field.square(a) == native.square(a)
+            assert field.square_k(a, 5) == native.square_k(a, 5)
+            if a:
+                assert native.mul(field.inverse(a), a) == 1
+
+    def test_matches_galois(self) -> None:
+        field = TableField(8, 0x11D)
+        gf = galois.GF(2**8, irreducible_poly=0x11D)
+        assert field.mul(0xA1, 0xFF) == 0x0B == int(gf(0xA1) * gf(0xFF))
+        assert field.mul(0xA1, field.inverse(0xFF)) == 0x54
+        assert field.square(0xA1) == 0x66
+        assert field.pow(0xA1, 1000) == int(gf(0xA1) ** 1000)
+
+    def test_generator_is_primitive(self) -> None:
+        field = TableField(8, AES_MODULUS)
+        assert field.generator == 3
+        assert sorted(field.exp[:255]) == list(range(1, 256))
+        assert all(field.exp[field.log[x]] == x for x in range(1, 256))
+
+    def test_pow(self) -> None:
+        field = TableField(8, AES_MODULUS)
+        assert field.pow(0x53, -1) == field.inverse(0x53) == 0xCA
+        assert field.pow(0x53, 255) == 1
+        assert field.pow(0, 0) == 1
+        assert field.pow(0, 5) == 0
+        with pytest.raises(ValueError, match="inversion is not possible for zero"):
+            field.pow(0, -1)
+
+    def test_inverse_of_zero(self) -> None:
+        field = TableField(8, AES_MODULUS)
+        with pytest.raises(ValueError, match="inversion is not possible for zero"):
+            field.inverse(0)
+        with pytest.raises(ValueError, match="inversion is not possible for zero"):
+            invert(field, 0)
+
+    def test_square_k_negative(self) -> None:
+        with pytest.raises(ValueError, match="must be non-negative"):
+            TableField(8, AES_MODULUS).square_k(3, -1)
+
+    def test_many(self, random_elements: list[int]) -> None:
+        field = TableField(16, 0x1100B)
+        a = [value & 0xFFFF for value in random_elements[:10]] + [0]
+        b = [value & 0xFFFF for value in random_elements[10:]] + [7]
+        assert field.mul_many(a, b) == [field.mul(x, y) for x, y in zip(a, b)]
+        assert field.inverse_many(a) == batch_invert(field, a)
+        assert field.inverse_many(a)[-1] is None
+
+    def test_prebuilt_tables(self) -> None:
+        built = TableField(8, AES_MODULUS)
+        exp = memoryview(array("H", built.exp)).cast("B").cast("H")
+        field = TableField(8, AES_MODULUS, exp, memoryview(built.log))
+        assert field.generator == built.generator
+        assert field.mul(0x57, 0x83) == 0xC1
+        assert field.mul_many([0x57], [0x83]) == [0xC1]
+
+    def test_prebuilt_tables_wrong_size(self) -> None:
+        with pytest.raises(ValueError, match="do not match GF\\(2\\^8\\)"):
+            TableField(8, AES_MODULUS, array("H", [1]), array("H", [0]))
+
+    def test_reducible_modulus(self) -> None:
+        # x^8 + 1 = (x + 1)^8
+        with pytest.raises(ValueError, match="must be irreducible"):
+            TableField(8, 0x101)
+
+    def test_degree_limit(self) -> None:
+        with pytest.raises(ValueError, match="limited to m <= 16"):
+            TableField(17, 0x20009)
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+import pytest
+
+from src.config import Config
+from src.core.fields import field_registry
+from src.core.services.addition import add
+from src.core.services.batch import batch_operation
+from src.core.services.division import divide
+from src.core.services.mod_reduction import modReduction
+from src.core.services.multiplication import multiplication as multiply
+
+
+class TestBatchOperation:
+    def test_batch_matches_single_operations(
+        self, valid_batch_input: dict[str, list[str]], m_small: int
+    ) -> None:
+        poly1, poly2 = valid_batch_input["poly1"][:2], valid_batch_input["poly2"][:2]
+        for operation, single in (
+            ("addition", add),
+            ("multiplication", multiply),
+            ("division", divide),
+        ):
+            results = batch_operation(operation, poly1, poly2, "hexadecimal", m_small)
+            assert results == [
+                single(p1, p2, "hexadecimal", m_small) for p1, p2 in zip(poly1, poly2)
+            ]
+
+    def test_batch_mod_reduction(self, m_small: int) -> None:
+        results = batch_operation(
+            "mod-reduction", ["A1"], ["FF"], "hexadecimal", m_small
+        )
+        assert results == [modReduction("A1", "FF", "hexadecimal", m_small)]
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_batch_per_item_errors(
+        self,
+        valid_batch_input: dict[str, list[str]],
+        m_small: int,
+        backend: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        poly1, poly2 = valid_batch_input["poly1"], valid_batch_input["poly2"]
+        results = batch_operation("division", poly1, poly2, "hexadecimal", m_small)
+        assert results[:2] == [
+            divide(p1, p2, "hexadecimal", m_small) for p1, p2 in zip(poly1, poly2[:2])
+        ]
+        assert isinstance(results[2], ValueError)
+        assert str(results[2]) == "GF(2^8) scalars must be in `0 <= x < 256`, not 4081."
+        assert isinstance(results[3], ValueError)
+        assert str(results[3]) == "Division by zero is not allowed in Galois fields"
+
+    @pytest.mark.parametrize("table_max_m", [16, 0])
+    @pytest.mark.parametrize(
+        "operation", ["addition", "subtraction", "multiplication", "division"]
+    )
+    def test_batch_kernels_match_python(
+        self,
+        valid_batch_input: dict[str, list[str]],
+        m_small: int,
+        operation: str,
+        table_max_m: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        poly1, poly2 = valid_batch_input["poly1"], valid_batch_input["poly2"]
+        expected = batch_operation(operation, poly1, poly2, "hexadecimal", m_small)
+        # Without tables the small field goes through the limb-array kernels
+        monkeypatch.setattr(Config.FIELDS, "TABLE_MAX_M", table_max_m)
+        monkeypatch.setattr(field_registry, "_native", OrderedDict())
+        monkeypatch.setattr(Config.FIELDS, "KERNEL_MIN_BATCH", 1)
+        results = batch_operation(operation, poly1, poly2, "hexadecimal", m_small)
+        assert [str(r) if isinstance(r, ValueError) else r for r in results] == [
+            str(r) if isinstance(r, ValueError) else r for r in expected
+        ]
+
+    def test_batch_invalid_operation(self, m_small: int) -> None:
+        with pytest.raises(ValueError):
+            batch_operation("power", ["A1"], ["FF"], "hexadecimal", m_small)
+
+    def test_batch_length_mismatch(self, m_small: int) -> None:
+        with pytest.raises(ValueError):
+            batch_operation("addition", ["A1"], [], "hexadecimal", m_small)
@@ -1,5 +1,7 @@
 import pytest
 
+from src.config import Config
+from src.core.fields import field_registry
 from src.core.services.division import divide
 
 
@@ -9,7 +11,7 @@ def test_divide_binary_small_m_successful(
     ) -> None:
         poly1, poly2, input_type = valid_binary_input_small_m.values()
         result = divide(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
-        assert result == int("10001111", 2)
+        assert result == int("10001100", 2)
 
     def test_divide_binary_large_m_successful(
         self, valid_binary_input_large_m_div: dict[str, str], m_large: int
@@ -17,7 +19,7 @@ def test_divide_binary_large_m_successful(
         poly1, poly2, input_type = valid_binary_input_large_m_div.values()
         result = divide(poly1=poly1, poly2=poly2, input_type=input_type, m=m_large)
         assert result == int(
-            "10110000010011001101000011010101011100010111111110010011100000001011010010000001110111011000001001100110100001101010101110001011111111001001110000000101101001000000111011101100000100110011010000110101010111000101111111100100110000011",
+            "10010000100011010101100100101101100000111000110011101010000010010110011010110110001100101111110101101110110100001001001010100111110000110111010101111011010010111100000111101100110111000110110111111010000100010110011111100011011101100",
             2,
         )
 
@@ -26,15 +28,63 @@ def test_divide_hex_small_m_successful(
     ) -> None:
         poly1, poly2, input_type = valid_hex_input_small_m.values()
         result = divide(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
+        assert result == int("33", 16)
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_divide_custom_modulus(
+        self,
+        valid_hex_input_small_m: dict[str, str],
+        m_small: int,
+        backend: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        poly1, poly2, input_type = valid_hex_input_small_m.values()
+        result = divide(poly1, poly2, input_type, m_small, 0x11D)
         assert result == int("54", 16)
 
+    @pytest.mark.parametrize("m", [163, 571])
+    def test_native_division_skips_galois(
+        self, m: int, random_elements: list[int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        a, b = (value & (1 << m) - 1 for value in random_elements[:2])
+        gf = field_registry.get(m)
+        expected = int(gf(a) / gf(b))
+
+        def no_galois(*args: object) -> None:
+            raise AssertionError("galois field built")
+
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "native")
+        monkeypatch.setattr(field_registry, "get", no_galois)
+        result = divide(a, b, "hexadecimal", m)
+        assert type(result) is int
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "setting", [("BACKEND", "galois"), ("INVERSION", "galois")]
+    )
+    def test_galois_division(
+        self,
+        valid_hex_input_large_m_div: dict[str, str],
+        m_large: int,
+        setting: tuple[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, *setting)
+        poly1, poly2, input_type = valid_hex_input_large_m_div.values()
+        result = divide(poly1, poly2, input_type, m_large)
+        assert type(result) is int
+        assert result == int(
+            "18C6318C6318C6318C6318C6318C6318C6318C63294A5294A5294A5294B", 16
+        )
+
     def test_divide_hex_large_m_successful(
         self, valid_hex_input_large_m_div: dict[str, str], m_large: int
     ) -> None:
         poly1, poly2, input_type = valid_hex_input_large_m_div.values()
         result = divide(poly1=poly1, poly2=poly2, input_type=input_type, m=m_large)
         assert result == int(
-            "5294A5294A5294A5294A5294A5294A5294A5294A5294A5294A5294A53A", 16
+            "18C6318C6318C6318C6318C6318C6318C6318C63294A5294A5294A5294B", 16
         )
 
     def test_divide_invalid_bin_input(
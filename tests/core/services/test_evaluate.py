@@ -0,0 +1,45 @@
+import pytest
+
+from src.config import Config
+from src.core.services.division import divide
+from src.core.services.evaluate import evaluate
+from src.core.services.multiplication import multiplication as multiply
+
+
+class TestEvaluate:
+    def test_evaluate_matches_single_operations(
+        self, valid_batch_input: dict[str, list[str]], m_small: int
+    ) -> None:
+        bindings = [
+            {"a": p1, "b": p2}
+            for p1, p2 in zip(
+                valid_batch_input["poly1"][:2], valid_batch_input["poly2"][:2]
+            )
+        ]
+        assert evaluate("a * b / b", bindings, "hexadecimal", m_small) == [
+            divide(
+                multiply(binding["a"], binding["b"], "hexadecimal", m_small),
+                binding["b"],
+                "hexadecimal",
+                m_small,
+            )
+            for binding in bindings
+        ]
+
+    def test_evaluate_per_binding_errors(self, m_small: int) -> None:
+        results = evaluate(
+            "a + b",
+            [{"a": "1"}, {"a": "zz", "b": "1"}, {"a": "1", "b": "1"}],
+            "hexadecimal",
+            m_small,
+        )
+        assert str(results[0]) == "Missing variable 'b'."
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 0
+
+    def test_evaluate_too_many_bindings(
+        self, m_small: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.EXPRESSIONS, "MAX_BINDINGS", 1)
+        with pytest.raises(ValueError, match="At most 1 bindings"):
+            evaluate("a", [{"a": "1"}, {"a": "1"}], "hexadecimal", m_small)
@@ -1,7 +1,14 @@
+from collections import OrderedDict
+
 import galois
 import pytest
 
+from src.config import Config
+from src.core.fields import field_registry
+from src.core.services.division import divide
 from src.core.services.inverse import inverse as inverse_service
+from src.core.services.inverse import inverse_batch
+from src.core.services.multiplication import multiplication
 
 
 class TestInverse:
@@ -10,8 +17,7 @@ def test_inverse_binary_small_m_successful(
     ) -> None:
         poly = valid_binary_input_small_m["poly1"]
         input_type = valid_binary_input_small_m["input_type"]
-        result_str = inverse_service(poly=poly, input_type=input_type, m=m_small)
-        result = int(result_str, 2)
+        result = inverse_service(poly=poly, input_type=input_type, m=m_small)
 
         GF = galois.GF(2**m_small, irreducible_poly=0x11B)
         poly_int = int(poly, 2)
@@ -25,8 +31,7 @@ def test_inverse_binary_large_m_successful(
     ) -> None:
         poly = valid_binary_input_large_m["poly1"]
         input_type = valid_binary_input_large_m["input_type"]
-        result_str = inverse_service(poly=poly, input_type=input_type, m=m_large)
-        result = int(result_str, 2)
+        result = inverse_service(poly=poly, input_type=input_type, m=m_large)
 
         irreducible_poly_233 = (1 << 233) | (1 << 74) | 1
         GF = galois.GF(2**m_large, irreducible_poly=irreducible_poly_233)
@@ -41,8 +46,7 @@ def test_inverse_hex_small_m_successful(
     ) -> None:
         poly = valid_hex_input_small_m["poly1"]
         input_type = valid_hex_input_small_m["input_type"]
-        result_str = inverse_service(poly=poly, input_type=input_type, m=m_small)
-        result = int(result_str, 16)
+        result = inverse_service(poly=poly, input_type=input_type, m=m_small)
 
         GF = galois.GF(2**m_small, irreducible_poly=0x11B)
         poly_int = int(poly, 16)
@@ -56,8 +60,7 @@ def test_inverse_hex_large_m_successful(
     ) -> None:
         poly = valid_hex_input_large_m["poly1"]
         input_type = valid_hex_input_large_m["input_type"]
-        result_str = inverse_service(poly=poly, input_type=input_type, m=m_large)
-        result = int(result_str, 16)
+        result = inverse_service(poly=poly, input_type=input_type, m=m_large)
 
         irreducible_poly_233 = (1 << 233) | (1 << 74) | 1
         GF = galois.GF(2**m_large, irreducible_poly=irreducible_poly_233)
@@ -82,3 +85,60 @@ def test_inverse_invalid_hex_input(
         input_type = invalid_hexadecimal_input["input_type"]
         with pytest.raises(ValueError):
             inverse_service(poly=poly, input_type=input_type, m=m_small)
+
+    @pytest.mark.parametrize("method", ["galois", "itoh-tsujii"])
+    def test_inverse_configured_method(
+        self,
+        valid_hex_input_large_m: dict[str, str],
+        m_large: int,
+        method: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "INVERSION", method)
+        poly = valid_hex_input_large_m["poly1"]
+        input_type = valid_hex_input_large_m["input_type"]
+        expected = inverse_service(poly=poly, input_type=input_type, m=m_large)
+        monkeypatch.setattr(Config.FIELDS, "INVERSION", "eea")
+        assert inverse_service(poly=poly, input_type=input_type, m=m_large) == expected
+
+    @pytest.mark.parametrize("m", [8, 163, 233, 283])
+    def test_inverse_matches_other_services(self, m: int) -> None:
+        inverse_int = inverse_service("02", "hexadecimal", m)
+        assert multiplication(2, inverse_int, "hexadecimal", m) == 1
+        assert divide(1, 2, "hexadecimal", m) == inverse_int
+
+    def test_inverse_custom_modulus(self, m_small: int) -> None:
+        assert inverse_service("A1", "hexadecimal", m_small, 0x11D) == 0x82
+
+    def test_inverse_zero(self, m_small: int) -> None:
+        with pytest.raises(
+            ValueError, match="Polynomial inversion is not possible for zero."
+        ):
+            inverse_service(poly="00", input_type="hexadecimal", m=m_small)
+
+    def test_inverse_batch(
+        self, valid_batch_input: dict[str, list[str]], m_small: int
+    ) -> None:
+        polys = valid_batch_input["poly1"] + ["00"]
+        results = inverse_batch(polys=polys, input_type="hexadecimal", m=m_small)
+        assert results[0] == inverse_service("A1", "hexadecimal", m_small)
+        assert results[1] == inverse_service("AA", "hexadecimal", m_small)
+        assert str(results[2]) == "GF(2^8) scalars must be in `0 <= x < 256`, not 4081."
+        assert results[3] == inverse_service("03", "hexadecimal", m_small)
+        assert str(results[4]) == "Polynomial inversion is not possible for zero."
+
+    @pytest.mark.parametrize("table_max_m", [16, 0])
+    def test_inverse_batch_kernels(
+        self,
+        valid_batch_input: dict[str, list[str]],
+        m_small: int,
+        table_max_m: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        polys = valid_batch_input["poly1"] + ["00"]
+        expected = inverse_batch(polys=polys, input_type="hexadecimal", m=m_small)
+        monkeypatch.setattr(Config.FIELDS, "TABLE_MAX_M", table_max_m)
+        monkeypatch.setattr(field_registry, "_native", OrderedDict())
+        monkeypatch.setattr(Config.FIELDS, "KERNEL_MIN_BATCH", 1)
+        results = inverse_batch(polys=polys, input_type="hexadecimal", m=m_small)
+        assert [str(r) for r in results] == [str(r) for r in expected]
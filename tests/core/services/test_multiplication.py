@@ -1,5 +1,6 @@
 import pytest
 
+from src.config import Config
 from src.core.services.multiplication import multiplication as multiply
 
 
@@ -9,7 +10,7 @@ def test_multiplication_binary_small_m_successful(
     ) -> None:
         poly1, poly2, input_type = valid_binary_input_small_m.values()
         result = multiply(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
-        assert result == int("11001001", 2)
+        assert result == int("11011100", 2)
 
     def test_multiplication_binary_large_m_successful(
         self, valid_binary_input_large_m: dict[str, str], m_large: int
@@ -23,6 +24,19 @@ def test_multiplication_hex_small_m_successful(
     ) -> None:
         poly1, poly2, input_type = valid_hex_input_small_m.values()
         result = multiply(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
+        assert result == int("48", 16)
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_multiplication_custom_modulus(
+        self,
+        valid_hex_input_small_m: dict[str, str],
+        m_small: int,
+        backend: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        poly1, poly2, input_type = valid_hex_input_small_m.values()
+        result = multiply(poly1, poly2, input_type, m_small, 0x11D)
         assert result == int("b", 16)
 
     def test_multiplication_hex_large_m_successful(
@@ -52,3 +66,14 @@ def test_multiplication_empty_input(
         with pytest.raises(ValueError):
             poly1, poly2, input_type = empty_input.values()
             multiply(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
+
+    def test_multiplication_galois_backend(
+        self,
+        valid_binary_input_small_m: dict[str, str],
+        m_small: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "galois")
+        poly1, poly2, input_type = valid_binary_input_small_m.values()
+        result = multiply(poly1=poly1, poly2=poly2, input_type=input_type, m=m_small)
+        assert result == int("11011100", 2)
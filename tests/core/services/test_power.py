@@ -0,0 +1,98 @@
+import pytest
+
+from src.config import Config
+from src.core.fields.exponentiation import FixedBaseRegistry
+from src.core.services import power as power_module
+from src.core.services.multiplication import multiplication as multiply
+from src.core.services.power import power, power_fixed_base, register_base
+
+
+class TestPower:
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_power_matches_repeated_multiplication(
+        self, m_small: int, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        expected = 1
+        for exponent in range(10):
+            assert power("A1", exponent, "hexadecimal", m_small) == expected
+            expected = multiply(format(expected, "x"), "A1", "hexadecimal", m_small)
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_power_large_exponent(
+        self, m_small: int, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        # The multiplicative group of GF(2^8) has order 255
+        assert power("A1", 255 * 2**100 + 3, "hexadecimal", m_small) == power(
+            "A1", 3, "hexadecimal", m_small
+        )
+        assert power("00", 2**100, "hexadecimal", m_small) == 0
+
+    def test_power_negative_exponent(self, m_small: int) -> None:
+        inverse = power("A1", -1, "hexadecimal", m_small)
+        assert multiply(format(inverse, "x"), "A1", "hexadecimal", m_small) == 1
+
+    def test_power_binary_large_m(
+        self, valid_binary_input_large_m: dict[str, str], m_large: int
+    ) -> None:
+        poly, _, input_type = valid_binary_input_large_m.values()
+        assert power(poly, 2, input_type, m_large) == multiply(
+            poly, poly, input_type, m_large
+        )
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_power_zero_negative_exponent(
+        self, m_small: int, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        with pytest.raises(
+            ValueError, match="Polynomial inversion is not possible for zero."
+        ):
+            power("00", -1, "hexadecimal", m_small)
+
+    def test_power_invalid_input(
+        self, invalid_hexadecimal_input: dict[str, str], m_small: int
+    ) -> None:
+        poly, _, input_type = invalid_hexadecimal_input.values()
+        with pytest.raises(ValueError):
+            power(poly, 3, input_type, m_small)
+
+
+class TestFixedBasePower:
+    def test_fixed_base_matches_power(self, m_small: int) -> None:
+        base_id = register_base("A1", "hexadecimal", m_small)
+        for exponent in (0, 1, 7, 200, -9):
+            assert power_fixed_base(base_id, exponent, m_small) == power(
+                "A1", exponent, "hexadecimal", m_small
+            )
+
+    def test_unknown_base(self, m_small: int) -> None:
+        with pytest.raises(ValueError, match="Unknown base 'missing'"):
+            power_fixed_base("missing", 3, m_small)
+
+    def test_unknown_base_is_rebuilt_from_poly(
+        self, m_small: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base_id = register_base("A1", "hexadecimal", m_small)
+        monkeypatch.setattr(power_module, "fixed_bases", FixedBaseRegistry())
+        assert power_fixed_base(
+            base_id, 5, m_small, None, "A1", "hexadecimal"
+        ) == power("A1", 5, "hexadecimal", m_small)
+
+    def test_poly_must_match_base_id(
+        self, m_small: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base_id = register_base("A1", "hexadecimal", m_small)
+        monkeypatch.setattr(power_module, "fixed_bases", FixedBaseRegistry())
+        with pytest.raises(ValueError, match="is not a2"):
+            power_fixed_base(base_id, 5, m_small, None, "A2", "hexadecimal")
+
+    def test_base_from_another_field(self, m_small: int, m_large: int) -> None:
+        base_id = register_base("A1", "hexadecimal", m_small)
+        with pytest.raises(ValueError, match="belongs to GF\\(2\\^8\\)"):
+            power_fixed_base(base_id, 3, m_large)
+
+    def test_register_zero_base(self, m_small: int) -> None:
+        with pytest.raises(ValueError, match="The fixed base must be non-zero."):
+            register_base("00", "hexadecimal", m_small)
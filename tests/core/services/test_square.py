@@ -0,0 +1,52 @@
+import pytest
+
+from src.config import Config
+from src.core.services.multiplication import multiplication as multiply
+from src.core.services.square import square
+
+
+class TestSquare:
+    def test_square_matches_multiplication(
+        self, valid_hex_input_small_m: dict[str, str], m_small: int
+    ) -> None:
+        poly, _, input_type = valid_hex_input_small_m.values()
+        assert square(poly, input_type, m_small) == multiply(
+            poly, poly, input_type, m_small
+        )
+
+    def test_square_binary_large_m(
+        self, valid_binary_input_large_m: dict[str, str], m_large: int
+    ) -> None:
+        poly, _, input_type = valid_binary_input_large_m.values()
+        assert square(poly, input_type, m_large) == multiply(
+            poly, poly, input_type, m_large
+        )
+
+    @pytest.mark.parametrize("backend", ["native", "galois"])
+    def test_square_k(
+        self, m_small: int, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        expected = 0xA1
+        for k in range(12):
+            assert square("A1", "hexadecimal", m_small, k) == expected
+            expected = square(format(expected, "x"), "hexadecimal", m_small)
+
+    def test_square_negative_k(self, m_small: int) -> None:
+        with pytest.raises(
+            ValueError, match="The number of squarings must be non-negative."
+        ):
+            square("A1", "hexadecimal", m_small, -1)
+
+    def test_square_invalid_input(
+        self, invalid_hexadecimal_input: dict[str, str], m_small: int
+    ) -> None:
+        poly, _, input_type = invalid_hexadecimal_input.values()
+        with pytest.raises(ValueError):
+            square(poly, input_type, m_small)
+
+    def test_square_out_of_field(self, m_small: int) -> None:
+        with pytest.raises(
+            ValueError, match="GF\\(2\\^8\\) scalars must be in `0 <= x < 256`"
+        ):
+            square("FF1", "hexadecimal", m_small)
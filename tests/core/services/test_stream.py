@@ -0,0 +1,47 @@
+import json
+
+from src.core.services.inverse import inverse
+from src.core.services.stream import stream_chunk
+
+
+def line(**item: str) -> bytes:
+    return json.dumps(item).encode()
+
+
+class TestStreamChunk:
+    def test_mixed_operations_keep_their_order(self, m_small: int) -> None:
+        lines = [
+            line(operation="multiplication", poly1="A1", poly2="FF"),
+            line(operation="inverse", poly="A1"),
+            line(operation="addition", poly1="A1", poly2="FF"),
+            line(operation="inverse", poly="03"),
+        ]
+        results = stream_chunk(lines, "hexadecimal", m_small)
+        assert results == [
+            0x48,
+            inverse("A1", "hexadecimal", m_small),
+            0x5E,
+            inverse("03", "hexadecimal", m_small),
+        ]
+
+    def test_invalid_lines(self, m_small: int) -> None:
+        lines = [
+            b"not json",
+            b"[1, 2]",
+            line(operation="power", poly="A1"),
+            line(operation="addition", poly1="A1"),
+            json.dumps({"operation": "inverse", "poly": 3}).encode(),
+            None,
+            line(operation="division", poly1="A1", poly2="00"),
+            line(operation="addition", poly1="A1", poly2="FF"),
+        ]
+        results = stream_chunk(lines, "hexadecimal", m_small)
+        errors = [str(result) for result in results[:-1]]
+        assert "Expecting value" in errors[0]
+        assert errors[1] == "Every line must be a JSON object."
+        assert errors[2].startswith("Invalid operation.")
+        assert errors[3] == "Missing field 'poly2'."
+        assert errors[4] == "Polynomials must be strings."
+        assert errors[5].startswith("Lines must be at most")
+        assert errors[6] == "Division by zero is not allowed in Galois fields"
+        assert results[-1] == 0x5E
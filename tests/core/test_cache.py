@@ -0,0 +1,115 @@
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import ResultCache, cached_run, result_cache
+
+
+class TestKey:
+    def test_key_layout(self) -> None:
+        assert ResultCache.key("multiplication", 8, 0x11D, (0xA1, 0xFF)) == (
+            "multiplication",
+            8,
+            0x11D,
+            (0xA1, 0xFF),
+        )
+
+    def test_params_are_part_of_key(self) -> None:
+        assert ResultCache.key("power", 8, 0x11D, (0xA1,), 3) != ResultCache.key(
+            "power", 8, 0x11D, (0xA1,), 4
+        )
+
+
+class TestResultCache:
+    def test_hit_and_miss(self, cache: ResultCache) -> None:
+        assert cache.get(("a",)) == (False, None)
+        cache.put(("a",), 1)
+        assert cache.get(("a",)) == (True, 1)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_entries_expire(
+        self, cache: ResultCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache.put(("a",), 1)
+        now = cache_module.time.monotonic()
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 61)
+        assert cache.get(("a",)) == (False, None)
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["bytes"] == 0
+
+    def test_least_recently_used_is_evicted(self, cache: ResultCache) -> None:
+        for i in range(64):
+            cache.put(("key", i), i)
+            cache.get(("key", 0))
+        stats = cache.stats()
+        assert 0 < stats["bytes"] <= cache.max_bytes
+        assert stats["evictions"] == 64 - stats["entries"]
+        assert cache.get(("key", 0)) == (True, 0)
+        assert cache.get(("key", 1)) == (False, None)
+
+    def test_oversize_entry_is_skipped(self, cache: ResultCache) -> None:
+        cache.put(("big",), "x" * cache.max_bytes)
+        assert cache.stats()["entries"] == 0
+
+    def test_clear(self, cache: ResultCache) -> None:
+        cache.put(("a",), 1)
+        cache.get(("a",))
+        cache.clear()
+        stats = cache.stats()
+        assert (stats["entries"], stats["bytes"], stats["hits"]) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+class TestCachedRun:
+    async def test_results_are_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(result_cache, "enabled", True)
+        result_cache.clear()
+        calls: list[int] = []
+
+        def double(x: int) -> int:
+            calls.append(x)
+            return 2 * x
+
+        results = [
+            await cached_run(False, "double", 8, None, (21,), double, 21),
+            await cached_run(False, "double", 8, None, (21,), double, 21),
+            await cached_run(True, "double", 8, None, (21,), double, 21),
+        ]
+        stats = result_cache.stats()
+        result_cache.clear()
+
+        assert results == [42, 42, 42]
+        assert len(calls) == 2
+        assert (stats["hits"], stats["misses"], stats["bypassed"]) == (1, 1, 1)
+
+    async def test_disabled_cache_is_not_consulted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        result_cache.clear()
+        keys: list[str] = []
+
+        def key(*args: object) -> tuple[str]:
+            keys.append("built")
+            return ("double",)
+
+        monkeypatch.setattr(result_cache, "key", key)
+        assert await cached_run(False, "double", 8, None, (2,), abs, -2) == 2
+        assert keys == []
+        assert result_cache.stats()["entries"] == 0
+
+    async def test_params_are_part_of_the_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(result_cache, "enabled", True)
+        result_cache.clear()
+
+        results = [
+            await cached_run(False, "pow", 8, None, (2,), pow, 2, 3, params=(3,)),
+            await cached_run(False, "pow", 8, None, (2,), pow, 2, 5, params=(5,)),
+        ]
+        stats = result_cache.stats()
+        result_cache.clear()
+
+        assert results == [8, 32]
+        assert (stats["hits"], stats["misses"]) == (0, 2)
@@ -0,0 +1,88 @@
+import pytest
+
+from src.core.codec import Element, bounds, encode, parse
+
+
+class TestBounds:
+    def test_bounds_are_cached(self) -> None:
+        assert bounds(163) is bounds(163)
+        assert bounds(8).order == 256
+
+    def test_check(self) -> None:
+        assert bounds(8).check(255) == 255
+        with pytest.raises(
+            ValueError,
+            match="GF\\(2\\^8\\) scalars must be in `0 <= x < 256`, not 256.",
+        ):
+            bounds(8).check(256)
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "poly, input_type",
+        [
+            ("a1", "hexadecimal"),
+            ("0A1", "hexadecimal"),
+            ("10100001", "binary"),
+            (0xA1, None),
+            (b"\xa1", None),
+            (b"\x00\xa1", None),
+        ],
+    )
+    def test_every_spelling_parses_to_the_same_element(
+        self, poly: str | int | bytes, input_type: str | None
+    ) -> None:
+        assert parse(poly, input_type, 8) == Element(0xA1, 8)
+
+    def test_element_is_returned_unchanged(self) -> None:
+        element = Element(0xA1, 8)
+        assert parse(element, "binary", 8) is element
+
+    def test_element_is_revalidated_for_another_field(self) -> None:
+        assert parse(Element(0xA1, 8), None, 163) == Element(0xA1, 163)
+        with pytest.raises(ValueError, match="GF\\(2\\^4\\) scalars"):
+            parse(Element(0xA1, 8), None, 4)
+
+    def test_invalid_input_type(self) -> None:
+        with pytest.raises(ValueError, match="Invalid input type"):
+            parse("a1", "octal", 8)
+
+    def test_invalid_literal(self) -> None:
+        with pytest.raises(
+            ValueError, match="invalid literal for int\\(\\) with base 2"
+        ):
+            parse("10101112", "binary", 8)
+
+    @pytest.mark.parametrize("poly", ["FF1", -1, b"\x01\x00"])
+    def test_outside_field(self, poly: str | int | bytes) -> None:
+        with pytest.raises(ValueError, match="GF\\(2\\^8\\) scalars must be in"):
+            parse(poly, "hexadecimal", 8)
+
+
+class TestEncode:
+    @pytest.mark.parametrize(
+        "m, output_type, expected",
+        [
+            (8, "hexadecimal", "0b"),
+            (8, "binary", "00001011"),
+            (8, "base64", "Cw=="),
+            (163, "hexadecimal", "0" * 40 + "b"),
+            (163, "binary", "0" * 159 + "1011"),
+            (571, "hexadecimal", "0" * 142 + "b"),
+        ],
+    )
+    def test_widths(self, m: int, output_type: str, expected: str) -> None:
+        assert encode(0xB, output_type, m) == expected
+
+    @pytest.mark.parametrize("m", [1, 4, 8, 163, 233, 571])
+    def test_round_trip(self, m: int) -> None:
+        value = (1 << m) - 1
+        field = bounds(m)
+        assert len(field.to_hex(value)) == field.hex_width
+        assert parse(field.to_hex(value), "hexadecimal", m).value == value
+        assert parse(field.to_binary(value), "binary", m).value == value
+        assert parse(field.to_bytes(value), None, m).value == value
+
+    def test_invalid_output_type(self) -> None:
+        with pytest.raises(ValueError, match="Invalid output type"):
+            encode(1, "octal", 8)
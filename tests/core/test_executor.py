@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.executor import ExecutorBusyError, OperationExecutor
+from src.core.warmup import warmup
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+def warmed_up() -> bool:
+    return warmup.ready
+
+
+@pytest.mark.asyncio
+class TestOperationExecutor:
+    async def test_light_operation_runs_inline(
+        self, thread_executor: OperationExecutor
+    ) -> None:
+        name = await thread_executor.run("inverse", 8, current_thread_name)
+        assert name == threading.current_thread().name
+        assert thread_executor.stats()["inline"] == 1
+
+    async def test_heavy_operation_is_offloaded(
+        self, thread_executor: OperationExecutor
+    ) -> None:
+        name = await thread_executor.run("inverse", 163, current_thread_name)
+        stats = thread_executor.stats()
+        assert name.startswith("field-worker")
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["wait_time"] >= 0
+        thread_executor.shutdown()
+
+    async def test_exceptions_propagate(
+        self, thread_executor: OperationExecutor
+    ) -> None:
+        with pytest.raises(ValueError):
+            await thread_executor.run("inverse", 163, int, "not a number")
+        thread_executor.shutdown()
+
+    async def test_full_queue_rejects(self) -> None:
+        release = threading.Event()
+        executor = OperationExecutor(
+            mode="thread", max_workers=1, max_queue=1, heavy_operations={"inverse": 0}
+        )
+        blocked = asyncio.ensure_future(executor.run("inverse", 8, release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorBusyError):
+            await executor.run("inverse", 8, release.wait)
+        release.set()
+        assert await blocked
+        assert executor.stats()["rejected"] == 1
+        executor.shutdown()
+
+    async def test_process_mode(self) -> None:
+        executor = OperationExecutor(
+            mode="process",
+            max_workers=1,
+            heavy_operations={"inverse": 0},
+            initializer=None,
+        )
+        assert await executor.run("inverse", 8, pow, 3, 4) == 81
+        assert not await executor.run("inverse", 8, warmed_up)
+        executor.shutdown()
+
+    async def test_process_workers_are_warmed_up(self) -> None:
+        executor = OperationExecutor(
+            mode="process", max_workers=1, heavy_operations={"inverse": 0}
+        )
+        assert await executor.run("inverse", 8, warmed_up)
+        executor.shutdown()
+
+    async def test_stateful_operations_stay_in_process(self) -> None:
+        executor = OperationExecutor(
+            mode="process", max_workers=1, heavy_operations={"session": 0}
+        )
+        registers: list[int] = []
+        await executor.run("session", 8, registers.append, 1, stateful=True)
+        name = await executor.run("session", 8, current_thread_name, stateful=True)
+        executor.shutdown()
+
+        assert registers == [1]
+        assert name.startswith("field-worker")
+
+    async def test_inline_mode_never_offloads(self) -> None:
+        executor = OperationExecutor(mode="inline", heavy_operations={"inverse": 0})
+        assert not executor.should_offload("inverse", 571)
+
+
+def test_invalid_mode() -> None:
+    with pytest.raises(ValueError):
+        OperationExecutor(mode="fibers")
@@ -0,0 +1,91 @@
+import pytest
+
+from src.config import Config
+from src.core.expression import Instruction, compile_expression
+from src.core.fields.native import NativeField
+
+
+class TestCompileExpression:
+    def test_programs_are_cached(self) -> None:
+        assert compile_expression("a * b + c") is compile_expression("a * b + c")
+
+    def test_common_subexpressions_are_shared(self) -> None:
+        program = compile_expression("a * b + b * a")
+        assert program.variables == ("a", "b")
+        assert program.instructions == (
+            Instruction("mul", (0, 1)),
+            Instruction("add", (2, 2)),
+        )
+
+    def test_divisions_are_rewritten_as_inversions(self) -> None:
+        program = compile_expression("(a * b + c) / d + e / f")
+        assert [instruction.op for instruction in program.instructions].count(
+            "inv"
+        ) == 2
+        assert program.inversions == 1
+
+    def test_dependent_inversions_use_separate_stages(self) -> None:
+        program = compile_expression("x = 1 / a; 1 / (x + b)")
+        assert program.constants == (1,)
+        assert program.inversions == 2
+
+    def test_rewrites(self) -> None:
+        assert compile_expression("a - b").instructions == (Instruction("add", (0, 1)),)
+        assert compile_expression("a * a").instructions == (Instruction("sqr", (0,)),)
+        assert compile_expression("a ** 2").instructions == (Instruction("sqr", (0,)),)
+        assert compile_expression("a ** -3").instructions == (
+            Instruction("inv", (0,)),
+            Instruction("pow", (1,), 3),
+        )
+        program = compile_expression("(a ** -1) ** -1")
+        assert program.output == 0
+
+    def test_assignments(self) -> None:
+        program = compile_expression("t = a * b\nt * t + t")
+        assert program.variables == ("a", "b")
+        assert len(program.instructions) == 3
+
+    @pytest.mark.parametrize(
+        "expression, message",
+        [
+            ("a +", "Invalid expression"),
+            ("f(a)", "Unsupported syntax 'f\\(a\\)'"),
+            ("a ** b", "Exponents must be integer literals."),
+            ("1.5 * a", "Constants must be integer literals"),
+            ("a = b", "Expressions must end with the value to compute."),
+            ("a[0] = b; a", "Only assignments to a single name"),
+        ],
+    )
+    def test_invalid_expressions(self, expression: str, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            compile_expression(expression)
+
+    def test_limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Config.EXPRESSIONS, "MAX_LENGTH", 8)
+        with pytest.raises(ValueError, match="at most 8 characters"):
+            compile_expression("a * b + c * d")
+        monkeypatch.setattr(Config.EXPRESSIONS, "MAX_LENGTH", 4096)
+        monkeypatch.setattr(Config.EXPRESSIONS, "MAX_OPERATIONS", 2)
+        with pytest.raises(ValueError, match="at most 2 operations"):
+            compile_expression("a * b + c * d")
+
+
+class TestProgram:
+    def test_run(self) -> None:
+        field = NativeField(8, 0x11D)
+        program = compile_expression("(a * b + c) / d")
+        results = program.run(field, [[0xA1, 0xFF, 0, 0xFF], [0xA1, 0xFF, 0, 0]])
+        assert results[0] == 0xA1
+        assert str(results[1]) == "Division by zero is not allowed in Galois fields"
+
+    def test_errors_stay_per_binding(self) -> None:
+        field = NativeField(8, 0x11D)
+        program = compile_expression("a % b + 1 / c")
+        results = program.run(field, [[0xA1, 0, 1], [0xA1, 3, 0], [0xA1, 3, 1]])
+        assert str(results[0]) == "Modulo by zero is not allowed!"
+        assert str(results[1]) == "Division by zero is not allowed in Galois fields"
+        assert results[2] == 0
+
+    def test_constants_are_checked(self) -> None:
+        with pytest.raises(ValueError, match="scalars must be in"):
+            compile_expression("a + 0x100").run(NativeField(8, 0x11D), [[1]])
@@ -0,0 +1,113 @@
+import pytest
+
+from src.core.session import FieldSession
+
+
+class TestFieldSession:
+    def test_invalid_parameters(self) -> None:
+        with pytest.raises(ValueError, match="Invalid input type"):
+            FieldSession(8, 0x11D, "decimal")
+        with pytest.raises(ValueError, match="Invalid output type"):
+            FieldSession(8, 0x11D, "hexadecimal", "decimal")
+        with pytest.raises(ValueError, match="The modulus must have degree 8."):
+            FieldSession(8, 0x25)
+
+    @pytest.mark.parametrize(
+        "op, args, expected",
+        [
+            ("add", ["a1", "ff"], 0x5E),
+            ("sub", ["a1", "ff"], 0x5E),
+            ("mul", ["a1", "ff"], 0x48),
+            ("div", ["a1", "ff"], 0x33),
+            ("sqr", ["a1"], 0xF7),
+            ("pow", ["a1", 2], 0xF7),
+            ("mod", ["a1", "3"], 0x1),
+            ("set", ["a1"], 0xA1),
+        ],
+    )
+    def test_operations(
+        self, field_session: FieldSession, op: str, args: list, expected: int
+    ) -> None:
+        assert field_session.execute(op, args) == expected
+
+    def test_inverse(self, field_session: FieldSession) -> None:
+        inverse = field_session.execute("inv", ["a1"])
+        assert field_session.field.mul(inverse, 0xA1) == 1
+
+    def test_registers_chain_operations(self, field_session: FieldSession) -> None:
+        field_session.execute("set", ["a1"], to="x")
+        field_session.execute("mul", ["$x", "ff"], to="y")
+        assert field_session.registers == {"x": 0xA1, "y": 0x48}
+        assert field_session.execute("div", ["$y", "ff"]) == 0xA1
+
+    def test_unknown_register(self, field_session: FieldSession) -> None:
+        with pytest.raises(ValueError, match="Unknown register 'x'."):
+            field_session.execute("sqr", ["$x"])
+
+    def test_register_limit(self, field_session: FieldSession) -> None:
+        for name in "abcd":
+            field_session.execute("set", ["1"], to=name)
+        field_session.execute("set", ["2"], to="a")
+        with pytest.raises(ValueError, match="at most 4 registers"):
+            field_session.execute("set", ["1"], to="e")
+        field_session.drop(["a", "missing"])
+        field_session.execute("set", ["1"], to="e")
+
+    @pytest.mark.parametrize(
+        "op, args, message",
+        [
+            ("cube", ["a1"], "Invalid operation"),
+            ("mul", ["a1"], "'mul' takes 2 operand"),
+            ("div", ["a1", "0"], "Division by zero"),
+            ("mod", ["a1", "0"], "Modulo by zero"),
+            ("inv", ["0"], "not possible for zero"),
+            ("pow", ["a1", "2"], "The exponent must be an integer."),
+            ("sqr", [161], "Operands must be strings."),
+            ("sqr", ["1ff"], "scalars must be in"),
+        ],
+    )
+    def test_invalid_operations(
+        self, field_session: FieldSession, op: str, args: list, message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            field_session.execute(op, args)
+
+
+class TestHandle:
+    def test_result_is_returned_unless_stored(
+        self, field_session: FieldSession
+    ) -> None:
+        assert field_session.handle({"id": 1, "op": "mul", "args": ["a1", "ff"]}) == {
+            "id": 1,
+            "result": "48",
+        }
+        assert field_session.handle(
+            {"id": 2, "op": "mul", "args": ["a1", "ff"], "to": "x"}
+        ) == {"id": 2}
+        assert field_session.handle(
+            {"id": 3, "op": "sqr", "args": ["$x"], "to": "x", "ret": True}
+        ) == {"id": 3, "result": "eb"}
+
+    def test_delete(self, field_session: FieldSession) -> None:
+        field_session.execute("set", ["a1"], to="x")
+        assert field_session.handle({"id": 1, "op": "del", "args": ["x"]}) == {"id": 1}
+        assert field_session.registers == {}
+
+    @pytest.mark.parametrize(
+        "frame, error",
+        [
+            ({"id": 1, "args": ["a1"]}, "Missing field 'op'."),
+            ({"id": 1, "op": "sqr", "args": "a1"}, "The operands must be a list."),
+            ({"id": 1, "op": "sqr", "args": ["zz"]}, "invalid literal"),
+        ],
+    )
+    def test_errors(self, field_session: FieldSession, frame: dict, error: str) -> None:
+        reply = field_session.handle(frame)
+        assert reply["id"] == 1
+        assert error in reply["error"]
+
+    def test_non_object_frame(self, field_session: FieldSession) -> None:
+        assert field_session.handle(["mul"]) == {
+            "id": None,
+            "error": "Every operation must be a JSON object.",
+        }
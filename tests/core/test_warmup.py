@@ -0,0 +1,109 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.config import Config
+from src.core.fields.registry import FieldRegistry
+from src.core.warmup import Warmup, compiled_kernels, configured_backends, heavy_modules
+
+
+class TestHeavyModules:
+    def test_native_backend_needs_the_kernels(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "native")
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {})
+        assert configured_backends() == {"native"}
+        assert heavy_modules() == ("src.core.fields.kernels",)
+
+    def test_galois_only_when_needed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "native")
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {})
+        monkeypatch.setattr(Config.FIELDS, "INVERSION", "galois")
+        assert heavy_modules() == ("galois", "src.core.fields.kernels")
+        monkeypatch.setattr(Config.FIELDS, "INVERSION", "eea")
+        # galois picks the default modulus of degrees without a standard one
+        monkeypatch.setattr(Config.FIELDS, "PRELOAD", [8, 12])
+        assert heavy_modules() == ("galois", "src.core.fields.kernels")
+
+    def test_galois_backend_skips_the_kernels(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", "galois")
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {})
+        assert heavy_modules() == ("galois",)
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {163: "native"})
+        assert heavy_modules() == ("galois", "src.core.fields.kernels")
+
+    def test_native_warmup_skips_galois(self) -> None:
+        code = (
+            "import sys; from src.core.warmup import warmup; warmup.run(); "
+            "print('galois' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_importing_the_app_skips_heavy_modules(self) -> None:
+        code = (
+            "import sys, src.main; "
+            "print(sorted({'galois', 'numba', 'numpy'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestWarmup:
+    @pytest.mark.parametrize(
+        "backend, galois_fields", [("native", []), ("galois", [8])]
+    )
+    def test_run(
+        self,
+        registry: FieldRegistry,
+        backend: str,
+        galois_fields: list[int],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "PRELOAD", [8])
+        monkeypatch.setattr(Config.FIELDS, "BACKEND", backend)
+        monkeypatch.setattr(Config.FIELDS, "BACKEND_OVERRIDES", {})
+        warmup = Warmup()
+        assert not warmup.ready
+
+        warmup.run(registry)
+
+        assert warmup.ready
+        assert {"preload fields", "operations GF(2^8)", "total"} <= (
+            warmup.timings.keys()
+        )
+        assert ("import galois" in warmup.timings) == bool(galois_fields)
+        stats = registry.stats()
+        assert [field["m"] for field in stats["fields"]] == galois_fields
+        assert stats["native_size"] == (backend == "native")
+
+    def test_operations_can_be_skipped(
+        self, registry: FieldRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Config.FIELDS, "PRELOAD", [8])
+        monkeypatch.setattr(Config.FIELDS, "WARMUP", False)
+        warmup = Warmup()
+
+        warmup.run(registry)
+
+        assert warmup.ready
+        assert "operations GF(2^8)" not in warmup.timings
+
+
+def test_compiled_kernels_without_loading_them() -> None:
+    code = (
+        "import sys; from src.core.warmup import compiled_kernels; "
+        "print(compiled_kernels(), 'src.core.fields.kernels' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "{} False"
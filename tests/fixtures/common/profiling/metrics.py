@@ -0,0 +1,11 @@
+import pytest
+
+from src.common.profiling import MetricsRegistry
+
+
+@pytest.fixture
+def metrics_registry() -> MetricsRegistry:
+    """
+    Fixture for an empty, enabled metrics registry.
+    """
+    return MetricsRegistry(enabled=True)
@@ -0,0 +1,11 @@
+import pytest
+
+from src.core.cache import ResultCache
+
+
+@pytest.fixture
+def cache() -> ResultCache:
+    """
+    Fixture for an enabled result cache with a small memory budget.
+    """
+    return ResultCache(enabled=True, max_bytes=4096, ttl=60.0)
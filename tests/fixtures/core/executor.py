@@ -0,0 +1,13 @@
+import pytest
+
+from src.core.executor import OperationExecutor
+
+
+@pytest.fixture
+def thread_executor() -> OperationExecutor:
+    """
+    Fixture for a thread-pool executor that offloads inversions from m=163.
+    """
+    return OperationExecutor(
+        mode="thread", max_workers=2, max_queue=4, heavy_operations={"inverse": 163}
+    )
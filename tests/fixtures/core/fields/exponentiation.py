@@ -0,0 +1,11 @@
+import pytest
+
+from src.core.fields.exponentiation import FixedBaseRegistry
+
+
+@pytest.fixture
+def base_registry() -> FixedBaseRegistry:
+    """
+    Fixture for an empty fixed-base registry holding at most two bases.
+    """
+    return FixedBaseRegistry(max_size=2)
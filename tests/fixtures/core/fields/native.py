@@ -0,0 +1,14 @@
+import random
+
+import pytest
+
+from src.config import Config
+
+
+@pytest.fixture
+def random_elements() -> list[int]:
+    """
+    Fixture for reproducible random 571-bit integers, truncated per field by the tests.
+    """
+    rng = random.Random(Config.Testing.RANDOM.SEED)
+    return [rng.getrandbits(571) for _ in range(20)]
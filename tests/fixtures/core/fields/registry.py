@@ -0,0 +1,11 @@
+import pytest
+
+from src.core.fields.registry import FieldRegistry
+
+
+@pytest.fixture
+def registry() -> FieldRegistry:
+    """
+    Fixture for an empty field registry holding at most two ad-hoc fields.
+    """
+    return FieldRegistry(max_size=2)
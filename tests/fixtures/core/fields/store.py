@@ -0,0 +1,20 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.core.fields.store import TableStore, table_store
+
+
+@pytest.fixture
+def shared_tables(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[TableStore]:
+    """
+    Fixture for the process-wide table store, enabled in a temporary directory.
+    """
+    monkeypatch.setattr(table_store, "directory", str(tmp_path))
+    monkeypatch.setattr(table_store, "enabled", True)
+    table_store.clear()
+    yield table_store
+    table_store.clear()
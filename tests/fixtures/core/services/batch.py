@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture
+def valid_batch_input() -> dict[str, list[str] | str]:
+    """
+    Fixture for a batch of hexadecimal operand pairs in GF(2^8), including a
+    pair outside the field and a zero divisor.
+    """
+    return {
+        "poly1": ["A1", "AA", "FF1", "03"],
+        "poly2": ["FF", "CC", "FF", "00"],
+        "input_type": "hexadecimal",
+    }
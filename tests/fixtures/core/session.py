@@ -0,0 +1,12 @@
+import pytest
+
+from src.core.fields import AES_MODULUS
+from src.core.session import FieldSession
+
+
+@pytest.fixture
+def field_session() -> FieldSession:
+    """
+    Fixture for a session over GF(2^8) with the AES modulus and four registers.
+    """
+    return FieldSession(8, AES_MODULUS, "hexadecimal", "hexadecimal", max_registers=4)
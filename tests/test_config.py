@@ -15,6 +15,104 @@ def test_description(self) -> None:
         def test_version(self) -> None:
             assert Config.APP.VERSION == "0.1.0"
 
+    class TestFields:
+        def test_preload(self) -> None:
+            assert Config.FIELDS.PRELOAD == [163, 233, 283, 409, 571]
+
+        def test_warmup(self) -> None:
+            assert Config.FIELDS.WARMUP is True
+
+        def test_max_cached(self) -> None:
+            assert Config.FIELDS.MAX_CACHED == 32
+
+        def test_backend(self) -> None:
+            assert Config.FIELDS.BACKEND == "native"
+            assert Config.FIELDS.BACKEND_OVERRIDES == {}
+
+        def test_inversion(self) -> None:
+            assert Config.FIELDS.INVERSION == "eea"
+
+        def test_kernel_min_batch(self) -> None:
+            assert Config.FIELDS.KERNEL_MIN_BATCH == 64
+
+        def test_square_tables(self) -> None:
+            assert Config.FIELDS.SQUARE_TABLE_MIN_K == 8
+            assert Config.FIELDS.SQUARE_TABLES == 16
+
+        def test_fixed_bases(self) -> None:
+            assert Config.FIELDS.FIXED_BASE_WINDOW == 4
+            assert Config.FIELDS.FIXED_BASES == 64
+
+        def test_table_max_m(self) -> None:
+            assert Config.FIELDS.TABLE_MAX_M == 16
+
+        def test_max_moduli(self) -> None:
+            assert Config.FIELDS.MAX_MODULI == 256
+
+    class TestTables:
+        def test_disabled_by_default(self) -> None:
+            assert Config.TABLES.ENABLED is False
+
+        def test_location(self) -> None:
+            assert Config.TABLES.DIRECTORY == ".tables"
+            assert Config.TABLES.VERSION == 2
+
+        def test_max_mapped(self) -> None:
+            assert Config.TABLES.MAX_MAPPED == 256
+
+    class TestExecutor:
+        def test_mode(self) -> None:
+            assert Config.EXECUTOR.MODE == "thread"
+
+        def test_limits(self) -> None:
+            assert Config.EXECUTOR.MAX_WORKERS >= 1
+            assert Config.EXECUTOR.MAX_QUEUE == 64
+
+        def test_heavy_operations(self) -> None:
+            assert Config.EXECUTOR.HEAVY_OPERATIONS["inverse"] == 163
+            assert "addition" not in Config.EXECUTOR.HEAVY_OPERATIONS
+
+    class TestCache:
+        def test_disabled_by_default(self) -> None:
+            assert Config.CACHE.ENABLED is False
+
+        def test_limits(self) -> None:
+            assert Config.CACHE.MAX_BYTES == 64 * 1024 * 1024
+            assert Config.CACHE.TTL == 300.0
+
+    class TestStream:
+        def test_limits(self) -> None:
+            assert Config.STREAM.CHUNK_SIZE == 1024
+            assert Config.STREAM.MAX_LINE_BYTES == 64 * 1024
+            assert Config.STREAM.RETRY_DELAY > 0
+
+        def test_stream_is_offloaded(self) -> None:
+            assert Config.EXECUTOR.HEAVY_OPERATIONS["stream"] == 0
+
+    class TestSession:
+        def test_limits(self) -> None:
+            assert Config.SESSION.MAX_REGISTERS == 256
+            assert Config.SESSION.MAX_FRAME_OPERATIONS == 1024
+
+    class TestExpressions:
+        def test_limits(self) -> None:
+            assert Config.EXPRESSIONS.MAX_LENGTH == 4096
+            assert Config.EXPRESSIONS.MAX_OPERATIONS == 1024
+            assert Config.EXPRESSIONS.MAX_CACHED == 256
+            assert Config.EXPRESSIONS.MAX_BINDINGS == 10000
+
+        def test_evaluate_is_offloaded(self) -> None:
+            assert Config.EXECUTOR.HEAVY_OPERATIONS["evaluate"] == 0
+
+    class TestMetrics:
+        def test_metrics(self) -> None:
+            assert Config.METRICS.ENABLED is True
+            assert list(Config.METRICS.BUCKETS) == sorted(Config.METRICS.BUCKETS)
+
+        def test_profiling_is_off_by_default(self) -> None:
+            assert Config.METRICS.PROFILE_SLOW_SECONDS is None
+            assert 0 <= Config.METRICS.PROFILE_SAMPLE_RATE <= 1
+
     class TestTesting:
         class TestRandom:
             def test_seed(self) -> None:
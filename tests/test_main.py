@@ -1,6 +1,10 @@
+import threading
+
+import pytest
 from fastapi.testclient import TestClient
 
 from src.config import Config
+from src.core.warmup import Warmup
 from src.main import app
 
 client = TestClient(app)
@@ -16,3 +20,25 @@ def test_app_successful(self) -> None:
         assert app.title == Config.APP.TITLE
         assert app.description == Config.APP.DESCRIPTION
         assert app.version == Config.APP.VERSION
+
+
+def test_ready_only_after_background_warmup(monkeypatch: pytest.MonkeyPatch) -> None:
+    warmup = Warmup()
+    release = threading.Event()
+
+    def run() -> None:
+        release.wait(5)
+        warmup.ready = True
+
+    monkeypatch.setattr(warmup, "run", run)
+    monkeypatch.setattr("src.main.warmup", warmup)
+    monkeypatch.setattr("src.controller.status.warmup", warmup)
+    with TestClient(app) as started:
+        response = started.get("/status/ready")
+        assert response.status_code == 503
+        assert response.json()["message"] == "Worker is warming up"
+        release.set()
+    # Shutdown waits for the warm-up
+    assert warmup.ready
+    with TestClient(app) as started:
+        assert started.get("/status/ready").status_code == 200